@@ -0,0 +1,83 @@
+"""
+Benchmark for the vertex buffers of `windforge.gl.buffer`.
+
+1. Packing: interleaving position, normal and color of 100k vertices
+   into one buffer with a Python loop into a flat list (what PyOpenGL
+   then has to convert element by element) vs. `interleave` (one
+   structured NumPy array, passed to the driver without copy).
+2. Streaming: a buffer whose content changes every frame (and grows
+   now and then), uploaded with a new `glBufferData` per frame vs. a
+   `VertexBuffer` which reuses its storage (`glBufferSubData`).
+   Counted with the `RecordingGL` stub, no GPU needed.
+
+Run from the `src` folder:
+    python benchmarks/bench_buffer.py
+"""
+
+import sys
+import timeit
+
+import numpy as np
+
+sys.path += ["."]
+
+from windforge.gl.buffer import interleave, VertexBuffer
+from windforge.gl.stub import RecordingGL
+
+
+
+N_VERTICES = 100_000
+N_FRAMES = 600
+REPEATS = 3
+
+
+
+def pack_list(positions, normals, colors):
+    data = []
+    for position, normal, color in zip(positions.tolist(), normals.tolist(), colors.tolist()):
+        data += position
+        data += normal
+        data += color
+    return data
+
+def stream_sizes():
+    # particle count per frame: slowly growing with noise
+    rng = np.random.default_rng(1)
+    return (1_000 + np.arange(N_FRAMES) * 5 + rng.integers(0, 200, N_FRAMES)).tolist()
+
+def main():
+    rng = np.random.default_rng(0)
+    positions = rng.random((N_VERTICES, 3), dtype=np.float32)
+    normals = rng.random((N_VERTICES, 3), dtype=np.float32)
+    colors = rng.random((N_VERTICES, 4), dtype=np.float32)
+
+    list_seconds = min(timeit.repeat(lambda: pack_list(positions, normals, colors), number=1, repeat=REPEATS))
+    numpy_seconds = min(timeit.repeat(lambda: interleave(position=positions, normal=normals, color=colors),
+                                      number=1, repeat=REPEATS))
+    print(f"Packing {N_VERTICES} vertices (position, normal, color):")
+    print(f"  Python list  {list_seconds*1000:8.2f} ms")
+    print(f"  interleave   {numpy_seconds*1000:8.2f} ms   ({list_seconds/numpy_seconds:.0f}x)\n")
+
+    sizes = stream_sizes()
+    particles = rng.random((max(sizes), 4), dtype=np.float32)
+
+    naive_gl = RecordingGL()
+    vbo_id = naive_gl.glGenBuffers(1)
+    for size in sizes:
+        naive_gl.glBindBuffer(naive_gl.GL_ARRAY_BUFFER, vbo_id)
+        naive_gl.glBufferData(naive_gl.GL_ARRAY_BUFFER, particles[:size].nbytes, particles[:size], naive_gl.GL_DYNAMIC_DRAW)
+
+    buffer_gl = RecordingGL()
+    vbo = VertexBuffer(gl=buffer_gl)
+    for size in sizes:
+        vbo.upload(particles[:size])
+
+    print(f"Streaming {N_FRAMES} frames of {min(sizes)}..{max(sizes)} particles:")
+    print(f"  glBufferData per frame  storage allocations {naive_gl.count('glBufferData'):>4}")
+    print(f"  VertexBuffer            storage allocations {vbo.allocations:>4}   "
+          f"glBufferSubData {buffer_gl.count('glBufferSubData')}")
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Jitter benchmark for the frame pacing of `Clock.tick`.
+
+Runs a simulated frame loop (a short busy "work" phase per frame) with
+the sleep based pacing and with the precise deadline based pacing and
+reports how far the frames deviate from their ideal end time
+`start + n / goal_fps` (missed deadlines, overshoot histogram, drift).
+Needs no window.
+
+Run from the `src` folder:
+    python benchmarks/bench_clock.py
+"""
+
+import sys
+import time
+
+sys.path += ["."]
+
+from windforge.time import Clock, OVERSHOOT_BINS
+
+
+
+GOAL_FPS = [60, 144]
+N_FRAMES = 240
+WORK_SECONDS = 0.002
+
+
+
+def work():
+    end = time.perf_counter() + WORK_SECONDS
+    while time.perf_counter() < end:
+        pass
+
+def run(goal_fps, precise_pacing):
+    clock = Clock(goal_fps=goal_fps, precise_pacing=precise_pacing)
+    frame_duration = 1 / goal_fps
+    start = clock.start_time
+    # overshoot against the ideal (drift-free) frame ends, measured the same way for both modes
+    overshoots = []
+    for frame in range(1, N_FRAMES + 1):
+        work()
+        clock.tick()
+        overshoots += [time.perf_counter() - (start + frame * frame_duration)]
+    total_drift = overshoots[-1]
+    per_frame = [b - a for a, b in zip([0.0] + overshoots[:-1], overshoots)]
+    return clock, per_frame, total_drift
+
+def histogram(values):
+    counts = [0] * (len(OVERSHOOT_BINS) + 1)
+    for value in values:
+        index = 0
+        while index < len(OVERSHOOT_BINS) and value > OVERSHOOT_BINS[index]:
+            index += 1
+        counts[index] += 1
+    return counts
+
+def main():
+    labels = [f"<={bound*1000:g}ms" for bound in OVERSHOOT_BINS] + ["more"]
+    print(f"Frame pacing over {N_FRAMES} frames with {WORK_SECONDS*1000:g} ms work per frame:\n")
+    for goal_fps in GOAL_FPS:
+        for name, precise_pacing in [("sleep", False), ("precise", True)]:
+            clock, per_frame, total_drift = run(goal_fps, precise_pacing)
+            late = [value for value in per_frame if value > 0]
+            print(f"{goal_fps:>4} FPS {name:>8}: drift {total_drift*1000:9.3f} ms   "
+                  f"max frame error {max(per_frame)*1000:7.3f} ms   fps {clock.get_fps()}")
+            print(f"{'':>14}frame error histogram: " +
+                  "  ".join(f"{label} {count}" for label, count in zip(labels, histogram(late))))
+            frame_stats = clock.get_frame_stats()
+            print(f"{'':>14}frame times: p50 {frame_stats['p50']*1000:.3f} ms   p99 {frame_stats['p99']*1000:.3f} ms   "
+                  f"1% low {frame_stats['low_1_fps']:.1f} FPS   stutters {frame_stats['stutters']}")
+            if precise_pacing:
+                stats = clock.get_jitter_stats()
+                print(f"{'':>14}clock stats: missed {stats['missed_deadlines']}   "
+                      f"overshoot mean {stats['overshoot_mean']*1e6:.1f} us   max {stats['overshoot_max']*1e6:.1f} us")
+        print()
+
+
+
+if __name__ == "__main__":
+    main()
+
+
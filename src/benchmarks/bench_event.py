@@ -0,0 +1,138 @@
+"""
+Microbenchmark for the event representation.
+
+Compares the former dict-based `Event` (15 attributes per instance)
+with the compact `__slots__` event classes, per 10k events.
+
+Run from the `src` folder:
+    python benchmarks/bench_event.py
+"""
+
+import sys
+import gc
+import timeit
+import tracemalloc
+
+sys.path += ["."]
+
+import windforge as wf
+from windforge.window import EventType, Key, MouseButton, ControllerAxis, \
+                             KeyEvent, MouseEvent, ControllerAxisEvent
+
+
+
+N_EVENTS = 10_000
+REPEATS = 20
+
+
+
+class LegacyEvent(object):
+    """
+    Copy of the former `Event` class, kept as reference.
+    """
+    def __init__(self, event_type,
+                 key=None,
+                 mouse_pos=None,
+                 mouse_button=None,
+                 mouse_scroll=None,
+                 mouse_scroll_precise=None,
+                 controller_id=None,
+                 controller_button=None,
+                 controller_dpad=None,
+                 axis=None,
+                 axis_value=None,
+                 window_position=None,
+                 window_size=None,
+                 is_accessed=None,
+                 is_active=None):
+        self.type = event_type
+        self.key = key
+        self.mouse_position = mouse_pos
+        self.mouse_button = mouse_button
+        self.mouse_scroll = mouse_scroll
+        self.mouse_scroll_precise = mouse_scroll_precise
+        self.controller_id = controller_id
+        self.controller_button = controller_button
+        self.controller_dpad = controller_dpad
+        self.axis = axis
+        self.axis_value = axis_value
+        self.window_position = window_position
+        self.window_size = window_size
+        self.is_accessed = is_accessed
+        self.is_active = is_active
+
+
+
+def create_legacy():
+    # mix of a high-polling mouse, a gamepad and a few key presses
+    events = []
+    for i in range(N_EVENTS):
+        if i % 10 == 0:
+            events.append(LegacyEvent(EventType.KEY_DOWN, key=Key.A))
+        elif i % 2 == 0:
+            events.append(LegacyEvent(EventType.CONTROLLER_AXIS_MOVE, controller_id=0,
+                                      axis=ControllerAxis.LEFT_STICK_X, axis_value=0.5))
+        else:
+            events.append(LegacyEvent(EventType.MOUSE_MOVE, mouse_pos=(i, i)))
+    return events
+
+def create_compact():
+    events = []
+    for i in range(N_EVENTS):
+        if i % 10 == 0:
+            events.append(KeyEvent(EventType.KEY_DOWN, key=Key.A))
+        elif i % 2 == 0:
+            events.append(ControllerAxisEvent(EventType.CONTROLLER_AXIS_MOVE, controller_id=0,
+                                              axis=ControllerAxis.LEFT_STICK_X, axis_value=0.5))
+        else:
+            events.append(MouseEvent(EventType.MOUSE_MOVE, mouse_pos=(i, i)))
+    return events
+
+def create_compat():
+    # `Event(...)` factory path
+    events = []
+    for i in range(N_EVENTS):
+        if i % 10 == 0:
+            events.append(wf.window.Event(EventType.KEY_DOWN, key=Key.A))
+        elif i % 2 == 0:
+            events.append(wf.window.Event(EventType.CONTROLLER_AXIS_MOVE, controller_id=0,
+                                          axis=ControllerAxis.LEFT_STICK_X, axis_value=0.5))
+        else:
+            events.append(wf.window.Event(EventType.MOUSE_MOVE, mouse_pos=(i, i)))
+    return events
+
+def measure_memory(create_func):
+    gc.collect()
+    tracemalloc.start()
+    events = create_func()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # the (x, y) tuples are the same for both variants -> still included
+    del events
+    return current
+
+def measure_time(create_func):
+    return min(timeit.repeat(create_func, number=1, repeat=REPEATS))
+
+def main():
+    print(f"Event creation per {N_EVENTS} events (best of {REPEATS}):\n")
+    results = {}
+    for name, create_func in [("legacy", create_legacy),
+                              ("compact", create_compact),
+                              ("compat-factory", create_compat)]:
+        seconds = measure_time(create_func)
+        memory = measure_memory(create_func)
+        results[name] = (seconds, memory)
+        print(f"{name:>15}: {seconds*1000:8.3f} ms  {memory/1024:10.1f} KiB")
+
+    legacy_seconds, legacy_memory = results["legacy"]
+    compact_seconds, compact_memory = results["compact"]
+    print(f"\ncompact vs legacy: {legacy_seconds/compact_seconds:.2f}x faster, "
+          f"{legacy_memory/compact_memory:.2f}x less memory")
+
+
+
+if __name__ == "__main__":
+    main()
+
+
@@ -0,0 +1,98 @@
+"""
+Stress benchmark for the raw event queue of the `GlfwBackend`.
+
+Injects 10k synthetic GLFW callbacks (mostly cursor moves, as delivered
+by a high-DPI mouse within one poll) and measures the time to queue and
+drain them. Compares the former list + `pop(0)` queue with dict records
+to the deque with raw tuples. Needs no window.
+
+Run from the `src` folder:
+    python benchmarks/bench_glfw_queue.py
+"""
+
+import sys
+import timeit
+from collections import deque
+
+sys.path += ["."]
+
+from windforge.window import GlfwBackend, EventType, KeyEvent, MouseEvent, \
+                             GLFW_KEY_MAP, glfw
+
+
+
+N_CALLBACKS = 10_000
+REPEATS = 10
+
+
+
+class LegacyQueue(object):
+    """
+    Copy of the former callback queue of the `GlfwBackend`, kept as reference.
+    """
+    def __init__(self):
+        self._raw_event_queue = []
+
+    def _key_cb(self, window, key, scancode, action, mods):
+        self._raw_event_queue += [("key", {"key": key, "action": action, "mods": mods})]
+
+    def _cursor_pos_cb(self, window, xpos, ypos):
+        self._raw_event_queue += [("cursor_pos", {"pos": (int(xpos), int(ypos))})]
+
+    def _drain_raw_events(self, events):
+        while self._raw_event_queue:
+            ev_type, ev = self._raw_event_queue.pop(0)
+            if ev_type == "key":
+                k = ev["key"]
+                action = ev["action"]
+                if action == glfw.PRESS:
+                    if k in GLFW_KEY_MAP:
+                        events.append(KeyEvent(EventType.KEY_DOWN, key=GLFW_KEY_MAP[k]))
+                elif action == glfw.RELEASE:
+                    if k in GLFW_KEY_MAP:
+                        events.append(KeyEvent(EventType.KEY_UP, key=GLFW_KEY_MAP[k]))
+            elif ev_type == "cursor_pos":
+                events.append(MouseEvent(EventType.MOUSE_MOVE, mouse_pos=ev["pos"]))
+
+
+
+def create_backend():
+    # only the queue is needed -> skip window creation
+    backend = GlfwBackend.__new__(GlfwBackend)
+    backend.screen = None
+    backend._raw_event_queue = deque()
+    backend._cursor_pos = None
+    return backend
+
+def inject(backend):
+    for i in range(N_CALLBACKS):
+        if i % 100 == 0:
+            backend._key_cb(None, glfw.KEY_W, 0, glfw.PRESS if i % 200 == 0 else glfw.RELEASE, 0)
+        else:
+            backend._cursor_pos_cb(None, i * 0.5, i * 0.25)
+
+def measure(create_func):
+    inject_seconds = []
+    drain_seconds = []
+    for _ in range(REPEATS):
+        backend = create_func()
+        inject_seconds += [timeit.timeit(lambda: inject(backend), number=1)]
+        events = []
+        drain_seconds += [timeit.timeit(lambda: backend._drain_raw_events(events), number=1)]
+        assert len(events) == N_CALLBACKS
+    return min(inject_seconds), min(drain_seconds)
+
+def main():
+    print(f"GLFW raw event queue with {N_CALLBACKS} callbacks (best of {REPEATS}):\n")
+    legacy_inject, legacy_drain = measure(LegacyQueue)
+    inject_seconds, drain_seconds = measure(create_backend)
+    print(f"   legacy (list + pop(0)): inject {legacy_inject*1000:8.3f} ms   drain {legacy_drain*1000:8.3f} ms")
+    print(f"  deque (raw tuples)     : inject {inject_seconds*1000:8.3f} ms   drain {drain_seconds*1000:8.3f} ms")
+    print(f"\ndrain speedup: {legacy_drain/drain_seconds:.2f}x")
+
+
+
+if __name__ == "__main__":
+    main()
+
+
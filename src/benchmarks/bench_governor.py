@@ -0,0 +1,120 @@
+"""
+Benchmark of the adaptive frame rate (`FrameRateGovernor`).
+
+Runs a headless kiosk-like session with a simulated render load:
+input for a while, then nobody touches it, then the window loses the
+focus, and finally a single key press. Compares a fixed goal FPS with
+the governor: rendered frames, CPU time (process time) per phase and
+how fast the full rate is back after the key press. Also shows the
+back-off of an application whose frames take longer than the budget.
+Needs no window.
+
+Run from the `src` folder:
+    python benchmarks/bench_governor.py
+"""
+
+import sys
+import time
+
+sys.path += ["."]
+
+import windforge as wf
+from windforge.window import WindowLib, EventType, Key, KeyEvent, WindowEvent
+from windforge.time import FrameRateGovernor
+
+
+
+GOAL_FPS = 60
+RENDER_SECONDS = 0.004
+IDLE_TIMEOUT = 0.5
+# phase name, seconds
+PHASES = [("input", 1.0), ("no input", 2.0), ("unfocused", 1.0), ("key press", 0.25)]
+
+
+
+class KioskApplication(wf.GraphicsApplication):
+    def __init__(self, render_seconds=RENDER_SECONDS, **kwargs):
+        self.render_seconds = render_seconds
+        self.rendered = 0
+        super().__init__(**kwargs)
+
+    def process_input(self):
+        pass
+
+    def update(self, dt=None):
+        pass
+
+    def generate_output(self, alpha=None):
+        end = time.perf_counter() + self.render_seconds
+        while time.perf_counter() < end:
+            pass
+        self.rendered += 1
+        self.window.display()
+
+class Session(object):
+    """
+    Event source: the events of the current phase.
+    """
+    def __init__(self):
+        self.phase = None
+        self.pending = []
+
+    def __call__(self, frame):
+        events, self.pending = self.pending, []
+        if self.phase == "input":
+            events += [KeyEvent(EventType.KEY_DOWN if frame % 2 == 0 else EventType.KEY_UP, key=Key.A)]
+        return events
+
+def run(governor):
+    session = Session()
+    app = KioskApplication(background_lib=WindowLib.HEADLESS, goal_fps=GOAL_FPS, precise_pacing=True,
+                           event_source=session, governor=governor)
+    results = []
+    for name, seconds in PHASES:
+        session.phase = name
+        if name == "unfocused":
+            session.pending = [WindowEvent(EventType.WINDOW_ACTIVATION, is_active=False)]
+        elif name == "key press":
+            session.pending = [WindowEvent(EventType.WINDOW_ACTIVATION, is_active=True),
+                               KeyEvent(EventType.KEY_DOWN, key=Key.SPACE)]
+        rendered, cpu_start, start = app.rendered, time.process_time(), time.perf_counter()
+        full_rate_after = None
+        while time.perf_counter() - start < seconds:
+            app.run_frame()
+            if full_rate_after is None and app.clock.goal_fps == GOAL_FPS:
+                full_rate_after = time.perf_counter() - start
+        results += [(name, app.rendered - rendered, time.process_time() - cpu_start, full_rate_after)]
+    return results
+
+def run_backoff():
+    app = KioskApplication(render_seconds=1.3 / GOAL_FPS, background_lib=WindowLib.HEADLESS, goal_fps=GOAL_FPS,
+                           precise_pacing=True, event_source=lambda frame: [KeyEvent(EventType.KEY_DOWN, key=Key.A)],
+                           governor=FrameRateGovernor(idle_timeout=None))
+    for _ in range(90):
+        app.run_frame()
+    app.clock.frame_stats.reset()
+    for _ in range(60):
+        app.run_frame()
+    return app.clock.goal_fps, app.clock.get_frame_stats()
+
+def main():
+    print(f"Kiosk session at {GOAL_FPS} FPS with {RENDER_SECONDS*1000:g} ms render time per frame "
+          f"(idle timeout {IDLE_TIMEOUT} s):\n")
+    for name, governor in [("fixed goal_fps", None),
+                           ("governor", FrameRateGovernor(idle_timeout=IDLE_TIMEOUT))]:
+        print(name)
+        for phase, rendered, cpu, full_rate_after in run(governor):
+            line = f"  {phase:<10} rendered {rendered:>4} frames   cpu {cpu*1000:7.1f} ms"
+            if phase == "key press":
+                line += f"   full rate after {full_rate_after*1000:.1f} ms" if full_rate_after is not None else "   full rate not reached"
+            print(line)
+        print()
+
+    target_fps, stats = run_backoff()
+    print(f"Frames over budget (render {1.3/GOAL_FPS*1000:.1f} ms at {GOAL_FPS} FPS): governed to {target_fps:g} FPS, "
+          f"frame time p50 {stats['p50']*1000:.1f} ms  p99 {stats['p99']*1000:.1f} ms  std {stats['std']*1000:.2f} ms")
+
+
+
+if __name__ == "__main__":
+    main()
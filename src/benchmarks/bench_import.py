@@ -0,0 +1,68 @@
+"""
+Import-time benchmark for `windforge` (`python -X importtime`).
+
+Imports windforge in fresh interpreters and sums the cumulative import
+times of the top-level modules reported by `-X importtime`. Compares
+importing only `windforge.time`, the whole package (no backend library
+gets imported anymore) and the package plus both backend libraries,
+which is what every import cost before the backends got lazy.
+
+Run from the `src` folder:
+    python benchmarks/bench_import.py
+"""
+
+import re
+import sys
+import subprocess
+
+
+
+REPEATS = 7
+
+CASES = [
+    ("windforge.time", "import windforge.time"),
+    ("windforge", "import windforge"),
+    ("windforge + pygame + glfw (former eager import)",
+     "import windforge; from windforge.window import load_backend, WindowLib; "
+     "load_backend(WindowLib.PYGAME); load_backend(WindowLib.GLFW)"),
+]
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+
+def measure(statement):
+    """
+    Returns:
+        tuple[float, set[str]]: Import time in seconds and the imported top-level packages.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            capture_output=True, text=True, cwd=".", check=True)
+    total_us = 0
+    packages = set()
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, name = match.groups()
+        packages.add(name.split(".")[0])
+        # top-level imports of the statement (nested ones are part of their cumulative time)
+        if len(indent) == 1:
+            total_us += int(cumulative)
+    return total_us / 1e6, packages
+
+def main():
+    print(f"Import time (best of {REPEATS} fresh interpreters, python -X importtime):\n")
+    for name, statement in CASES:
+        runs = [measure(statement) for _ in range(REPEATS)]
+        seconds = min(seconds for seconds, _ in runs)
+        packages = runs[0][1]
+        backends = [backend for backend in ("pygame", "glfw", "OpenGL") if backend in packages] or ["none"]
+        print(f"  {name:<48} {seconds*1000:8.1f} ms   backend libraries: {', '.join(backends)}")
+
+
+
+if __name__ == "__main__":
+    main()
+
+
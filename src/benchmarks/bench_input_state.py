@@ -0,0 +1,170 @@
+"""
+Benchmark for `InputState.update`.
+
+Compares the former if/elif chain with the dispatch table on
+synthetic event streams (mouse-heavy and controller-heavy) and
+measures `get_all_active` with unchanged and changed state.
+
+Run from the `src` folder:
+    python benchmarks/bench_input_state.py
+"""
+
+import sys
+import timeit
+
+sys.path += ["."]
+
+from windforge.window import InputState, Controller, EventType, Key, MouseButton, \
+                             ControllerButton, ControllerAxis, \
+                             KeyEvent, MouseEvent, ControllerButtonEvent, ControllerAxisEvent
+
+
+
+N_EVENTS = 10_000
+REPEATS = 20
+N_CONTROLLERS = 4
+
+
+
+def legacy_update(self, events):
+    """
+    Copy of the former `InputState.update`, kept as reference.
+
+    The former keys/mouse button dicts live in `legacy_keys` and
+    `legacy_mouse_buttons` (set in `measure`).
+    """
+    new_events = []
+    for event in events:
+        # Keyboard
+        if event.type == EventType.KEY_DOWN:
+            self.legacy_keys[event.key] = True
+        elif event.type == EventType.KEY_UP:
+            self.legacy_keys[event.key] = False
+
+        # Mouse
+        elif event.type == EventType.MOUSE_DOWN:
+            self.legacy_mouse_buttons[event.mouse_button] = True
+        elif event.type == EventType.MOUSE_UP:
+            self.legacy_mouse_buttons[event.mouse_button] = False
+        elif event.type == EventType.MOUSE_MOVE:
+            self.mouse_position = event.mouse_position
+
+        # Controller buttons
+        elif event.type == EventType.CONTROLLER_BUTTON_DOWN:
+            cid = event.controller_id
+            if cid in self.controllers.keys():
+                self.controllers[cid].update_button(button=event.controller_button, pressed=True)
+            else:
+                new_events += self.missing_controller_process(event=event)
+        elif event.type == EventType.CONTROLLER_BUTTON_UP:
+            cid = event.controller_id
+            if cid in self.controllers.keys():
+                self.controllers[cid].update_button(button=event.controller_button, pressed=False)
+            else:
+                new_events += self.missing_controller_process(event=event)
+
+        # Controller axes
+        elif event.type == EventType.CONTROLLER_AXIS_MOVE:
+            cid = event.controller_id
+            if cid in self.controllers.keys():
+                if abs(self.controllers[cid].get_axis(axis=event.axis) - event.axis_value) < self.controller_event_tolerance:
+                    continue
+                self.controllers[cid].update_axis(axis=event.axis, value=event.axis_value)
+            else:
+                new_events += self.missing_controller_process(event=event)
+        elif event.type == EventType.CONTROLLER_ADDED:
+            self.controllers[event.controller_id] = Controller(controller_id=event.controller_id)
+        elif event.type == EventType.CONTROLLER_REMOVED:
+            self.controllers.pop(event.controller_id, None)
+
+        # Window
+        elif event.type == EventType.QUIT:
+            self.quit = True
+        elif event.type == EventType.WINDOW_MOVE:
+            self.window["position"] = event.window_position
+        elif event.type == EventType.WINDOW_RESIZE:
+            self.window["size"] = event.window_size
+        elif event.type == EventType.WINDOW_ACCESS:
+            self.window["accessed"] = event.is_accessed
+        elif event.type == EventType.WINDOW_ACTIVATION:
+            self.window["active"] = event.is_active
+
+        new_events += [event]
+    return new_events
+
+
+
+def mouse_heavy_stream():
+    events = []
+    for i in range(N_EVENTS):
+        if i % 50 == 0:
+            events.append(MouseEvent(EventType.MOUSE_DOWN, mouse_pos=(i, i), mouse_button=MouseButton.LEFT))
+        elif i % 50 == 25:
+            events.append(MouseEvent(EventType.MOUSE_UP, mouse_pos=(i, i), mouse_button=MouseButton.LEFT))
+        elif i % 100 == 1:
+            events.append(KeyEvent(EventType.KEY_DOWN, key=Key.W))
+        else:
+            events.append(MouseEvent(EventType.MOUSE_MOVE, mouse_pos=(i, i)))
+    return events
+
+def controller_heavy_stream():
+    axes = list(ControllerAxis)
+    events = []
+    for i in range(N_EVENTS):
+        cid = i % N_CONTROLLERS
+        if i % 20 == 0:
+            events.append(ControllerButtonEvent(EventType.CONTROLLER_BUTTON_DOWN, controller_id=cid,
+                                                controller_button=ControllerButton.A))
+        elif i % 20 == 10:
+            events.append(ControllerButtonEvent(EventType.CONTROLLER_BUTTON_UP, controller_id=cid,
+                                                controller_button=ControllerButton.A))
+        else:
+            # alternate values so that the tolerance check does not drop them
+            value = 0.5 if (i // N_CONTROLLERS) % 2 else -0.5
+            events.append(ControllerAxisEvent(EventType.CONTROLLER_AXIS_MOVE, controller_id=cid,
+                                              axis=axes[i % len(axes)], axis_value=value))
+    return events
+
+def create_input_state():
+    return InputState(controllers={cid: Controller(controller_id=cid) for cid in range(N_CONTROLLERS)})
+
+def measure(update_func, events):
+    input_state = create_input_state()
+    input_state.legacy_keys = {}
+    input_state.legacy_mouse_buttons = {}
+    return min(timeit.repeat(lambda: update_func(input_state, events), number=1, repeat=REPEATS))
+
+def measure_get_all_active():
+    input_state = create_input_state()
+    input_state.update([KeyEvent(EventType.KEY_DOWN, key=Key.W),
+                        MouseEvent(EventType.MOUSE_DOWN, mouse_pos=(0, 0), mouse_button=MouseButton.LEFT)])
+    unchanged = min(timeit.repeat(lambda: input_state.get_all_active(as_string=True),
+                                  number=N_EVENTS, repeat=REPEATS)) / N_EVENTS
+
+    key_events = [[KeyEvent(EventType.KEY_DOWN, key=Key.A)], [KeyEvent(EventType.KEY_UP, key=Key.A)]]
+    def changed_frame():
+        for events in key_events:
+            input_state.update(events)
+            input_state.get_all_active(as_string=True)
+    changed = min(timeit.repeat(changed_frame, number=N_EVENTS, repeat=REPEATS)) / (2 * N_EVENTS)
+    return unchanged, changed
+
+def main():
+    print(f"InputState.update per {N_EVENTS} events (best of {REPEATS}):\n")
+    for name, events in [("mouse-heavy", mouse_heavy_stream()),
+                         ("controller-heavy", controller_heavy_stream())]:
+        legacy_seconds = measure(legacy_update, events)
+        dispatch_seconds = measure(InputState.update, events)
+        print(f"{name:>17}: legacy {legacy_seconds*1000:8.3f} ms   dispatch {dispatch_seconds*1000:8.3f} ms   "
+              f"({legacy_seconds/dispatch_seconds:.2f}x)")
+
+    unchanged, changed = measure_get_all_active()
+    print(f"\nget_all_active: unchanged state {unchanged*1e6:.3f} us/call   "
+          f"changed state (update + rebuild) {changed*1e6:.3f} us/call")
+
+
+
+if __name__ == "__main__":
+    main()
+
+
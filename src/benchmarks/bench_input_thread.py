@@ -0,0 +1,88 @@
+"""
+Benchmark for the joystick polling thread of the `GlfwBackend`.
+
+Simulates a joystick whose trigger gets flicked (pressed for 8 ms every
+40 ms) and a slow main loop (20 FPS). Compares polling once per frame in
+`get_events` with the `InputPollingThread` (1000 Hz): how many flicks
+reach the main loop and how old the events are when they get drained
+(from their `perf_counter_ns` timestamp). Needs no window or joystick.
+
+Run from the `src` folder:
+    python benchmarks/bench_input_thread.py
+"""
+
+import sys
+import time
+
+import numpy as np
+
+sys.path += ["."]
+
+from windforge.window import InputPollingThread, EventType, ControllerAxis, WindowLib, load_backend
+
+load_backend(WindowLib.GLFW)
+from windforge.window import GlfwBackend
+
+
+
+FPS = 20
+N_FRAMES = 40
+POLL_RATE = 1000
+FLICK_PERIOD = 0.040
+FLICK_DURATION = 0.008
+TRIGGER_AXIS = 4    # GLFW axis index of the left trigger
+
+
+
+def create_backend(start):
+    # only the joystick polling is needed -> skip window creation, fake the joystick reads
+    backend = GlfwBackend.__new__(GlfwBackend)
+    backend.print_missed_events = False
+    backend._joysticks_present = {0}
+    def read_joystick(cid):
+        axes = np.full(6, 0.0, dtype=np.float32)
+        axes[TRIGGER_AXIS] = 1.0 if (time.perf_counter() - start) % FLICK_PERIOD < FLICK_DURATION else -1.0
+        return {"axes": axes, "buttons": np.zeros(4, dtype=np.uint8), "hats": np.zeros(1, dtype=np.uint8)}
+    backend._read_joystick = read_joystick
+    backend._joystick_prev = {0: read_joystick(0)}
+    return backend
+
+def run(threaded):
+    start = time.perf_counter()
+    backend = create_backend(start)
+    thread = InputPollingThread(poll=backend._poll_joysticks, rate=POLL_RATE) if threaded else None
+    if thread:
+        thread.start()
+    presses = 0
+    ages = []
+    for _ in range(N_FRAMES):
+        time.sleep(1 / FPS)
+        events = []
+        if thread:
+            thread.drain(events)
+        else:
+            backend._poll_joysticks(events)
+        now = time.perf_counter_ns()
+        for event in events:
+            if event.type == EventType.CONTROLLER_AXIS_MOVE and event.axis == ControllerAxis.LEFT_TRIGGER:
+                presses += event.axis_value > 0.5
+                if event.timestamp is not None:
+                    ages += [(now - event.timestamp) / 1e6]
+    if thread:
+        thread.stop()
+    flicks = int((time.perf_counter() - start) / FLICK_PERIOD)
+    return presses, flicks, ages
+
+def main():
+    print(f"Trigger flicks ({FLICK_DURATION*1000:g} ms every {FLICK_PERIOD*1000:g} ms) at a {FPS} FPS main loop:\n")
+    for name, threaded in [("per frame", False), (f"thread {POLL_RATE} Hz", True)]:
+        presses, flicks, ages = run(threaded)
+        line = f"  {name:<14} flicks seen {presses:>4} of ~{flicks}"
+        if ages:
+            line += f"   event age at drain: mean {np.mean(ages):.1f} ms  max {np.max(ages):.1f} ms"
+        print(line)
+
+
+
+if __name__ == "__main__":
+    main()
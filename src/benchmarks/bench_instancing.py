@@ -0,0 +1,129 @@
+"""
+Benchmark for instanced drawing and static batching (`windforge.gl.instancing`, `windforge.gl.batching`).
+
+1. Instancing: 10k copies of a mesh, drawn with one draw call per copy
+   (transform uniform + `glDrawElements`) vs. one `InstancedMesh`
+   (instances packed with NumPy, one upload, one instanced draw).
+2. Static batching: 2k static meshes with 8 materials, drawn mesh by
+   mesh vs. the merged `StaticBatch` per material.
+
+Counted with the `RecordingGL` stub, no GPU needed (the CPU side is
+tested in `tests/test_gl_instancing.py` and `tests/test_gl_batching.py`).
+
+Run from the `src` folder:
+    python benchmarks/bench_instancing.py
+"""
+
+import sys
+import timeit
+
+import numpy as np
+
+sys.path += ["."]
+
+from windforge.gl.buffer import interleave, VertexBuffer, IndexBuffer, VertexArray
+from windforge.gl.instancing import InstancedMesh
+from windforge.gl.batching import StaticBatcher
+from windforge.gl.render_queue import RenderQueue
+from windforge.gl.state import RenderState
+from windforge.gl.stub import RecordingGL
+
+
+
+N_INSTANCES = 10_000
+N_STATIC = 2_000
+N_MATERIALS = 8
+REPEATS = 3
+
+
+
+def cube():
+    rng = np.random.default_rng(0)
+    vertices = interleave(position=rng.random((24, 3), dtype=np.float32),
+                          normal=np.tile(np.array([0, 0, 1], dtype=np.float32), (24, 1)))
+    indices = rng.integers(0, 24, 36)
+    return vertices, indices
+
+def transforms(n):
+    rng = np.random.default_rng(1)
+    matrices = np.tile(np.eye(4, dtype=np.float32), (n, 1, 1))
+    matrices[:, :3, 3] = rng.random((n, 3)) * 100
+    return matrices
+
+def draw_copies(gl, state, vao, count, matrices):
+    for matrix in matrices:
+        state.bind_vertex_array(vao.id)
+        gl.glUniformMatrix4fv(0, 1, gl.GL_TRUE, matrix)
+        gl.glDrawElements(gl.GL_TRIANGLES, count, gl.GL_UNSIGNED_INT, None)
+
+def draws(gl):
+    return sum(gl.count(name) for name in ("glDrawElements", "glDrawElementsInstanced"))
+
+def main():
+    vertices, indices = cube()
+    matrices = transforms(N_INSTANCES)
+
+    copies_gl = RecordingGL()
+    vao = VertexArray(VertexBuffer(vertices, gl=copies_gl), index_buffer=IndexBuffer(indices, gl=copies_gl), gl=copies_gl)
+    state = RenderState(gl=copies_gl)
+    def copies():
+        copies_gl.reset()
+        draw_copies(copies_gl, state, vao, len(indices), matrices)
+    copies_seconds = min(timeit.repeat(copies, number=1, repeat=REPEATS))
+
+    instanced_gl = RecordingGL()
+    vao = VertexArray(VertexBuffer(vertices, gl=instanced_gl), index_buffer=IndexBuffer(indices, gl=instanced_gl), gl=instanced_gl)
+    mesh = InstancedMesh(vao, gl=instanced_gl)
+    queue = RenderQueue(state=RenderState(gl=instanced_gl))
+    def instanced():
+        instanced_gl.reset()
+        mesh.set(matrices)
+        mesh.submit(queue, program=1)
+        queue.flush()
+    instanced_seconds = min(timeit.repeat(instanced, number=1, repeat=REPEATS))
+
+    print(f"{N_INSTANCES} copies of a mesh per frame:")
+    print(f"  draw call per copy  draw calls {draws(copies_gl):>6}   {copies_seconds*1000:8.2f} ms")
+    print(f"  InstancedMesh       draw calls {draws(instanced_gl):>6}   {instanced_seconds*1000:8.2f} ms   "
+          f"({copies_seconds/instanced_seconds:.0f}x)\n")
+
+    static_gl = RecordingGL()
+    rng = np.random.default_rng(2)
+    materials = rng.integers(1, N_MATERIALS + 1, N_STATIC).tolist()
+    placements = transforms(N_STATIC)
+    meshes = []
+    batcher = StaticBatcher()
+    for material, placement in zip(materials, placements):
+        meshes += [(VertexArray(VertexBuffer(vertices, gl=static_gl), index_buffer=IndexBuffer(indices, gl=static_gl),
+                                gl=static_gl), material)]
+        batcher.add(vertices, indices, material=material, transform=placement)
+    merge_seconds = timeit.timeit(batcher.merge, number=1)
+    batches = batcher.build(gl=static_gl)
+
+    def per_mesh():
+        static_gl.reset()
+        queue = RenderQueue(state=RenderState(gl=static_gl))
+        for mesh_vao, material in meshes:
+            queue.submit(mesh_vao.id, len(indices), program=1, texture=material, index_type="GL_UNSIGNED_INT")
+        queue.flush()
+        return draws(static_gl)
+    def batched():
+        static_gl.reset()
+        queue = RenderQueue(state=RenderState(gl=static_gl))
+        for batch in batches.values():
+            batch.submit(queue, program=1, texture=batch.material)
+        queue.flush()
+        return draws(static_gl)
+    per_mesh_seconds = min(timeit.repeat(per_mesh, number=1, repeat=REPEATS))
+    per_mesh_draws = per_mesh()
+    batched_seconds = min(timeit.repeat(batched, number=1, repeat=REPEATS))
+    batched_draws = batched()
+
+    print(f"{N_STATIC} static meshes with {N_MATERIALS} materials (merged once in {merge_seconds*1000:.1f} ms):")
+    print(f"  mesh by mesh   draw calls {per_mesh_draws:>6}   {per_mesh_seconds*1000:8.2f} ms")
+    print(f"  StaticBatch    draw calls {batched_draws:>6}   {batched_seconds*1000:8.2f} ms")
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Input latency benchmark (event timestamp -> buffer swap).
+
+Runs a headless `GraphicsApplication` with a simulated render load and
+one key press per frame which "arrived" at a random time during the
+previous frame (the input waits in the queue until the next poll).
+Reports the latency statistics and histogram of
+`Clock.get_latency_stats()` per goal FPS, and the overhead of the
+stamping and tracking per frame. Needs no window.
+
+Run from the `src` folder:
+    python benchmarks/bench_latency.py
+"""
+
+import sys
+import time
+import random
+import timeit
+
+sys.path += ["."]
+
+import windforge as wf
+from windforge.window import WindowLib, KeyEvent, EventType, Key
+from windforge.time import LATENCY_BINS
+
+
+
+GOAL_FPS = [30, 60, 144]
+N_FRAMES = 120
+WORK_SECONDS = 0.003
+N_OVERHEAD_FRAMES = 20_000
+
+
+
+class LoadApplication(wf.GraphicsApplication):
+    def process_input(self):
+        pass
+
+    def update(self, dt=None):
+        end = time.perf_counter() + WORK_SECONDS
+        while time.perf_counter() < end:
+            pass
+
+class EmptyApplication(wf.GraphicsApplication):
+    def process_input(self):
+        pass
+
+    def update(self, dt=None):
+        pass
+
+def arrived_during_last_frame(goal_fps):
+    def source(frame):
+        event = KeyEvent(EventType.KEY_DOWN, key=Key.A)
+        event.timestamp = time.perf_counter_ns() - int(random.random() / goal_fps * 1e9)
+        return [event]
+    return source
+
+def run(goal_fps):
+    app = LoadApplication(background_lib=WindowLib.HEADLESS, goal_fps=goal_fps, precise_pacing=True,
+                          event_source=arrived_during_last_frame(goal_fps))
+    for _ in range(N_FRAMES):
+        app.run_frame()
+    return app.clock.get_latency_stats()
+
+def measure_overhead(tracked):
+    app = EmptyApplication(background_lib=WindowLib.HEADLESS, goal_fps=None,
+                           event_source=lambda frame: [KeyEvent(EventType.KEY_DOWN, key=Key.A)])
+    if not tracked:
+        app.window.latency_tracker = None
+    return min(timeit.repeat(app.run_frame, number=N_OVERHEAD_FRAMES, repeat=5)) / N_OVERHEAD_FRAMES
+
+def main():
+    labels = [f"<={bound*1000:g}ms" for bound in LATENCY_BINS] + ["more"]
+    print(f"Input latency with {WORK_SECONDS*1000:g} ms work per frame ({N_FRAMES} frames):\n")
+    for goal_fps in GOAL_FPS:
+        stats = run(goal_fps)
+        print(f"{goal_fps:>4} FPS: mean {stats['mean']*1000:6.2f} ms   p50 {stats['p50']*1000:6.2f} ms   "
+              f"p99 {stats['p99']*1000:6.2f} ms   max {stats['max']*1000:6.2f} ms")
+        print(f"{'':>10}histogram: " + "  ".join(f"{label} {count}" for label, count in zip(labels, stats["histogram"].values())))
+
+    untracked = measure_overhead(tracked=False)
+    tracked = measure_overhead(tracked=True)
+    print(f"\nEmpty frame with one event: {untracked*1e6:.2f} us without tracking, {tracked*1e6:.2f} us with tracking "
+          f"(+{(tracked - untracked)*1e6:.2f} us)")
+
+
+
+if __name__ == "__main__":
+    main()
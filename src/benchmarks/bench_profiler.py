@@ -0,0 +1,72 @@
+"""
+Overhead benchmark for the `Profiler`.
+
+Measures the cost of one zone (context manager, decorator and
+`begin`/`end`) while the profiler is enabled and disabled, relative
+to the same code without profiling.
+
+Run from the `src` folder:
+    python benchmarks/bench_profiler.py
+"""
+
+import sys
+import timeit
+from time import perf_counter_ns
+
+sys.path += ["."]
+
+from windforge.profiler import Profiler, NULL_ZONE
+
+
+
+N_ZONES = 100_000
+REPEATS = 10
+
+
+
+def measure(func):
+    return min(timeit.repeat(func, number=N_ZONES, repeat=REPEATS)) / N_ZONES
+
+def main():
+    profiler = Profiler(enabled=True)
+
+    def plain():
+        pass
+
+    def empty_context_manager():
+        with NULL_ZONE:
+            pass
+
+    def context_manager():
+        with profiler.zone("zone"):
+            pass
+
+    @profiler.profiled("decorated")
+    def decorated():
+        pass
+
+    def begin_end():
+        profiler.begin("zone")
+        profiler.end("zone")
+
+    baseline = measure(plain)
+    print(f"Profiler cost per zone (best of {REPEATS}, {N_ZONES} zones, without the empty call of {baseline*1e9:.0f} ns):\n")
+    for enabled in (False, True):
+        profiler.enabled = enabled
+        profiler.reset()
+        print("enabled" if enabled else "disabled")
+        for name, func in [("with zone(name)", context_manager),
+                           ("@profiled", decorated),
+                           ("begin/end", begin_end)]:
+            print(f"  {name:>16}: {(measure(func) - baseline)*1e9:8.1f} ns")
+        print()
+
+    print(f"reference: empty with-block {(measure(empty_context_manager) - baseline)*1e9:.1f} ns, "
+          f"two perf_counter_ns() calls {(measure(lambda: (perf_counter_ns(), perf_counter_ns())) - baseline)*1e9:.1f} ns")
+
+
+
+if __name__ == "__main__":
+    main()
+
+
@@ -0,0 +1,160 @@
+"""
+Throughput benchmark for the event translation of the `PygameBackend`.
+
+Translates synthetic pygame event streams with the former `if/elif`
+chain over the event type (membership test plus second lookup per key
+or button, a new list per axis event for the trigger check) and with
+the translation table built at backend init (one `.get` for the
+handler, one `.get` per key/button/axis). Needs no window.
+
+Run from the `src` folder:
+    python benchmarks/bench_pygame_translation.py
+"""
+
+import sys
+import timeit
+
+sys.path += ["."]
+
+from windforge.window import PygameBackend, WindowLib, EventType, DpadState, ControllerButton, \
+                             KeyEvent, MouseEvent, MouseWheelEvent, ControllerButtonEvent, \
+                             ControllerAxisEvent, load_backend
+
+load_backend(WindowLib.PYGAME)
+from windforge.window import pygame, PYGAME_KEY_MAP, PYGAME_MOUSE_BUTTON_MAP, \
+                             PYGAME_CONTROLLER_BUTTON_MAP, PYGAME_CONTROLLER_DPAD_MAP, \
+                             PYGAME_CONTROLLER_AXIS_MAP
+
+
+
+N_EVENTS = 10_000
+REPEATS = 10
+
+
+
+def legacy_get_events(backend, pygame_events):
+    """
+    Copy of the former `PygameBackend.get_events` chain (input events only), kept as reference.
+    """
+    events = []
+    for event in pygame_events:
+        if event.type == pygame.QUIT:
+            pass
+        elif event.type == pygame.WINDOWMOVED:
+            pass
+        elif event.type == pygame.VIDEORESIZE:
+            pass
+        elif event.type == pygame.ACTIVEEVENT:
+            pass
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            pass
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            pass
+        elif event.type == pygame.KEYDOWN:
+            if event.key in PYGAME_KEY_MAP:
+                events += [KeyEvent(EventType.KEY_DOWN, key=PYGAME_KEY_MAP[event.key])]
+        elif event.type == pygame.KEYUP:
+            if event.key in PYGAME_KEY_MAP:
+                events += [KeyEvent(EventType.KEY_UP, key=PYGAME_KEY_MAP[event.key])]
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button in PYGAME_MOUSE_BUTTON_MAP:
+                events += [MouseEvent(EventType.MOUSE_DOWN, mouse_button=PYGAME_MOUSE_BUTTON_MAP[event.button], mouse_pos=event.pos)]
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if event.button in PYGAME_MOUSE_BUTTON_MAP:
+                events += [MouseEvent(EventType.MOUSE_UP, mouse_button=PYGAME_MOUSE_BUTTON_MAP[event.button], mouse_pos=event.pos)]
+        elif event.type == pygame.MOUSEMOTION:
+            events += [MouseEvent(EventType.MOUSE_MOVE, mouse_pos=event.pos, mouse_rel=event.rel)]
+        elif event.type == pygame.MOUSEWHEEL:
+            events += [MouseWheelEvent(EventType.MOUSE_WHEEL, mouse_scroll=(event.x, event.y), mouse_scroll_precise=(event.precise_x, event.precise_y))]
+        elif event.type == pygame.JOYDEVICEADDED:
+            pass
+        elif event.type == pygame.JOYDEVICEREMOVED:
+            pass
+        elif event.type == pygame.JOYBUTTONDOWN:
+            if event.button in PYGAME_CONTROLLER_BUTTON_MAP:
+                events += [ControllerButtonEvent(EventType.CONTROLLER_BUTTON_DOWN,
+                                 controller_id=event.instance_id,
+                                 controller_button=PYGAME_CONTROLLER_BUTTON_MAP[event.button])]
+        elif event.type == pygame.JOYBUTTONUP:
+            if event.button in PYGAME_CONTROLLER_BUTTON_MAP:
+                events += [ControllerButtonEvent(EventType.CONTROLLER_BUTTON_UP,
+                                 controller_id=event.instance_id,
+                                 controller_button=PYGAME_CONTROLLER_BUTTON_MAP[event.button])]
+        elif event.type == pygame.JOYHATMOTION:
+            dpad_state = PYGAME_CONTROLLER_DPAD_MAP[event.value]
+            if dpad_state == DpadState.NEUTRAL:
+                events += [ControllerButtonEvent(EventType.CONTROLLER_BUTTON_UP, controller_button=ControllerButton.DPAD,
+                                controller_dpad=dpad_state, controller_id=event.instance_id)]
+            else:
+                events += [ControllerButtonEvent(EventType.CONTROLLER_BUTTON_DOWN, controller_button=ControllerButton.DPAD,
+                                controller_dpad=dpad_state, controller_id=event.instance_id)]
+        elif event.type == pygame.JOYAXISMOTION:
+            if event.axis in PYGAME_CONTROLLER_AXIS_MAP:
+                value = event.value
+                if event.axis in [pygame.CONTROLLER_AXIS_TRIGGERLEFT,
+                                  pygame.CONTROLLER_AXIS_TRIGGERRIGHT]:
+                    value = max(0.0, (value + 1.0) / 2.0)
+                events += [ControllerAxisEvent(EventType.CONTROLLER_AXIS_MOVE,
+                                 controller_id=event.instance_id,
+                                 axis=PYGAME_CONTROLLER_AXIS_MAP[event.axis],
+                                 axis_value=value)]
+    return events
+
+
+
+def create_backend():
+    # only the translation is needed -> skip window creation
+    backend = PygameBackend.__new__(PygameBackend)
+    backend.print_missed_events = False
+    backend.controllers = {}
+    backend._translation_table = backend._build_translation_table()
+    return backend
+
+def keyboard_stream():
+    keys = [pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d, pygame.K_SPACE]
+    return [pygame.event.Event(pygame.KEYDOWN if i % 2 == 0 else pygame.KEYUP, key=keys[i % len(keys)])
+            for i in range(N_EVENTS)]
+
+def mouse_stream():
+    return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(i, i)) if i % 20 == 0 else
+            pygame.event.Event(pygame.MOUSEMOTION, pos=(i, i), rel=(1, 1), buttons=(0, 0, 0))
+            for i in range(N_EVENTS)]
+
+def controller_stream():
+    axes = list(PYGAME_CONTROLLER_AXIS_MAP)
+    events = []
+    for i in range(N_EVENTS):
+        if i % 10 == 0:
+            events += [pygame.event.Event(pygame.JOYBUTTONDOWN, instance_id=0, button=i % 4)]
+        elif i % 10 == 5:
+            events += [pygame.event.Event(pygame.JOYHATMOTION, instance_id=0, value=(0, 1))]
+        else:
+            events += [pygame.event.Event(pygame.JOYAXISMOTION, instance_id=0, axis=axes[i % len(axes)], value=0.5)]
+    return events
+
+def translate(backend, pygame_events):
+    original_get = pygame.event.get
+    pygame.event.get = lambda: pygame_events
+    try:
+        return backend.get_events()
+    finally:
+        pygame.event.get = original_get
+
+def same_events(a, b):
+    return len(a) == len(b) and all(type(x) is type(y) and x.as_dict() == y.as_dict() for x, y in zip(a, b))
+
+def main():
+    backend = create_backend()
+    print(f"Event translation (best of {REPEATS}, {N_EVENTS} events per stream):\n")
+    for name, stream in [("keyboard", keyboard_stream()), ("mouse", mouse_stream()),
+                         ("controller", controller_stream())]:
+        assert same_events(legacy_get_events(backend, stream), translate(backend, stream))
+        legacy_seconds = min(timeit.repeat(lambda: legacy_get_events(backend, stream), number=1, repeat=REPEATS))
+        table_seconds = min(timeit.repeat(lambda: translate(backend, stream), number=1, repeat=REPEATS))
+        print(f"  {name:<12} if/elif chain {N_EVENTS/legacy_seconds/1e6:6.2f} M events/s   "
+              f"translation table {N_EVENTS/table_seconds/1e6:6.2f} M events/s   ({legacy_seconds/table_seconds:.2f}x)")
+
+
+
+if __name__ == "__main__":
+    main()
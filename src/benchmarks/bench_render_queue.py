@@ -0,0 +1,107 @@
+"""
+Benchmark for the render queue of `windforge.gl.render_queue`.
+
+100k synthetic draw items (8 programs, 64 textures, 32 vertex arrays,
+10% transparent in a back-to-front pass) in random order:
+
+1. Sorting: building the packed 64-bit keys, `argsort` and finding the
+   batches (runs of equal pass, program and texture) with NumPy vs.
+   sorting the items with a Python key function.
+2. Submission: drawing the items in submission order through the
+   `RenderState` cache vs. flushing the sorted queue. Counts the issued
+   program and texture changes on the `RecordingGL` stub, no GPU needed.
+
+Run from the `src` folder:
+    python benchmarks/bench_render_queue.py
+"""
+
+import sys
+import timeit
+
+import numpy as np
+
+sys.path += ["."]
+
+from windforge.gl.render_queue import RenderQueue
+from windforge.gl.state import RenderState
+from windforge.gl.stub import RecordingGL
+
+
+
+N_ITEMS = 100_000
+N_PROGRAMS = 8
+N_TEXTURES = 64
+N_VAOS = 32
+REPEATS = 3
+
+
+
+def synthetic_items():
+    rng = np.random.default_rng(0)
+    transparent = rng.random(N_ITEMS) < 0.1
+    return list(zip(rng.integers(1, N_VAOS + 1, N_ITEMS).tolist(),
+                    rng.integers(1, N_PROGRAMS + 1, N_ITEMS).tolist(),
+                    rng.integers(1, N_TEXTURES + 1, N_ITEMS).tolist(),
+                    (rng.random(N_ITEMS) * 100).astype(np.float32).tolist(),
+                    transparent.astype(int).tolist()))
+
+def fill(queue, items):
+    for vertex_array, program, texture, depth, pass_index in items:
+        queue.submit(vertex_array, 36, program=program, texture=texture, depth=depth, pass_index=pass_index)
+
+def python_sort(items):
+    # same order as the packed key: pass, program, texture, depth (far to near in pass 1)
+    order = sorted(range(len(items)), key=lambda i: (items[i][4], items[i][1], items[i][2],
+                                                     -items[i][3] if items[i][4] else items[i][3]))
+    batches = 1
+    for previous, current in zip(order, order[1:]):
+        if items[previous][4] != items[current][4] or items[previous][1:3] != items[current][1:3]:
+            batches += 1
+    return order, batches
+
+def draw_unsorted(gl, state, items):
+    for vertex_array, program, texture, depth, pass_index in items:
+        state.set_blend(bool(pass_index))
+        state.use_program(program)
+        state.bind_texture(0, texture)
+        state.bind_vertex_array(vertex_array)
+        gl.glDrawArrays(gl.GL_TRIANGLES, 0, 36)
+
+def changes(gl):
+    return gl.count("glUseProgram"), gl.count("glBindTexture")
+
+def main():
+    items = synthetic_items()
+    queue = RenderQueue(state=RenderState(gl=RecordingGL()), back_to_front=(1,))
+
+    submit_seconds = min(timeit.repeat(lambda: (queue.clear(), fill(queue, items)), number=1, repeat=REPEATS))
+    sort_seconds = min(timeit.repeat(queue.sort, number=1, repeat=REPEATS))
+    python_seconds = min(timeit.repeat(lambda: python_sort(items), number=1, repeat=REPEATS))
+    order, starts = queue.sort()
+    _, python_batches = python_sort(items)
+    print(f"Sorting {N_ITEMS} draw items:")
+    print(f"  submit (Python loop)      {submit_seconds*1000:8.2f} ms")
+    print(f"  Python sorted + batches   {python_seconds*1000:8.2f} ms   {python_batches} batches")
+    print(f"  packed keys + argsort     {sort_seconds*1000:8.2f} ms   {len(starts)} batches   "
+          f"({python_seconds/sort_seconds:.0f}x)\n")
+
+    unsorted_gl = RecordingGL()
+    unsorted_state = RenderState(gl=unsorted_gl)
+    unsorted_seconds = timeit.timeit(lambda: draw_unsorted(unsorted_gl, unsorted_state, items), number=1)
+
+    queue_gl = RecordingGL()
+    queue = RenderQueue(state=RenderState(gl=queue_gl), back_to_front=(1,),
+                        pass_setup={0: lambda state: state.set_blend(False), 1: lambda state: state.set_blend(True)})
+    fill(queue, items)
+    flush_seconds = timeit.timeit(queue.flush, number=1)
+
+    print(f"Drawing {N_ITEMS} items through the state cache (RecordingGL):")
+    print(f"  submission order   program changes {changes(unsorted_gl)[0]:>6}   texture changes {changes(unsorted_gl)[1]:>6}   "
+          f"{unsorted_seconds*1000:8.2f} ms")
+    print(f"  RenderQueue.flush  program changes {changes(queue_gl)[0]:>6}   texture changes {changes(queue_gl)[1]:>6}   "
+          f"{flush_seconds*1000:8.2f} ms")
+
+
+
+if __name__ == "__main__":
+    main()
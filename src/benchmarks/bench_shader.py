@@ -0,0 +1,117 @@
+"""
+Benchmark for the shader programs of `windforge.gl.shader`.
+
+1. Startup: 200 objects using 40 distinct shader programs. Compiling
+   one program per object vs. a `ShaderManager` on the first start
+   (deduplicated, compiled once per program) vs. the second start
+   (program binaries from the disk cache, no compiling at all).
+2. Drawing: 10k draws setting 4 uniforms each, with a
+   `glGetUniformLocation` query per uniform vs. the cached locations.
+
+Counted with the `RecordingGL` stub (no GPU needed), so the numbers are
+GL calls, not driver compile times: every avoided `glCompileShader` and
+`glLinkProgram` is typically milliseconds on a real driver.
+
+Run from the `src` folder:
+    python benchmarks/bench_shader.py
+"""
+
+import sys
+import timeit
+import tempfile
+
+sys.path += ["."]
+
+from windforge.gl.shader import ShaderManager
+from windforge.gl.stub import RecordingGL
+
+
+
+N_OBJECTS = 200
+N_PROGRAMS = 40
+N_DRAWS = 10_000
+UNIFORMS = ("u_model", "u_view", "u_projection", "u_color")
+BINARY_SIZE = 4096
+
+VERTEX_SOURCE = "#version 330 core\n// variant {i}\nlayout(location = 0) in vec3 position;\nvoid main() {{ gl_Position = vec4(position, 1.0); }}\n"
+FRAGMENT_SOURCE = "#version 330 core\n// variant {i}\nout vec4 color;\nvoid main() {{ color = vec4(1.0); }}\n"
+
+
+
+def create_gl():
+    def get_program_binary(program, size, length, binary_format, binary):
+        length[0] = size
+        binary_format[0] = 1
+        binary[:] = program & 0xFF
+    def get_program(program, pname):
+        return BINARY_SIZE if pname.name == "GL_PROGRAM_BINARY_LENGTH" else 1
+    return RecordingGL(returns={
+        "glGetIntegerv": 1,
+        "glGetString": b"stub",
+        "glGetShaderiv": 1,
+        "glGetProgramiv": get_program,
+        "glGetProgramBinary": get_program_binary,
+        "glGetUniformLocation": 0,
+    })
+
+def sources():
+    return [(VERTEX_SOURCE.format(i=i % N_PROGRAMS), FRAGMENT_SOURCE.format(i=i % N_PROGRAMS))
+            for i in range(N_OBJECTS)]
+
+def compile_per_object(gl, object_sources):
+    programs = []
+    for vertex_source, fragment_source in object_sources:
+        shaders = []
+        for shader_type, source in ((gl.GL_VERTEX_SHADER, vertex_source), (gl.GL_FRAGMENT_SHADER, fragment_source)):
+            shader = gl.glCreateShader(shader_type)
+            gl.glShaderSource(shader, source)
+            gl.glCompileShader(shader)
+            shaders += [shader]
+        program = gl.glCreateProgram()
+        for shader in shaders:
+            gl.glAttachShader(program, shader)
+        gl.glLinkProgram(program)
+        programs += [program]
+    return programs
+
+def startup_report(name, gl, seconds):
+    print(f"  {name:<26} compiles {gl.count('glCompileShader'):>4}   links {gl.count('glLinkProgram'):>4}   "
+          f"binary loads {gl.count('glProgramBinary'):>4}   {seconds*1000:7.2f} ms")
+
+def main():
+    object_sources = sources()
+
+    print(f"Startup with {N_OBJECTS} objects and {N_PROGRAMS} distinct programs (GL calls on the stub):")
+    gl = create_gl()
+    seconds = timeit.timeit(lambda: compile_per_object(gl, object_sources), number=1)
+    startup_report("compile per object", gl, seconds)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for name in ("ShaderManager, 1st start", "ShaderManager, 2nd start"):
+            gl = create_gl()
+            def start():
+                manager = ShaderManager(cache_dir=cache_dir, gl=gl)
+                return [manager.get_program(*object_source) for object_source in object_sources]
+            seconds = timeit.timeit(start, number=1)
+            startup_report(name, gl, seconds)
+
+    gl = create_gl()
+    program = ShaderManager(gl=gl).get_program(*object_sources[0])
+    def draw_queried():
+        for _ in range(N_DRAWS):
+            for name in UNIFORMS:
+                gl.glUniform1f(gl.glGetUniformLocation(program.id, name), 1.0)
+    def draw_cached():
+        for _ in range(N_DRAWS):
+            for name in UNIFORMS:
+                gl.glUniform1f(program.uniform(name), 1.0)
+    print(f"\n{N_DRAWS} draws with {len(UNIFORMS)} uniforms each:")
+    for name, draw in (("glGetUniformLocation", draw_queried), ("cached locations", draw_cached)):
+        gl.reset()
+        seconds = timeit.timeit(draw, number=1)
+        print(f"  {name:<22} location queries {gl.count('glGetUniformLocation'):>6}   {seconds*1000:7.2f} ms")
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""
+Headless benchmark suite for the input, timing and main-loop hot paths.
+
+Runs every benchmark without a window, writes the results as JSON and
+compares them against a stored baseline (`benchmarks/baseline.json`):
+a benchmark which got slower than its tolerance allows counts as
+regression and the suite exits with code 1.
+
+To make a baseline usable on other machines (and less sensitive to CPU
+frequency changes during a run), every timing is divided by the time of
+a fixed pure-Python calibration workload measured directly before and
+after the benchmark (timings which depend on the OS scheduler, like the
+frame pacing jitter, are compared unnormalized with a wider tolerance).
+
+Run from the `src` folder:
+    python benchmarks/suite.py                        # compare against the baseline
+    python benchmarks/suite.py --output results.json  # also write the results
+    python benchmarks/suite.py --save-baseline        # store the results as new baseline
+    python benchmarks/suite.py --filter input_state   # only matching benchmarks
+    python benchmarks/suite.py --tolerance 0.3        # stricter limit for the normalized benchmarks
+"""
+
+import os
+import sys
+import json
+import time
+import timeit
+import argparse
+import platform
+
+sys.path += ["."]
+
+import pygame
+import windforge as wf
+from windforge.window import Controller, PygameBackend, WindowLib, ControllerButton, ControllerAxis, load_backend
+from windforge.time import Clock, Timer, TimerScheduler
+
+from bench_input_state import mouse_heavy_stream, controller_heavy_stream, create_input_state, measure_get_all_active
+from bench_glfw_queue import create_backend as create_glfw_backend, inject as inject_glfw_callbacks, N_CALLBACKS
+
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_TOLERANCE = 1.0    # 2x slower (normalized) fails -> catches real regressions, not timing noise
+REPEATS = 7
+N_EVENTS = 10_000
+N_TIMERS = 1_000
+N_FRAMES = 200
+
+BENCHMARKS = []
+
+
+
+# -------------------------------
+#       >>> Registration <<<
+# -------------------------------
+def benchmark(name, unit, tolerance=DEFAULT_TOLERANCE, normalize=True):
+    """
+    Register a benchmark function which returns seconds per `unit`.
+    """
+    def decorator(func):
+        BENCHMARKS.append({"name": name, "unit": unit, "tolerance": tolerance,
+                           "normalize": normalize, "func": func})
+        return func
+    return decorator
+
+def best_of(func, number=1, repeats=None):
+    return min(timeit.repeat(func, number=number, repeat=repeats or REPEATS)) / number
+
+def calibrate():
+    # fixed pure-Python workload (loops, dict and attribute access) as machine speed reference
+    def workload():
+        values = {}
+        total = 0
+        for i in range(20_000):
+            values[i & 255] = i
+            total += values[i & 255] * 2
+        return total
+    return best_of(workload, repeats=REPEATS)
+
+
+
+# -------------------------------
+#       >>> Benchmarks <<<
+# -------------------------------
+def pygame_event_stream():
+    events = []
+    for i in range(N_EVENTS):
+        if i % 50 == 0:
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_w))
+        elif i % 50 == 25:
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(i, i)))
+        elif i % 3 == 0:
+            events.append(pygame.event.Event(pygame.JOYAXISMOTION, instance_id=0, axis=0, value=0.5))
+        else:
+            events.append(pygame.event.Event(pygame.MOUSEMOTION, pos=(i, i), rel=(1, 1), buttons=(0, 0, 0)))
+    return events
+
+@benchmark("pygame.get_events", unit="event")
+def bench_pygame_get_events():
+    # no window needed: the backend only translates what pygame.event.get returns
+    load_backend(WindowLib.PYGAME)
+    backend = PygameBackend.__new__(PygameBackend)
+    backend.print_missed_events = False
+    backend.controllers = {}
+    backend._translation_table = backend._build_translation_table()
+    events = pygame_event_stream()
+    original_get = pygame.event.get
+    pygame.event.get = lambda: events
+    try:
+        return best_of(backend.get_events) / N_EVENTS
+    finally:
+        pygame.event.get = original_get
+
+@benchmark("glfw.drain_callbacks", unit="callback")
+def bench_glfw_drain():
+    seconds = []
+    for _ in range(REPEATS):
+        backend = create_glfw_backend()
+        inject_glfw_callbacks(backend)
+        events = []
+        seconds += [timeit.timeit(lambda: backend._drain_raw_events(events), number=1)]
+    return min(seconds) / N_CALLBACKS
+
+@benchmark("input_state.update.mouse_heavy", unit="event")
+def bench_update_mouse():
+    input_state = create_input_state()
+    events = mouse_heavy_stream()
+    return best_of(lambda: input_state.update(events)) / len(events)
+
+@benchmark("input_state.update.controller_heavy", unit="event")
+def bench_update_controller():
+    input_state = create_input_state()
+    events = controller_heavy_stream()
+    return best_of(lambda: input_state.update(events)) / len(events)
+
+@benchmark("input_state.get_all_active.unchanged", unit="call")
+def bench_get_all_active_unchanged():
+    return measure_get_all_active()[0]
+
+@benchmark("input_state.get_all_active.changed", unit="call")
+def bench_get_all_active_changed():
+    return measure_get_all_active()[1]
+
+@benchmark("controller.update", unit="update")
+def bench_controller_update():
+    controller = Controller(controller_id=0)
+    buttons = list(ControllerButton)
+    axes = list(ControllerAxis)
+    def updates():
+        for i in range(N_EVENTS // 2):
+            controller.update_button(button=buttons[i % len(buttons)], pressed=bool(i & 1))
+            controller.update_axis(axis=axes[i % len(axes)], value=(i % 200) / 100 - 1.0)
+    return best_of(updates) / N_EVENTS
+
+@benchmark("clock.tick.overhead", unit="tick")
+def bench_clock_tick():
+    clock = Clock(goal_fps=None)
+    return best_of(clock.tick, number=N_EVENTS)
+
+@benchmark("clock.tick.precise_jitter", unit="frame (mean overshoot)", tolerance=3.0, normalize=False)
+def bench_clock_jitter():
+    clock = Clock(goal_fps=500, precise_pacing=True)
+    for _ in range(N_FRAMES):
+        clock.tick()
+    return clock.get_jitter_stats()["overshoot_mean"]
+
+@benchmark("timer.tick.1k_timers", unit="frame")
+def bench_timer_ticks():
+    timers = [Timer(seconds_to_wait=3600, repeat=True) for _ in range(N_TIMERS)]
+    def frame():
+        for timer in timers:
+            timer.tick()
+    return best_of(frame, number=20)
+
+@benchmark("timer_scheduler.tick.1k_timers", unit="frame")
+def bench_timer_scheduler():
+    scheduler = TimerScheduler(now=0.0)
+    for i in range(N_TIMERS):
+        scheduler.schedule(call_func=None, seconds_to_wait=(1 + i % 100) / 60, repeat=True)
+    state = {"now": 0.0}
+    def frame():
+        state["now"] += 1 / 60
+        scheduler.tick(state["now"])
+    return best_of(frame, number=N_FRAMES)
+
+class EmptyApplication(wf.GraphicsApplication):
+    def process_input(self):
+        pass
+
+    def update(self, dt=None):
+        pass
+
+@benchmark("graphics_application.empty_frame", unit="frame")
+def bench_empty_frame():
+    app = EmptyApplication(background_lib=WindowLib.HEADLESS, goal_fps=None)
+    return best_of(app.run_frame, number=N_FRAMES)
+
+
+
+# -------------------------------
+#         >>> Runner <<<
+# -------------------------------
+def run(name_filter=None):
+    results = {}
+    for entry in BENCHMARKS:
+        if name_filter and name_filter not in entry["name"]:
+            continue
+        calibration_before = calibrate()
+        seconds = entry["func"]()
+        calibration = min(calibration_before, calibrate())
+        results[entry["name"]] = {"seconds": seconds, "unit": entry["unit"], "calibration": calibration}
+        print(f"  {entry['name']:<40} {seconds*1e6:12.3f} us/{entry['unit']:<24} "
+              f"({seconds/calibration:.3e} calibration workloads)")
+    return results
+
+def compare(report, baseline, default_tolerance=DEFAULT_TOLERANCE):
+    """
+    Compare results with a baseline report.
+
+    Returns:
+        list[str]: Names of the regressed benchmarks.
+    """
+    regressions = []
+    speed = report["calibration"] / baseline["calibration"]
+    print(f"\nComparison with baseline (this machine is {1/speed:.2f}x as fast as the baseline machine):")
+    for entry in BENCHMARKS:
+        name = entry["name"]
+        if name not in report["results"] or name not in baseline["results"]:
+            continue
+        current = report["results"][name]["seconds"]
+        reference = baseline["results"][name]["seconds"]
+        if entry["normalize"]:
+            reference *= report["results"][name]["calibration"] / baseline["results"][name]["calibration"]
+        tolerance = default_tolerance if entry["tolerance"] == DEFAULT_TOLERANCE else entry["tolerance"]
+        ratio = current / reference if reference > 0 else 1.0
+        regressed = ratio > 1 + tolerance
+        status = "REGRESSION" if regressed else "ok"
+        print(f"  {name:<40} {ratio:6.2f}x of baseline (limit {1 + tolerance:.2f}x)  {status}")
+        if regressed:
+            regressions += [name]
+    return regressions
+
+def main():
+    global REPEATS
+    parser = argparse.ArgumentParser(description="Headless Wind-Forge benchmark suite.")
+    parser.add_argument("--output", help="write the results as JSON into this file")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as baseline")
+    parser.add_argument("--filter", help="only run benchmarks containing this text")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"allowed relative slowdown of the normalized benchmarks (default {DEFAULT_TOLERANCE})")
+    parser.add_argument("--repeats", type=int, default=REPEATS, help=f"runs per benchmark, the best counts (default {REPEATS})")
+    args = parser.parse_args()
+    REPEATS = args.repeats
+
+    print("Calibrating...")
+    calibration = calibrate()
+    print(f"  calibration workload {calibration*1000:.3f} ms\n")
+    print("Benchmarks (best of runs):")
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "calibration": calibration,
+        "results": run(name_filter=args.filter)
+    }
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"\n[INFO] Results written to '{args.output}'.")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"\n[INFO] Baseline written to '{args.baseline}'.")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\n[WARNING] No baseline found at '{args.baseline}' (create one with --save-baseline).")
+        return 0
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    regressions = compare(report, baseline, default_tolerance=args.tolerance)
+    if regressions:
+        print(f"\n[ERROR] {len(regressions)} benchmark(s) regressed: {', '.join(regressions)}")
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
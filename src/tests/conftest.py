@@ -0,0 +1,12 @@
+"""
+Shared setup of the Wind-Forge tests.
+
+Run from the `src` folder:
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+
+# import windforge from the src folder (as the benchmarks do)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,61 @@
+"""
+Tests of the compact events and the compatible `Event(...)` constructor.
+"""
+
+import pytest
+
+from windforge.window import (Event, EventType, Key, MouseButton, KeyEvent, MouseEvent,
+                              QuitEvent, EVENT_CLASSES)
+
+
+
+def test_event_returns_compact_class():
+    event = Event(EventType.KEY_DOWN, key=Key.A)
+    assert type(event) is KeyEvent
+    assert isinstance(event, Event)
+    assert event.key is Key.A
+    assert event.mouse_button is None
+    assert event.timestamp is None
+
+def test_every_event_type_has_a_class():
+    for event_type in EventType:
+        assert type(Event(event_type)) is EVENT_CLASSES[event_type]
+
+def test_positional_construction():
+    event = Event(EventType.MOUSE_DOWN, None, (3, 4), MouseButton.LEFT)
+    assert type(event) is MouseEvent
+    assert event.mouse_position == (3, 4)
+    assert event.mouse_button is MouseButton.LEFT
+
+def test_foreign_attributes_are_kept():
+    event = Event(EventType.KEY_DOWN, key=Key.A, mouse_pos=(1, 2), controller_id=0)
+    assert event.mouse_position == (1, 2)
+    assert event.controller_id == 0
+    assert event.as_dict() == {"type": EventType.KEY_DOWN, "key": Key.A, "mouse_position": (1, 2), "controller_id": 0}
+
+def test_unset_foreign_attributes_stay_out_of_the_dict():
+    event = Event(EventType.KEY_DOWN, key=Key.A, mouse_pos=None, controller_id=None)
+    assert type(event) is KeyEvent
+    assert vars(event) == {}
+
+def test_unknown_or_repeated_arguments_raise():
+    with pytest.raises(TypeError):
+        Event(EventType.KEY_DOWN, kee=Key.A)
+    with pytest.raises(TypeError):
+        Event(EventType.KEY_DOWN, Key.A, key=Key.B)
+
+def test_own_attributes_and_vars():
+    event = QuitEvent(EventType.QUIT)
+    event.handled = True
+    assert event.handled is True
+    assert vars(event) == {"handled": True}
+    assert event.as_dict()["handled"] is True
+
+def test_unknown_event_type_raises():
+    with pytest.raises(ValueError):
+        Event("KEY_DOWN")
+
+def test_typos_raise():
+    event = Event(EventType.KEY_UP, key=Key.B)
+    with pytest.raises(AttributeError):
+        event.kye
@@ -0,0 +1,104 @@
+"""
+Tests of `windforge.gl.batching` (vertex transforms, merging, static batches) with `RecordingGL`.
+"""
+
+import numpy as np
+import pytest
+
+from windforge.gl.buffer import interleave
+from windforge.gl.batching import transform_vertices, merge_meshes, StaticBatcher
+from windforge.gl.render_queue import RenderQueue
+from windforge.gl.state import RenderState
+from windforge.gl.stub import RecordingGL
+
+
+
+def mesh(n=24, seed=0):
+    rng = np.random.default_rng(seed)
+    normals = rng.normal(size=(n, 3)).astype(np.float32)
+    normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+    vertices = interleave(position=rng.random((n, 3), dtype=np.float32), normal=normals)
+    return vertices, rng.integers(0, n, 36)
+
+def translation(x, y, z):
+    transform = np.eye(4)
+    transform[:3, 3] = (x, y, z)
+    return transform
+
+
+
+def test_transform_moves_positions_only():
+    vertices, _ = mesh()
+    moved = transform_vertices(vertices, translation(1, 2, 3))
+    assert np.allclose(moved["position"], vertices["position"] + (1, 2, 3))
+    assert np.allclose(moved["normal"], vertices["normal"])
+    # copy, the input stays
+    assert not np.shares_memory(moved, vertices)
+
+def test_normals_use_the_inverse_transpose():
+    vertices = interleave(position=np.zeros((2, 3), dtype=np.float32),
+                          normal=np.array([[1, 1, 0], [0, 0, 1]], dtype=np.float32) / [[np.sqrt(2)], [1]])
+    scale = np.diag([2.0, 1.0, 1.0, 1.0])
+    scaled = transform_vertices(vertices, scale)
+
+    # a 45 degree surface stretched along x tilts towards y: normal (1, 2, 0) / sqrt(5), unit length
+    assert np.allclose(scaled["normal"][0], np.array([1, 2, 0]) / np.sqrt(5), atol=1e-6)
+    assert np.allclose(scaled["normal"][1], (0, 0, 1))
+    # a tangent of the surface stays perpendicular to the normal
+    tangent = scale[:3, :3] @ np.array([1, -1, 0])
+    assert abs(np.dot(tangent, scaled["normal"][0])) < 1e-6
+
+def test_transform_without_normals():
+    vertices = interleave(position=np.zeros((3, 3), dtype=np.float32))
+    assert np.allclose(transform_vertices(vertices, translation(0, 0, 1))["position"], (0, 0, 1))
+
+def test_merge_rebases_indices():
+    vertices, indices = mesh()
+    matrix = translation(5, 0, 0)
+    merged_vertices, merged_indices, ranges = merge_meshes([(vertices, indices), (vertices, None)],
+                                                           transforms=[None, matrix])
+    assert len(merged_vertices) == 48 and ranges == [(0, 36), (36, 24)]
+    assert np.array_equal(merged_indices[:36], indices)
+    assert np.array_equal(merged_indices[36:], np.arange(24, 48))
+    assert np.allclose(merged_vertices["position"][24:], vertices["position"] + (5, 0, 0))
+    assert merged_indices.dtype == np.uint16
+
+def test_merge_switches_to_uint32_above_65536_vertices():
+    big = interleave(position=np.zeros((40000, 3), dtype=np.float32))
+    _, indices, _ = merge_meshes([(big, None), (big[:25536], None)])
+    assert indices.dtype == np.uint16 and indices.max() == 65535
+
+    _, indices, _ = merge_meshes([(big, None), (big[:25537], None)])
+    assert indices.dtype == np.uint32 and indices.max() == 65536
+
+def test_merge_needs_one_transform_per_mesh():
+    vertices, indices = mesh()
+    with pytest.raises(ValueError, match="one transform per mesh"):
+        merge_meshes([(vertices, indices), (vertices, indices)], transforms=[translation(1, 0, 0)])
+    with pytest.raises(ValueError):
+        merge_meshes([(vertices, indices)], transforms=[])
+
+def test_merge_needs_equal_dtypes():
+    vertices, indices = mesh()
+    with pytest.raises(ValueError):
+        merge_meshes([(vertices, indices), (interleave(position=np.zeros((3, 3), dtype=np.float32)), None)])
+    with pytest.raises(ValueError):
+        merge_meshes([])
+
+def test_static_batches_draw_once_per_material():
+    gl = RecordingGL()
+    vertices, indices = mesh()
+    batcher = StaticBatcher()
+    for i in range(6):
+        batcher.add(vertices, indices, material=10 + i % 2, transform=translation(i, 0, 0))
+    batches = batcher.build(gl=gl)
+    assert sorted(batches) == [10, 11]
+    assert batches[10].count == 3 * 36 and batches[10].index_type == "GL_UNSIGNED_SHORT"
+
+    gl.reset()
+    queue = RenderQueue(state=RenderState(gl=gl))
+    for batch in batches.values():
+        batch.submit(queue, program=1, texture=batch.material)
+    queue.flush()
+    assert gl.count("glDrawElements") == 2
+    assert [args[1] for name, args in gl.calls if name == "glDrawElements"] == [108, 108]
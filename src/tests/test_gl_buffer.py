@@ -0,0 +1,152 @@
+"""
+Tests of `windforge.gl.buffer` (interleaving, attribute layout, storage reuse) with `RecordingGL`.
+"""
+
+import numpy as np
+import pytest
+
+from windforge.gl.buffer import interleave, attribute_layout, VertexBuffer, VertexArray, GROWTH_FACTOR
+from windforge.gl.stub import RecordingGL
+
+
+
+def calls(gl, name):
+    return [args for call_name, args in gl.calls if call_name == name]
+
+
+
+# interleave
+def test_interleave_fields_and_layout():
+    positions = np.arange(12, dtype=np.float32).reshape(4, 3)
+    colors = np.arange(16, dtype=np.uint8).reshape(4, 4)
+    ids = np.arange(4, dtype=np.int32)
+    vertices = interleave(position=positions, color=colors, id=ids)
+
+    assert vertices.dtype.names == ("position", "color", "id")
+    assert vertices.dtype.fields["position"][0] == np.dtype((np.float32, (3,)))
+    assert vertices.dtype.fields["color"][0] == np.dtype((np.uint8, (4,)))
+    assert vertices.dtype.fields["id"][0] == np.dtype(np.int32)
+    # packed in argument order
+    assert [vertices.dtype.fields[name][1] for name in vertices.dtype.names] == [0, 12, 16]
+    assert vertices.dtype.itemsize == 20
+    assert vertices.flags.c_contiguous and len(vertices) == 4
+    assert np.array_equal(vertices["position"], positions)
+    assert np.array_equal(vertices["color"], colors)
+    assert np.array_equal(vertices["id"], ids)
+
+def test_interleave_dict_before_keywords():
+    vertices = interleave({"a": np.zeros(2, dtype=np.float32)}, b=np.zeros((2, 2), dtype=np.float32))
+    assert vertices.dtype.names == ("a", "b")
+
+def test_interleave_mismatched_lengths():
+    with pytest.raises(ValueError, match="same number of vertices"):
+        interleave(position=np.zeros((4, 3), dtype=np.float32), normal=np.zeros((3, 3), dtype=np.float32))
+
+def test_interleave_needs_an_attribute():
+    with pytest.raises(ValueError):
+        interleave()
+
+def test_interleave_keeps_component_shape():
+    vertices = interleave(position=np.zeros((2, 3), dtype=np.float32), transform=np.zeros((2, 4, 4), dtype=np.float32))
+    assert vertices.dtype.fields["transform"][0].shape == (4, 4)
+
+def test_attribute_layout():
+    dtype = np.dtype([("position", np.float32, (3,)), ("color", np.uint8, (4,)), ("id", np.int32)])
+    assert attribute_layout(dtype) == [("position", 3, "GL_FLOAT", 0),
+                                       ("color", 4, "GL_UNSIGNED_BYTE", 12),
+                                       ("id", 1, "GL_INT", 16)]
+    assert attribute_layout(np.float32) == [(None, 1, "GL_FLOAT", 0)]
+    with pytest.raises(TypeError):
+        attribute_layout(np.dtype([("flag", np.bool_)]))
+
+
+
+# VertexArray.add_buffer
+def test_add_buffer_pointers():
+    gl = RecordingGL()
+    vertices = interleave(position=np.zeros((4, 3), dtype=np.float32), color=np.zeros((4, 4), dtype=np.uint8),
+                          id=np.zeros(4, dtype=np.int32))
+    vao = VertexArray(VertexBuffer(vertices, gl=gl), locations={"position": 0, "color": 3, "id": 5},
+                      normalized={"color"}, gl=gl)
+
+    assert vao.attributes == {"position": 0, "color": 3, "id": 5}
+    assert vao.next_location == 6
+    assert [args[0] for args in calls(gl, "glEnableVertexAttribArray")] == [0, 3, 5]
+    # (location, components, type, normalized, stride, offset)
+    float_pointers = [(location, components, gl_type, normalized, stride, pointer.value or 0)
+                      for location, components, gl_type, normalized, stride, pointer in calls(gl, "glVertexAttribPointer")]
+    assert float_pointers == [(0, 3, gl.GL_FLOAT, gl.GL_FALSE, 20, 0),
+                              (3, 4, gl.GL_UNSIGNED_BYTE, gl.GL_TRUE, 20, 12)]
+    # integer attribute without normalization -> passed as integer
+    (location, components, gl_type, stride, pointer), = calls(gl, "glVertexAttribIPointer")
+    assert (location, components, gl_type, stride, pointer.value) == (5, 1, gl.GL_INT, 20, 16)
+    assert not calls(gl, "glVertexAttribDivisor")
+
+def test_add_buffer_default_locations_continue():
+    gl = RecordingGL()
+    vao = VertexArray(VertexBuffer(interleave(position=np.zeros((2, 3), dtype=np.float32),
+                                              normal=np.zeros((2, 3), dtype=np.float32)), gl=gl), gl=gl)
+    added = vao.add_buffer(VertexBuffer(interleave(uv=np.zeros((2, 2), dtype=np.float32)), gl=gl))
+    assert vao.attributes == {"position": 0, "normal": 1, "uv": 2}
+    assert added == {"uv": 2}
+    assert vao.next_location == 3
+
+def test_add_buffer_plain_array():
+    gl = RecordingGL()
+    VertexArray(VertexBuffer(np.zeros((5, 2), dtype=np.float32), gl=gl), gl=gl)
+    (location, components, gl_type, _, stride, pointer), = calls(gl, "glVertexAttribPointer")
+    assert (location, components, gl_type, stride, pointer.value or 0) == (0, 2, gl.GL_FLOAT, 8, 0)
+
+
+
+# VertexBuffer.upload
+def test_upload_reuses_storage_when_shrinking():
+    gl = RecordingGL()
+    buffer = VertexBuffer(np.zeros(100, dtype=np.float32), gl=gl)
+    assert gl.count("glBufferData") == 1 and buffer.capacity == 400
+
+    gl.reset()
+    buffer.upload(np.ones(60, dtype=np.float32))
+    assert gl.count("glBufferData") == 0
+    (_, offset, nbytes, _), = calls(gl, "glBufferSubData")
+    assert (offset, nbytes) == (0, 240)
+    assert buffer.capacity == 400 and buffer.count == 60 and buffer.nbytes == 240
+    assert buffer.allocations == 1 and buffer.uploads == 1
+
+def test_upload_grows_storage_with_headroom():
+    gl = RecordingGL()
+    buffer = VertexBuffer(np.zeros(100, dtype=np.float32), gl=gl)
+    gl.reset()
+    buffer.upload(np.ones(120, dtype=np.float32))
+
+    # new storage without data, then the content
+    assert gl.names() == ["glBindBuffer", "glBufferData", "glBufferSubData"]
+    (_, capacity, data, _), = calls(gl, "glBufferData")
+    assert data is None and capacity == int(400 * GROWTH_FACTOR)
+    assert buffer.capacity == capacity and buffer.allocations == 2
+
+    # fits into the headroom -> no reallocation
+    gl.reset()
+    buffer.upload(np.ones(150, dtype=np.float32))
+    assert gl.count("glBufferData") == 0 and buffer.allocations == 2
+
+def test_upload_orphans_before_writing():
+    gl = RecordingGL()
+    buffer = VertexBuffer(np.zeros(100, dtype=np.float32), orphan=True, gl=gl)
+    gl.reset()
+    buffer.upload(np.ones(50, dtype=np.float32))
+    assert gl.names() == ["glBindBuffer", "glBufferData", "glBufferSubData"]
+    (_, capacity, data, _), = calls(gl, "glBufferData")
+    # same size, no data -> fresh memory, no new allocation counted
+    assert capacity == 400 and data is None
+    assert buffer.allocations == 1
+
+def test_update_in_place_and_bounds():
+    gl = RecordingGL()
+    buffer = VertexBuffer(np.zeros(10, dtype=np.float32), gl=gl)
+    gl.reset()
+    buffer.update(np.ones(2, dtype=np.float32), offset=3)
+    (_, offset, nbytes, _), = calls(gl, "glBufferSubData")
+    assert (offset, nbytes) == (12, 8)
+    with pytest.raises(ValueError):
+        buffer.update(np.ones(4, dtype=np.float32), offset=8)
@@ -0,0 +1,89 @@
+"""
+Tests of `windforge.gl.instancing` (instance packing and the instanced vertex array) with `RecordingGL`.
+"""
+
+import numpy as np
+import pytest
+
+from windforge.gl.buffer import interleave, VertexBuffer, IndexBuffer, VertexArray
+from windforge.gl.instancing import INSTANCE_DTYPE, InstancedMesh, pack_instances
+from windforge.gl.stub import RecordingGL
+
+
+
+def transforms(n):
+    rng = np.random.default_rng(1)
+    matrices = np.tile(np.eye(4, dtype=np.float32), (n, 1, 1))
+    matrices[:, :3, 3] = rng.random((n, 3)) * 100
+    return matrices
+
+def create_mesh(gl, **kwargs):
+    vertices = interleave(position=np.zeros((24, 3), dtype=np.float32), normal=np.zeros((24, 3), dtype=np.float32))
+    vao = VertexArray(VertexBuffer(vertices, gl=gl), index_buffer=IndexBuffer((np.arange(36) % 24).astype(np.uint16), gl=gl), gl=gl)
+    return InstancedMesh(vao, gl=gl, **kwargs)
+
+
+
+def test_pack_instances_column_major():
+    matrices = transforms(3)
+    instances = pack_instances(matrices, colors=(1, 0, 0, 1))
+    assert instances.dtype == INSTANCE_DTYPE
+    # column-major: translation in the 4th stored row (4th column of the shader's mat4)
+    assert np.allclose(instances["transform"][:, 3, :3], matrices[:, :3, 3])
+    assert np.allclose(instances["transform"], matrices.transpose(0, 2, 1))
+    assert np.allclose(instances["color"], (1, 0, 0, 1))
+
+def test_pack_instances_into_storage():
+    storage = np.zeros(8, dtype=INSTANCE_DTYPE)
+    instances = pack_instances(transforms(3), out=storage)
+    assert len(instances) == 3 and np.shares_memory(instances, storage)
+    assert np.allclose(storage["color"][:3], 1)
+    with pytest.raises(ValueError):
+        pack_instances(transforms(9), out=storage)
+    with pytest.raises(ValueError):
+        pack_instances(np.zeros((3, 3, 3)))
+
+def test_instance_attributes_one_location_per_column():
+    gl = RecordingGL()
+    mesh = create_mesh(gl)
+    vao = mesh.vertex_array
+    # position 0, normal 1 -> transform 2..5, color 6
+    assert vao.attributes == {"position": 0, "normal": 1, "transform": 2, "color": 6}
+    assert vao.next_location == 7
+
+    pointers = {args[0]: args for name, args in gl.calls if name == "glVertexAttribPointer"}
+    stride = INSTANCE_DTYPE.itemsize
+    for column in range(4):
+        location, components, gl_type, normalized, pointer_stride, pointer = pointers[2 + column]
+        assert (components, gl_type, normalized, pointer_stride) == (4, gl.GL_FLOAT, gl.GL_FALSE, stride)
+        assert (pointer.value or 0) == column * 16
+    assert pointers[6][1] == 4 and pointers[6][5].value == 64
+    # per instance: divisor 1 on the instance locations only
+    assert sorted((args[0], args[1]) for name, args in gl.calls if name == "glVertexAttribDivisor") == \
+        [(2, 1), (3, 1), (4, 1), (5, 1), (6, 1)]
+
+def test_instance_locations():
+    gl = RecordingGL()
+    mesh = create_mesh(gl, locations={"transform": 8, "color": 12})
+    assert {args[0] for name, args in gl.calls if name == "glVertexAttribDivisor"} == {8, 9, 10, 11, 12}
+    assert mesh.vertex_array.next_location == 13
+
+def test_one_instanced_draw_and_upload_per_change():
+    gl = RecordingGL()
+    mesh = create_mesh(gl, capacity=4)
+    mesh.set(transforms(10))
+    gl.reset()
+    mesh.draw()
+    mesh.draw()
+
+    draws = [args for name, args in gl.calls if name == "glDrawElementsInstanced"]
+    assert len(draws) == 2
+    _, count, index_type, _, instances = draws[0]
+    assert (count, index_type, instances) == (36, gl.GL_UNSIGNED_SHORT, 10)
+    # unchanged instances -> uploaded once
+    assert gl.count("glBufferSubData") == 1
+
+    mesh.clear()
+    mesh.add(np.eye(4), color=(0, 1, 0, 1))
+    assert mesh.size == 1
+    assert np.allclose(mesh.instances["color"][0], (0, 1, 0, 1))
@@ -0,0 +1,84 @@
+"""
+Tests of `windforge.gl.render_queue` with `RecordingGL`.
+"""
+
+import numpy as np
+import pytest
+
+from windforge.gl.render_queue import RenderQueue, pack_keys, depth_bits
+from windforge.gl.state import RenderState
+from windforge.gl.stub import RecordingGL
+
+
+
+def create_queue(**kwargs):
+    gl = RecordingGL()
+    return gl, RenderQueue(state=RenderState(gl=gl), **kwargs)
+
+def binds(gl):
+    return [(name, args[-1]) for name, args in gl.calls if name in ("glUseProgram", "glBindTexture")]
+
+
+
+def test_large_gl_names_get_dense_ids():
+    gl, queue = create_queue()
+    # names far above the 12/16 key bits
+    queue.submit(1, 3, program=70000, texture=1 << 20)
+    queue.submit(2, 3, program=5, texture=1 << 20)
+    queue.submit(3, 3, program=70000, texture=1 << 20)
+    assert queue.program_ids == {70000: 0, 5: 1}
+    assert queue.material_ids == {1 << 20: 0}
+
+    assert queue.flush() == {"items": 3, "batches": 2, "passes": 1}
+    assert binds(gl) == [("glUseProgram", 70000), ("glBindTexture", 1 << 20), ("glUseProgram", 5)]
+    # the ids only live until the flush
+    assert queue.program_ids == {} and queue.material_ids == {}
+
+def test_items_with_equal_state_get_batched():
+    gl, queue = create_queue()
+    for vertex_array, (program, texture) in enumerate([(7, 100), (8, 200), (7, 200), (7, 100), (8, 200)]):
+        queue.submit(vertex_array + 1, 3, program=program, texture=texture)
+    assert queue.flush()["batches"] == 3
+    assert gl.count("glUseProgram") == 2
+    assert gl.count("glDrawArrays") == 5
+
+def test_material_can_be_any_hashable():
+    gl, queue = create_queue()
+    queue.submit(1, 3, program=1, texture=4, material=("stone", 4))
+    queue.submit(2, 3, program=1, texture=4, material=("stone", 4))
+    assert queue.flush()["batches"] == 1
+
+def test_shared_material_binds_every_texture():
+    gl, queue = create_queue()
+    queue.submit(1, 3, program=1, texture=10, material="stone")
+    queue.submit(2, 3, program=1, texture=11, material="stone")
+    queue.submit(3, 3, program=1, texture=11, material="stone")
+    assert queue.flush()["batches"] == 1
+    # one batch, the texture still follows the items (repeated texture skipped)
+    assert binds(gl) == [("glUseProgram", 1), ("glBindTexture", 10), ("glBindTexture", 11)]
+
+def test_passes_and_depth_order():
+    gl, queue = create_queue(back_to_front=(1,))
+    queue.submit(1, 3, program=1, depth=5.0, pass_index=1)
+    queue.submit(2, 3, program=1, depth=1.0, pass_index=1)
+    queue.submit(3, 3, program=1, depth=5.0)
+    queue.submit(4, 3, program=1, depth=-1.0)
+    queue.flush()
+    order = [args[0] for name, args in gl.calls if name == "glBindVertexArray"]
+    # opaque front to back, then transparent far to near
+    assert order == [4, 3, 1, 2]
+
+def test_too_many_distinct_programs():
+    _, queue = create_queue()
+    for program in range(4097):
+        queue.submit(1, 3, program=program + 1)
+    with pytest.raises(ValueError):
+        queue.flush()
+
+def test_pack_keys_range_and_depth_order():
+    with pytest.raises(ValueError):
+        pack_keys([16], [0], [0], [0.0])
+    with pytest.raises(ValueError):
+        pack_keys([0], [4096], [0], [0.0])
+    depths = np.array([-3.0, -0.5, 0.0, 0.5, 2.0], dtype=np.float32)
+    assert np.all(np.diff(depth_bits(depths).astype(np.int64)) > 0)
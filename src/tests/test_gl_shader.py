@@ -0,0 +1,125 @@
+"""
+Tests of `windforge.gl.shader` (deduplication, binary cache, cached locations) with `RecordingGL`.
+"""
+
+import os
+
+from windforge.gl.shader import ShaderManager, ProgramBinaryCache, source_hash
+from windforge.gl.stub import RecordingGL
+
+
+
+VERTEX_SOURCE = "#version 330 core\nlayout(location = 0) in vec3 position;\nvoid main() { gl_Position = vec4(position, 1.0); }\n"
+FRAGMENT_SOURCE = "#version 330 core\nout vec4 color;\nvoid main() { color = vec4(1.0); }\n"
+BINARY_SIZE = 64
+
+
+
+def create_gl(driver=b"vendor", binary_accepted=True):
+    # driver with program binaries: links everything, accepts loaded binaries if `binary_accepted`
+    binary_programs = set()
+    def program_binary(program, binary_format, binary, length):
+        binary_programs.add(program)
+    def get_program(program, pname):
+        if pname.name == "GL_PROGRAM_BINARY_LENGTH":
+            return BINARY_SIZE
+        return binary_accepted if program in binary_programs else 1
+    def get_program_binary(program, size, length, binary_format, binary):
+        length[0] = size
+        binary_format[0] = 7
+        binary[:] = 0xAB
+    return RecordingGL(returns={
+        "glGetIntegerv": 1,
+        "glGetString": driver,
+        "glGetShaderiv": 1,
+        "glGetProgramiv": get_program,
+        "glProgramBinary": program_binary,
+        "glGetProgramBinary": get_program_binary,
+        "glGetUniformLocation": lambda program, name: len(name),
+        "glGetAttribLocation": lambda program, name: 0,
+    })
+
+
+
+def test_same_sources_share_one_program():
+    gl = create_gl()
+    shaders = ShaderManager(gl=gl)
+    first = shaders.get_program(VERTEX_SOURCE, FRAGMENT_SOURCE)
+    second = shaders.get_program(VERTEX_SOURCE, FRAGMENT_SOURCE)
+    other = shaders.get_program(VERTEX_SOURCE, FRAGMENT_SOURCE + "// other\n")
+
+    assert first is second and other is not first
+    assert (shaders.compiled, shaders.reused) == (2, 1)
+    assert gl.count("glLinkProgram") == 2
+    assert gl.count("glCompileShader") == 4
+
+def test_stage_is_part_of_the_hash():
+    assert source_hash(VERTEX_SOURCE, FRAGMENT_SOURCE) != source_hash(FRAGMENT_SOURCE, VERTEX_SOURCE)
+    assert source_hash(VERTEX_SOURCE, FRAGMENT_SOURCE) != source_hash(VERTEX_SOURCE, FRAGMENT_SOURCE, "")
+
+def test_binary_cache_skips_compiling(tmp_path):
+    ShaderManager(cache_dir=str(tmp_path), gl=create_gl()).get_program(VERTEX_SOURCE, FRAGMENT_SOURCE)
+
+    gl = create_gl()
+    shaders = ShaderManager(cache_dir=str(tmp_path), gl=gl)
+    shaders.get_program(VERTEX_SOURCE, FRAGMENT_SOURCE)
+    assert (shaders.loaded, shaders.compiled) == (1, 0)
+    assert gl.count("glCompileShader") == 0
+    (_, binary_format, binary, length), = [args for name, args in gl.calls if name == "glProgramBinary"]
+    assert binary_format == 7 and length == BINARY_SIZE and bytes(binary) == b"\xab" * BINARY_SIZE
+
+def test_other_driver_invalidates_the_cache(tmp_path):
+    ShaderManager(cache_dir=str(tmp_path), gl=create_gl(driver=b"driver 1")).get_program(VERTEX_SOURCE, FRAGMENT_SOURCE)
+    assert len(os.listdir(tmp_path)) == 2
+
+    gl = create_gl(driver=b"driver 2")
+    shaders = ShaderManager(cache_dir=str(tmp_path), gl=gl)
+    # old binaries removed before anything gets loaded
+    assert shaders.cache.entries == {}
+    assert os.listdir(tmp_path) == ["index.json"]
+    shaders.get_program(VERTEX_SOURCE, FRAGMENT_SOURCE)
+    assert (shaders.loaded, shaders.compiled) == (0, 1)
+    assert gl.count("glProgramBinary") == 0
+
+def test_rejected_binary_falls_back_to_compiling(tmp_path):
+    ShaderManager(cache_dir=str(tmp_path), gl=create_gl()).get_program(VERTEX_SOURCE, FRAGMENT_SOURCE)
+
+    gl = create_gl(binary_accepted=0)
+    shaders = ShaderManager(cache_dir=str(tmp_path), gl=gl)
+    program = shaders.get_program(VERTEX_SOURCE, FRAGMENT_SOURCE)
+    assert (shaders.loaded, shaders.compiled) == (0, 1)
+    assert gl.count("glProgramBinary") == 1
+    # rejected program deleted, compiled one is used and stored again
+    (deleted,), = [args for name, args in gl.calls if name == "glDeleteProgram"]
+    assert deleted != program.id
+    assert gl.count("glGetProgramBinary") == 1
+
+def test_corrupt_binary_file_falls_back_to_compiling(tmp_path):
+    ShaderManager(cache_dir=str(tmp_path), gl=create_gl()).get_program(VERTEX_SOURCE, FRAGMENT_SOURCE)
+    binary_file, = [name for name in os.listdir(tmp_path) if name.endswith(".bin")]
+    with open(tmp_path / binary_file, "wb") as file:
+        file.write(b"\0" * 3)
+
+    gl = create_gl()
+    shaders = ShaderManager(cache_dir=str(tmp_path), gl=gl)
+    shaders.get_program(VERTEX_SOURCE, FRAGMENT_SOURCE)
+    assert (shaders.loaded, shaders.compiled) == (0, 1)
+    assert gl.count("glProgramBinary") == 0
+    # compiled program replaces the corrupt entry
+    program_hash = source_hash(VERTEX_SOURCE, FRAGMENT_SOURCE)
+    assert ProgramBinaryCache(str(tmp_path), shaders.driver_string()).get(program_hash) == (7, b"\xab" * BINARY_SIZE)
+
+def test_locations_are_queried_once():
+    gl = create_gl()
+    program = ShaderManager(gl=gl).get_program(VERTEX_SOURCE, FRAGMENT_SOURCE)
+    for _ in range(3):
+        assert program.uniform("u_mvp") == 5
+        assert program.uniform("u_color") == 7
+        assert program.attribute("position") == 0
+    assert gl.count("glGetUniformLocation") == 2
+    assert gl.count("glGetAttribLocation") == 1
+
+    # another program has its own locations
+    other = ShaderManager(gl=gl).get_program(VERTEX_SOURCE, FRAGMENT_SOURCE)
+    other.uniform("u_mvp")
+    assert gl.count("glGetUniformLocation") == 3
@@ -0,0 +1,89 @@
+"""
+Tests of `windforge.gl.state.RenderState` with `RecordingGL`.
+"""
+
+from windforge.gl.state import RenderState
+from windforge.gl.stub import RecordingGL
+
+
+
+def test_redundant_binds_are_skipped_and_counted():
+    gl = RecordingGL()
+    state = RenderState(gl=gl)
+    for _ in range(3):
+        state.use_program(5)
+        state.bind_vertex_array(2)
+    state.use_program(6)
+
+    assert gl.names() == ["glUseProgram", "glBindVertexArray", "glUseProgram"]
+    assert (state.issued, state.skipped) == (3, 4)
+
+def test_texture_binds_per_unit():
+    gl = RecordingGL()
+    state = RenderState(gl=gl)
+    state.bind_texture(0, 10)
+    state.bind_texture(1, 11)
+    state.bind_texture(0, 10)
+    state.bind_texture(1, 11)
+    # unit 1 still active -> only the bind
+    state.bind_texture(1, 12)
+
+    assert gl.names() == ["glActiveTexture", "glBindTexture", "glActiveTexture", "glBindTexture", "glBindTexture"]
+    assert [args[0] for name, args in gl.calls if name == "glActiveTexture"] == [gl.GL_TEXTURE0, gl.GL_TEXTURE0 + 1]
+    # two skipped binds + the skipped unit switch of the last bind
+    assert (state.issued, state.skipped) == (5, 3)
+
+def test_redundant_enables_are_skipped():
+    gl = RecordingGL()
+    state = RenderState(gl=gl)
+    state.set_depth_test(True)
+    state.set_depth_test(True)
+    state.set_blend(True)
+    state.set_blend(True)
+    state.set_blend(False)
+    state.set_blend(False)
+    state.set_depth_mask(False)
+    state.set_depth_mask(False)
+    state.viewport(0, 0, 640, 480)
+    state.viewport(0, 0, 640, 480)
+
+    assert gl.names() == ["glEnable", "glDepthFunc", "glEnable", "glBlendFunc", "glDisable", "glDepthMask", "glViewport"]
+    assert [args for name, args in gl.calls if name in ("glEnable", "glDisable")] == [(gl.GL_DEPTH_TEST,), (gl.GL_BLEND,), (gl.GL_BLEND,)]
+    assert state.issued == 7
+    # second set_depth_test/set_blend(True): capability and function skipped
+    assert state.skipped == 2 + 2 + 1 + 1 + 1
+
+def test_end_frame_resets_the_frame_counters():
+    state = RenderState(gl=RecordingGL())
+    state.use_program(1)
+    state.use_program(1)
+    assert state.end_frame() == {"issued": 1, "skipped": 1}
+    assert (state.issued, state.skipped) == (0, 0)
+
+    # state stays shadowed across frames
+    state.use_program(1)
+    state.bind_vertex_array(3)
+    assert state.end_frame() == {"issued": 1, "skipped": 1}
+    assert state.end_frame() == {"issued": 0, "skipped": 0}
+
+    stats = state.get_stats()
+    assert stats["frame"] == {"issued": 0, "skipped": 0}
+    assert (stats["total_issued"], stats["total_skipped"]) == (2, 2)
+
+def test_invalidate_forces_the_next_call():
+    gl = RecordingGL()
+    state = RenderState(gl=gl)
+    state.use_program(1)
+    state.bind_vertex_array(2)
+    state.bind_texture(0, 3)
+    state.set_capability("GL_CULL_FACE", True)
+    gl.reset()
+
+    # e.g. another library changed the GL state
+    state.invalidate()
+    state.use_program(1)
+    state.bind_vertex_array(2)
+    state.bind_texture(0, 3)
+    state.set_capability("GL_CULL_FACE", True)
+    assert gl.names() == ["glUseProgram", "glBindVertexArray", "glActiveTexture", "glBindTexture", "glEnable"]
+    assert state.skipped == 0
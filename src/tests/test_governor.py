@@ -0,0 +1,164 @@
+"""
+Tests of `windforge.time.FrameRateGovernor` (with explicit times) and of the
+frame rate governor in `windforge.GraphicsApplication`.
+"""
+
+import pytest
+
+import windforge as wf
+from windforge.time import FrameRateGovernor, GovernorMode
+from windforge.window import WindowLib, Event, EventType
+from windforge.gl.state import RenderState
+from windforge.gl.stub import RecordingGL
+
+
+
+class FixedGovernor(object):
+    # duck-typed `FrameRateGovernor`: keeps the rate, renders as told
+    def __init__(self, renders):
+        self.renders = list(renders)
+        self.active = []
+
+    def update(self, goal_fps, work_time, has_input=False, is_active=True):
+        self.active += [is_active]
+        return goal_fps
+
+    def should_render(self):
+        return self.renders.pop(0)
+
+class GovernedApp(wf.GraphicsApplication):
+    def initialize(self):
+        self.render_state = RenderState(gl=RecordingGL())
+        self.window.render_state = self.render_state
+        self.frame = 0
+
+    def process_input(self):
+        pass
+
+    def update(self, dt=None):
+        # one new program per frame -> one issued call
+        self.frame += 1
+        self.render_state.use_program(self.frame)
+
+def run_frames(app, n):
+    app.initialize()
+    for _ in range(n):
+        app.run_frame()
+
+
+
+def test_mouse_leaving_the_window_keeps_it_active():
+    frames = [[Event(EventType.WINDOW_ACCESS, is_accessed=False)], [Event(EventType.WINDOW_ACTIVATION, is_active=False)]]
+    governor = FixedGovernor([True, True])
+    app = GovernedApp(background_lib=WindowLib.HEADLESS, goal_fps=None, event_source=frames, governor=governor)
+    run_frames(app, 2)
+    assert governor.active == [True, False]
+
+def test_skipped_render_closes_the_frame():
+    governor = FixedGovernor([True, False, False, True])
+    app = GovernedApp(background_lib=WindowLib.HEADLESS, goal_fps=None, event_source=[[]] * 4, governor=governor)
+    app.initialize()
+    for _ in range(4):
+        app.run_frame()
+        # every frame closed with only its own call, also without buffer swap
+        assert app.render_state.last_frame == {"issued": 1, "skipped": 0}
+        assert app.render_state.issued == 0
+    assert app.render_state.total_issued == 4
+
+
+
+def governor(**kwargs):
+    # backoff_frames=1 -> the smoothed frame time is the last one and every frame may step
+    kwargs.setdefault("backoff_frames", 1)
+    governor = FrameRateGovernor(**kwargs)
+    governor.notify_input(now=0.0)
+    return governor
+
+def test_backoff_steps_the_divisor():
+    gov = governor(idle_timeout=None)
+    assert gov.update(60, 0.010, now=0.1) == 60
+    assert gov.mode == GovernorMode.FULL
+
+    # over the 60 fps budget -> 30, over the 30 fps budget -> 20
+    assert gov.update(60, 0.025, now=0.2) == pytest.approx(30)
+    assert gov.mode == GovernorMode.BACKOFF and gov.divisor == 2
+    assert gov.update(60, 0.045, now=0.3) == pytest.approx(20)
+    # limited by max_backoff
+    assert gov.update(60, 0.100, now=0.4) == pytest.approx(15)
+    assert gov.update(60, 0.100, now=0.5) == pytest.approx(15)
+    assert gov.divisor == 4
+
+    # the smallest divisor which fits the frame time in one step
+    gov = governor(idle_timeout=None)
+    assert gov.update(60, 0.040, now=0.1) == pytest.approx(20)
+
+def test_backoff_waits_backoff_frames_between_steps():
+    gov = governor(idle_timeout=None, backoff_frames=3)
+    work_times = [0.025, 0.025, 0.025, 0.045, 0.045, 0.045]
+    rates = [gov.update(60, work_time, now=0.1 * frame) for frame, work_time in enumerate(work_times, 1)]
+    # smoothed over 3 frames: the first step after 3 frames, the next one 3 frames later
+    # although the smoothed frame time exceeds the 30 fps budget already in frame 5
+    assert rates == pytest.approx([60, 60, 30, 30, 30, 20])
+
+def test_recover_headroom_hysteresis():
+    gov = governor(idle_timeout=None, recover_headroom=0.8)
+    gov.update(60, 0.025, now=0.1)
+    assert gov.divisor == 2
+
+    # fits the 60 fps budget, but not with 20 % headroom -> stays at 30
+    assert gov.update(60, 0.015, now=0.2) == pytest.approx(30)
+    assert gov.update(60, 0.015, now=0.3) == pytest.approx(30)
+    # below 0.8 / 60 -> back to the full rate
+    assert gov.update(60, 0.013, now=0.4) == 60
+    assert gov.mode == GovernorMode.FULL and gov.divisor == 1
+
+def test_idle_timeout_renders_once_then_on_demand():
+    gov = governor(idle_timeout=10.0, idle_fps=20)
+    assert gov.update(60, 0.001, now=5.0) == 60
+    assert gov.should_render()
+
+    gov.redraw_requested = False
+    assert gov.update(60, 0.001, now=10.0) == 20
+    assert gov.mode == GovernorMode.IDLE
+    # entering the idle mode presents the last state once more
+    assert gov.should_render()
+    assert not gov.should_render()
+    assert gov.update(60, 0.001, now=11.0) == 20
+    assert not gov.should_render()
+
+    gov.request_redraw()
+    assert gov.should_render()
+    assert not gov.should_render()
+
+    # never faster than the goal, unlimited goal -> idle_fps
+    assert gov.update(10, 0.001, now=12.0) == 10
+    assert gov.update(None, 0.001, now=13.0) == 20
+
+def test_input_restores_the_rate():
+    gov = governor(idle_timeout=10.0, idle_fps=20)
+    gov.update(60, 0.001, now=20.0)
+    assert gov.mode == GovernorMode.IDLE
+
+    assert gov.update(60, 0.001, has_input=True, now=20.5) == 60
+    assert gov.mode == GovernorMode.FULL
+    assert gov.should_render()
+    # the idle timeout starts again with the input
+    assert gov.update(60, 0.001, now=30.0) == 60
+    assert gov.update(60, 0.001, now=30.5) == 20
+
+    # with back-off the input restores the back-off rate
+    gov = governor(idle_timeout=10.0, idle_fps=20)
+    gov.update(60, 0.025, now=1.0)
+    assert gov.update(60, 0.025, now=11.0) == 20
+    assert gov.update(60, 0.025, has_input=True, now=12.0) == pytest.approx(30)
+    assert gov.mode == GovernorMode.BACKOFF
+
+def test_inactive_window():
+    gov = governor(idle_timeout=10.0, inactive_fps=10)
+    assert gov.update(60, 0.001, is_active=False, now=1.0) == 10
+    assert gov.mode == GovernorMode.INACTIVE
+    assert gov.update(5, 0.001, is_active=False, now=1.1) == 5
+    assert gov.update(None, 0.001, is_active=False, now=1.2) == 10
+    # inactive before idle
+    assert gov.update(60, 0.001, is_active=False, now=20.0) == 10
+    assert gov.update(60, 0.001, has_input=True, now=20.1) == 60
@@ -0,0 +1,95 @@
+"""
+Tests of the key and button state of `windforge.window.InputState`.
+"""
+
+import pytest
+
+from windforge.window import (InputState, Controller, EventType, Key, MouseButton, ControllerButton,
+                              KeyEvent, MouseEvent, ControllerButtonEvent)
+
+
+
+def key(event_type, key_member=Key.A):
+    return KeyEvent(event_type, key=key_member)
+
+def test_press_and_release_edges():
+    state = InputState()
+    state.update([key(EventType.KEY_DOWN)])
+    assert state.is_down(Key.A)
+    assert state.was_pressed_this_frame(Key.A)
+    assert not state.was_released_this_frame(Key.A)
+
+    # held -> no new edge
+    state.update([])
+    assert state.is_down(Key.A)
+    assert not state.was_pressed_this_frame(Key.A)
+
+    state.update([key(EventType.KEY_UP)])
+    assert not state.is_down(Key.A)
+    assert state.was_released_this_frame(Key.A)
+    assert not state.was_pressed_this_frame(Key.A)
+
+    state.update([])
+    assert not state.was_released_this_frame(Key.A)
+
+def test_tap_within_one_frame_reports_both_edges():
+    state = InputState()
+    state.update([key(EventType.KEY_DOWN), key(EventType.KEY_UP)])
+    assert not state.is_down(Key.A)
+    assert state.was_pressed_this_frame(Key.A)
+    assert state.was_released_this_frame(Key.A)
+
+    state.update([])
+    assert not state.was_pressed_this_frame(Key.A)
+    assert not state.was_released_this_frame(Key.A)
+
+def test_key_repeat_is_no_new_press():
+    state = InputState()
+    state.update([key(EventType.KEY_DOWN)])
+    state.update([key(EventType.KEY_DOWN)])
+    assert state.is_down(Key.A)
+    assert not state.was_pressed_this_frame(Key.A)
+
+def test_mouse_button_tap():
+    state = InputState()
+    state.update([MouseEvent(EventType.MOUSE_DOWN, mouse_button=MouseButton.LEFT),
+                  MouseEvent(EventType.MOUSE_UP, mouse_button=MouseButton.LEFT)])
+    assert state.was_pressed_this_frame(MouseButton.LEFT)
+    assert state.was_released_this_frame(MouseButton.LEFT)
+    assert not state.is_down(MouseButton.LEFT)
+    assert not state.was_pressed_this_frame(MouseButton.RIGHT)
+
+def test_controller_button_tap():
+    state = InputState(controllers={0: Controller(0)})
+    state.update([ControllerButtonEvent(EventType.CONTROLLER_BUTTON_DOWN, controller_id=0, controller_button=ControllerButton.A),
+                  ControllerButtonEvent(EventType.CONTROLLER_BUTTON_UP, controller_id=0, controller_button=ControllerButton.A)])
+    assert state.was_pressed_this_frame(ControllerButton.A, controller_id=0)
+    assert state.was_released_this_frame(ControllerButton.A, controller_id=0)
+    assert not state.is_down(ControllerButton.A, controller_id=0)
+
+    state.update([])
+    assert not state.was_pressed_this_frame(ControllerButton.A, controller_id=0)
+    # unknown controller
+    assert not state.was_pressed_this_frame(ControllerButton.A, controller_id=3)
+
+def test_keys_mapping_writes_through():
+    state = InputState()
+    state.keys[Key.B] = True
+    assert state.is_down(Key.B)
+    assert state.keys[Key.B] is True
+    assert state.was_pressed_this_frame(Key.B)
+    assert Key.B in state.get_all_active()["keys"]
+
+    state.mouse_buttons[MouseButton.RIGHT] = True
+    assert state.mouse_buttons[MouseButton.RIGHT] is True
+    assert dict(state.keys)[Key.A] is False
+    assert len(state.keys) == len(Key)
+
+    with pytest.raises(KeyError):
+        state.keys[MouseButton.LEFT] = True
+    with pytest.raises(ValueError):
+        state.set_button(ControllerButton.A, True)
+
+def test_unknown_input_type_raises():
+    with pytest.raises(ValueError):
+        InputState().is_down("A")
@@ -0,0 +1,89 @@
+"""
+Tests of `windforge.window.InputPollingThread` and the joystick hand-over of the GLFW backend.
+"""
+
+import threading
+from collections import deque
+
+import numpy as np
+
+from windforge.window import InputPollingThread, GlfwBackend, ControllerEvent, EventType
+
+
+
+def test_poll_error_skips_the_sample_and_keeps_sampling():
+    calls = []
+    done = threading.Event()
+
+    def poll(events):
+        calls.append(len(calls))
+        if len(calls) == 1:
+            raise RuntimeError("device gone")
+        events.append(ControllerEvent(EventType.CONTROLLER_ADDED, controller_id=len(calls)))
+        if len(calls) >= 3:
+            done.set()
+
+    thread = InputPollingThread(poll, rate=1000)
+    thread.start()
+    try:
+        assert done.wait(2.0)
+        assert thread.is_running()
+    finally:
+        thread.stop()
+
+    events = []
+    thread.drain(events)
+    assert thread.errors == 1
+    assert [event.controller_id for event in events][:2] == [2, 3]
+    assert all(event.timestamp is not None for event in events)
+
+
+
+def _joystick_backend(states):
+    # only the joystick state of the backend, no window
+    backend = GlfwBackend.__new__(GlfwBackend)
+    backend.print_missed_events = False
+    backend._joystick_prev = {}
+    backend._joysticks_present = set()
+    backend._joystick_changes = deque()
+    backend._glfw_lock = threading.Lock()
+    backend._read_joystick = lambda cid: states[cid]
+    return backend
+
+def test_joystick_changes_are_applied_by_the_reader():
+    state = {"axes": np.zeros(2, dtype=np.float32), "buttons": np.zeros(4, dtype=np.uint8),
+             "hats": np.zeros(1, dtype=np.uint8)}
+    backend = _joystick_backend({0: state, 1: state})
+
+    # joystick callback (main thread) only queues the change
+    backend._joystick_changes.extend([(0, True), (1, True)])
+    assert not backend._joysticks_present
+
+    events = []
+    backend._poll_joysticks(events)
+    assert [(event.type, event.controller_id) for event in events] == [(EventType.CONTROLLER_ADDED, 0),
+                                                                        (EventType.CONTROLLER_ADDED, 1)]
+    assert not backend._joystick_changes
+
+    backend._joystick_changes.append((0, False))
+    events = []
+    backend._poll_joysticks(events)
+    assert [(event.type, event.controller_id) for event in events] == [(EventType.CONTROLLER_REMOVED, 0)]
+    assert backend._joysticks_present == {1}
+    assert set(backend._joystick_prev) == {1}
+
+def test_joystick_reads_hold_the_glfw_lock():
+    state = {"axes": np.zeros(2, dtype=np.float32), "buttons": np.zeros(4, dtype=np.uint8),
+             "hats": np.zeros(1, dtype=np.uint8)}
+    locked = []
+
+    def read(cid):
+        locked.append(backend._glfw_lock.locked())
+        return state
+
+    backend = _joystick_backend({})
+    backend._read_joystick = read
+    backend._joystick_changes.extend([(0, True), (1, True)])
+    backend._poll_joysticks([])
+    assert locked == [True, True]
+    assert not backend._glfw_lock.locked()
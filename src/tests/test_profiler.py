@@ -0,0 +1,66 @@
+"""
+Tests of `windforge.profiler.Profiler`.
+"""
+
+import pytest
+
+from windforge.profiler import Profiler
+
+
+
+def test_begin_end_and_profiled_record_zones():
+    profiler = Profiler(enabled=True)
+
+    @profiler.profiled("work")
+    def work(value):
+        return value * 2
+
+    assert work(3) == 6
+    profiler.begin("outer")
+    work(1)
+    profiler.end("outer")
+
+    stats = profiler.get_stats()
+    assert stats["work"]["count"] == 2
+    assert stats["outer"]["count"] == 1
+
+def test_profiled_closes_the_zone_on_exceptions():
+    profiler = Profiler(enabled=True)
+
+    @profiler.profiled()
+    def fail():
+        raise RuntimeError("fail")
+
+    with pytest.raises(RuntimeError):
+        fail()
+    starts, ends, _ = profiler.get_zones()
+    assert len(starts) == 1 and ends[0] >= starts[0]
+
+def test_records_stay_bounded():
+    profiler = Profiler(enabled=True, capacity=8)
+
+    @profiler.profiled("decorated")
+    def decorated():
+        pass
+
+    for _ in range(100):
+        decorated()
+        profiler.begin("zone")
+        profiler.end("zone")
+        with profiler.zone("with"):
+            pass
+    assert len(profiler._records) <= 4 * 8 + 4
+    # the newest zones are kept
+    assert profiler.get_stats()["with"]["count"] >= 1
+
+def test_disabled_records_nothing():
+    profiler = Profiler()
+
+    @profiler.profiled("decorated")
+    def decorated():
+        return 1
+
+    assert decorated() == 1
+    profiler.begin("zone")
+    profiler.end("zone")
+    assert profiler.get_zones()[0].size == 0
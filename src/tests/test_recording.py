@@ -0,0 +1,122 @@
+"""
+Tests of the input recording: event encoding and deterministic replay.
+"""
+
+import pytest
+
+import windforge as wf
+from windforge.window import (Event, EventType, Key, MouseButton, ControllerButton, ControllerAxis,
+                              DpadState, WindowLib)
+from windforge.recording import EVENT_STRUCT, encode_event, decode_event, InputReplay
+
+
+
+# one event with every field of its type set
+EVENTS = {
+    EventType.WINDOW_MOVE: Event(EventType.WINDOW_MOVE, window_position=(10, 20)),
+    EventType.WINDOW_RESIZE: Event(EventType.WINDOW_RESIZE, window_size=(640, 480)),
+    EventType.WINDOW_ACCESS: Event(EventType.WINDOW_ACCESS, is_accessed=True),
+    EventType.WINDOW_ACTIVATION: Event(EventType.WINDOW_ACTIVATION, is_active=False),
+    EventType.QUIT: Event(EventType.QUIT),
+    EventType.KEY_DOWN: Event(EventType.KEY_DOWN, key=Key.A),
+    EventType.KEY_UP: Event(EventType.KEY_UP, key=Key.ESC),
+    EventType.MOUSE_MOVE: Event(EventType.MOUSE_MOVE, mouse_pos=(5, 6), mouse_rel=(-1, 2)),
+    EventType.MOUSE_DOWN: Event(EventType.MOUSE_DOWN, mouse_pos=(7, 8), mouse_button=MouseButton.LEFT),
+    EventType.MOUSE_UP: Event(EventType.MOUSE_UP, mouse_pos=(9, 10), mouse_button=MouseButton.RIGHT),
+    EventType.MOUSE_WHEEL: Event(EventType.MOUSE_WHEEL, mouse_scroll=(0, -1), mouse_scroll_precise=(0.0, -1.5)),
+    EventType.CONTROLLER_ADDED: Event(EventType.CONTROLLER_ADDED, controller_id=0),
+    EventType.CONTROLLER_REMOVED: Event(EventType.CONTROLLER_REMOVED, controller_id=3),
+    EventType.CONTROLLER_BUTTON_DOWN: Event(EventType.CONTROLLER_BUTTON_DOWN, controller_id=1,
+                                            controller_button=ControllerButton.A, controller_dpad=DpadState.NEUTRAL),
+    EventType.CONTROLLER_BUTTON_UP: Event(EventType.CONTROLLER_BUTTON_UP, controller_id=1,
+                                          controller_button=ControllerButton.DPAD, controller_dpad=DpadState.UP),
+    EventType.CONTROLLER_AXIS_MOVE: Event(EventType.CONTROLLER_AXIS_MOVE, controller_id=2,
+                                          axis=ControllerAxis.LEFT_STICK_X, axis_value=-0.25),
+}
+
+
+
+def round_trip(event):
+    return decode_event(*EVENT_STRUCT.unpack(encode_event(event)))
+
+def test_every_event_type_covered():
+    assert set(EVENTS) == set(EventType)
+
+def test_encode_decode_round_trip():
+    for event in EVENTS.values():
+        decoded = round_trip(event)
+        assert type(decoded) is type(event)
+        assert decoded.as_dict() == event.as_dict()
+
+def test_round_trip_of_unset_fields():
+    for event_type in EventType:
+        assert round_trip(Event(event_type)).type is event_type
+
+
+
+TRACKED = (Key.A, Key.B, MouseButton.LEFT)
+
+class RecordedApp(wf.GraphicsApplication):
+    def initialize(self):
+        self.update_deltas = []
+        self.input_frames = []
+
+    def process_input(self):
+        pass
+
+    def update(self, dt=None):
+        self.update_deltas += [self.delta_time]
+        # (held, pressed, released) per tracked input + mouse position
+        state = self.window.input_state
+        self.input_frames += [(tuple((state.is_down(button), state.was_pressed_this_frame(button),
+                                      state.was_released_this_frame(button)) for button in TRACKED),
+                               state.mouse_position)]
+
+def frames():
+    return [[Event(EventType.KEY_DOWN, key=Key.A)],
+            [],
+            [EVENTS[EventType.MOUSE_MOVE], Event(EventType.KEY_DOWN, key=Key.B), Event(EventType.KEY_UP, key=Key.B)],
+            [Event(EventType.MOUSE_DOWN, mouse_pos=(1, 1), mouse_button=MouseButton.LEFT)],
+            [Event(EventType.KEY_UP, key=Key.A), Event(EventType.MOUSE_UP, mouse_pos=(2, 2), mouse_button=MouseButton.LEFT)],
+            []]
+
+def run_frames(app, n):
+    app.initialize()
+    for _ in range(n):
+        app.run_frame()
+
+def test_replay_uses_recorded_deltas(tmp_path):
+    path = str(tmp_path / "session.wfinput")
+    recorded = RecordedApp(background_lib=WindowLib.HEADLESS, goal_fps=None, event_source=frames(), record_input=path)
+    run_frames(recorded, len(frames()))
+    recorded.recorder.close()
+
+    replay = InputReplay(path)
+    recorded_deltas = [frame_time for _, frame_time in replay.frames()]
+    assert len(recorded_deltas) == len(frames())
+
+    replayed = RecordedApp(background_lib=WindowLib.HEADLESS, goal_fps=None, event_source=replay)
+    run_frames(replayed, len(frames()))
+    assert replayed.update_deltas == recorded.update_deltas
+    assert replayed.delta_time == recorded_deltas[-1]
+    # the same input transitions in every frame
+    assert replayed.input_frames == recorded.input_frames
+    assert recorded.input_frames[2][0][1] == (False, True, True)
+
+class CrashingApp(RecordedApp):
+    def update(self, dt=None):
+        super().update(dt)
+        if len(self.update_deltas) == 3:
+            raise RuntimeError("crash")
+
+def test_recording_survives_a_crash(tmp_path):
+    path = str(tmp_path / "crash.wfinput")
+    app = CrashingApp(background_lib=WindowLib.HEADLESS, goal_fps=None, event_source=frames(), record_input=path)
+    with pytest.raises(RuntimeError):
+        app.run()
+
+    # two finished frames + the crashed one with its events
+    recorded = list(InputReplay(path).frames())
+    assert len(recorded) == 3
+    assert [[event.type for event in events] for events, _ in recorded] == \
+        [[event.type for event in events] for events in frames()[:3]]
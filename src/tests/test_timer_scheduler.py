@@ -0,0 +1,61 @@
+"""
+Tests of `windforge.time.TimerScheduler`.
+"""
+
+from windforge.time import TimerScheduler
+
+
+
+def test_one_shot_cancelled_by_earlier_callback():
+    scheduler = TimerScheduler(now=0.0)
+    calls = []
+    b = scheduler.schedule(call_func=lambda: calls.append("b"), seconds_to_wait=0.2)
+    scheduler.schedule(call_func=lambda: (calls.append("a"), b.cancel()), seconds_to_wait=0.1)
+
+    assert scheduler.tick(1.0) == 1
+    assert calls == ["a"]
+    assert not b.active
+    assert len(scheduler) == 0
+
+def test_repeating_cancelled_by_earlier_callback():
+    scheduler = TimerScheduler(now=0.0)
+    calls = []
+    b = scheduler.schedule(call_func=lambda: calls.append("b"), seconds_to_wait=0.2, repeat=True)
+    scheduler.schedule(call_func=lambda: (calls.append("a"), b.cancel()), seconds_to_wait=0.1)
+
+    scheduler.tick(1.0)
+    for step in range(2, 6):
+        scheduler.tick(float(step))
+    assert calls == ["a"]
+    assert not b.active
+    assert len(scheduler) == 0
+
+def test_rescheduled_by_earlier_callback_waits_again():
+    scheduler = TimerScheduler(now=0.0)
+    calls = []
+    b = scheduler.schedule(call_func=lambda: calls.append("b"), seconds_to_wait=0.2)
+    scheduler.schedule(call_func=lambda: b.reschedule(seconds_to_wait=0.5), seconds_to_wait=0.1)
+
+    scheduler.tick(0.3)
+    assert calls == []
+    scheduler.tick(0.9)
+    assert calls == ["b"]
+    assert len(scheduler) == 0
+
+def test_due_timers_fire_in_deadline_order():
+    scheduler = TimerScheduler(now=0.0)
+    calls = []
+    scheduler.schedule(call_func=lambda: calls.append("frames"), frames_to_wait=1)
+    scheduler.schedule(call_func=lambda: calls.append("late"), seconds_to_wait=0.5)
+    scheduler.schedule(call_func=lambda: calls.append("early"), seconds_to_wait=0.1)
+
+    assert scheduler.tick(1.0) == 3
+    assert calls == ["early", "late", "frames"]
+
+def test_repeating_timer_fires_once_per_tick():
+    scheduler = TimerScheduler(now=0.0)
+    timer = scheduler.schedule(seconds_to_wait=0.1, repeat=True)
+    scheduler.tick(1.0)
+    assert timer.calls == 1
+    assert timer.active
+    assert len(scheduler) == 1
@@ -3,6 +3,9 @@ from .graphics_application import GraphicsApplication
 # expose submodules
 from . import window
 from . import time
+from . import recording
+from . import profiler
+from . import gl
 
 # # or direct import them
 # from .window import Window, EventType, Key, MouseButton, ControllerButton, ControllerAxis, WindowLib
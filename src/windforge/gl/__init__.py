@@ -0,0 +1,60 @@
+"""
+OpenGL helpers of the Wind-Forge Engine.
+
+PyOpenGL is only imported when a GL object gets created without an
+explicit `gl` module, so importing `windforge` stays free of OpenGL.
+Every class takes an optional `gl` argument: the `OpenGL.GL` module
+(default) or any object with the same functions and constants, for
+example the `RecordingGL` stub which records the calls without a GPU.
+
+Provides:
+- `get_gl()`: The `OpenGL.GL` module (imported on first use).
+- `batching`: Static batching, meshes of one material merged into one buffer at load time.
+- `buffer`: NumPy vertex/index buffers, interleaved attributes and vertex arrays.
+- `instancing`: `InstancedMesh`, all instances of a mesh in one instanced draw call.
+- `render_queue`: `RenderQueue`, draw items sorted by a packed state key before submission.
+- `shader`: Shader programs with deduplication, cached locations and a program binary disk cache.
+- `state`: `RenderState`, a render-state cache which skips redundant GL state changes.
+- `stub`: `RecordingGL`, a GL stub recording every call (headless tests and benchmarks).
+"""
+
+# -------------------------------
+#        >>> Imports <<<
+# -------------------------------
+import importlib
+
+
+
+# -------------------------------
+#       >>> Functions <<<
+# -------------------------------
+_gl = None
+
+def get_gl():
+    """
+    Get the `OpenGL.GL` module (imported on the first call).
+
+    Returns:
+        module: `OpenGL.GL`.
+
+    Raises:
+        ImportError: If PyOpenGL is not installed.
+    """
+    global _gl
+    if _gl is None:
+        try:
+            _gl = importlib.import_module("OpenGL.GL")
+        except ImportError as error:
+            raise ImportError("windforge.gl needs PyOpenGL (pip install PyOpenGL).") from error
+    return _gl
+
+
+
+# expose submodules
+from . import stub
+from . import buffer
+from . import shader
+from . import state
+from . import render_queue
+from . import instancing
+from . import batching
@@ -0,0 +1,247 @@
+"""
+Static batching: merge static meshes which share a material.
+
+Static geometry (level, props which never move) drawn mesh by mesh
+costs one draw call and one vertex array bind per mesh. At load time
+`StaticBatcher` merges all meshes with the same material into one
+vertex buffer and one index buffer: the vertices get transformed into
+world space, concatenated, and the indices rebased by the vertex
+offset of their mesh. Then one `glDrawElements` draws the whole
+material.
+
+The merging is pure NumPy (`merge_meshes`, `StaticBatcher.merge`) and
+runs without GPU; `build` creates the GL buffers.
+
+Typical usage:
+    batcher = StaticBatcher()
+    for prop in level.props:
+        batcher.add(prop.vertices, prop.indices, material=prop.texture, transform=prop.transform)
+    self.static_batches = batcher.build(locations={"position": 0, "normal": 1, "uv": 2})
+    ...
+    for batch in self.static_batches.values():
+        batch.submit(self.render_queue, program=level_program.id, texture=batch.material)
+
+Provides:
+- `transform_vertices(...)`: Vertices with positions and normals transformed.
+- `merge_meshes(...)`: One vertex and index array of several meshes.
+- `StaticBatch`: GL buffers and draw of one merged material.
+- `StaticBatcher`: Collects static meshes and merges them per material.
+"""
+
+# -------------------------------
+#        >>> Imports <<<
+# -------------------------------
+import numpy as np
+
+from .buffer import VertexBuffer, IndexBuffer, VertexArray, GL_TYPES
+
+
+
+# -------------------------------
+#       >>> Functions <<<
+# -------------------------------
+def transform_vertices(vertices, transform, position="position", normal="normal"):
+    """
+    Transform the positions and normals of vertices.
+
+    Positions get the full transform, normals the inverse transpose of
+    its 3x3 part (renormalized), so non-uniform scaling keeps them
+    perpendicular to the surface.
+
+    Args:
+        vertices (np.ndarray): Structured vertices (see `windforge.gl.buffer.interleave`).
+        transform (array_like): (4, 4) transform (NumPy convention, `transform @ point`).
+        position (str, optional): Name of the (n, 3) position field. Default "position".
+        normal (str, optional): Name of the (n, 3) normal field, skipped if missing. Default "normal".
+
+    Returns:
+        np.ndarray: Transformed copy of the vertices.
+    """
+    transform = np.asarray(transform, dtype=np.float64)
+    vertices = vertices.copy()
+    positions = vertices[position].astype(np.float64)
+    vertices[position] = positions @ transform[:3, :3].T + transform[:3, 3]
+    if normal in (vertices.dtype.names or ()):
+        normals = vertices[normal].astype(np.float64) @ np.linalg.inv(transform[:3, :3])
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        vertices[normal] = normals / np.where(lengths > 0, lengths, 1)
+    return vertices
+
+def merge_meshes(meshes, transforms=None, position="position", normal="normal"):
+    """
+    Merge meshes into one vertex and one index array.
+
+    The indices of every mesh get rebased by the number of vertices
+    before it; meshes without indices get sequential ones. The index
+    type is uint16 if all vertices fit, else uint32.
+
+    Args:
+        meshes (list[tuple[np.ndarray, array_like | None]]): (vertices, indices) per mesh,
+            all vertices with the same dtype.
+        transforms (list[array_like | None], optional): (4, 4) transform per mesh, as many
+            as meshes (None keeps the mesh as it is). Default None.
+        position (str, optional): Position field (for the transforms). Default "position".
+        normal (str, optional): Normal field (for the transforms). Default "normal".
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, list[tuple[int, int]]]: Merged vertices, merged indices
+            and (first index, index count) of every mesh in the merged indices.
+
+    Raises:
+        ValueError: If no mesh is given, the vertex dtypes differ or the number
+            of transforms is not the number of meshes.
+    """
+    if not meshes:
+        raise ValueError("merge_meshes needs at least one mesh.")
+    dtype = meshes[0][0].dtype
+    if any(vertices.dtype != dtype for vertices, _ in meshes):
+        raise ValueError("Only meshes with the same vertex dtype can be merged.")
+    if transforms is None:
+        transforms = [None] * len(meshes)
+    elif len(transforms) != len(meshes):
+        raise ValueError(f"merge_meshes needs one transform per mesh (got {len(transforms)} for {len(meshes)} meshes).")
+
+    all_vertices = []
+    all_indices = []
+    ranges = []
+    vertex_offset = 0
+    index_offset = 0
+    for (vertices, indices), transform in zip(meshes, transforms):
+        if transform is not None:
+            vertices = transform_vertices(vertices, transform, position=position, normal=normal)
+        if indices is None:
+            indices = np.arange(len(vertices), dtype=np.int64)
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        all_vertices += [vertices]
+        all_indices += [indices + vertex_offset]
+        ranges += [(index_offset, len(indices))]
+        vertex_offset += len(vertices)
+        index_offset += len(indices)
+
+    index_dtype = np.uint16 if vertex_offset <= np.iinfo(np.uint16).max + 1 else np.uint32
+    return np.concatenate(all_vertices), np.concatenate(all_indices).astype(index_dtype), ranges
+
+
+
+# -------------------------------
+#        >>> Classes <<<
+# -------------------------------
+class StaticBatch(object):
+    """
+    GL buffers of one merged material (created by `StaticBatcher.build`).
+
+    Args:
+        material (Hashable): Material of the batch.
+        vertices (np.ndarray): Merged vertices.
+        indices (np.ndarray): Merged indices.
+        ranges (list[tuple[int, int]]): (first index, index count) of the source meshes.
+        locations (dict[str, int], optional): Attribute name -> shader location. Default field order.
+        normalized (set[str], optional): Integer attributes read as normalized floats. Default None.
+        gl (module, optional): GL module. Default `get_gl()`.
+    """
+    def __init__(self, material, vertices, indices, ranges, locations=None, normalized=None, gl=None):
+        self.material = material
+        self.ranges = ranges
+        self.vertex_buffer = VertexBuffer(vertices, usage="GL_STATIC_DRAW", gl=gl)
+        self.index_buffer = IndexBuffer(indices, usage="GL_STATIC_DRAW", gl=gl)
+        self.vertex_array = VertexArray(self.vertex_buffer, locations=locations, normalized=normalized,
+                                        index_buffer=self.index_buffer, gl=gl)
+        self.gl = self.vertex_array.gl
+        self.count = len(indices)
+        self.index_type = GL_TYPES[np.dtype(self.index_buffer.dtype)]
+
+    def draw(self, state=None):
+        """
+        Draw the whole batch with one `glDrawElements`.
+
+        Args:
+            state (RenderState, optional): State cache to bind the vertex array with. Default None.
+        """
+        gl = self.gl
+        if state is not None:
+            state.bind_vertex_array(self.vertex_array.id)
+        else:
+            self.vertex_array.bind()
+        gl.glDrawElements(gl.GL_TRIANGLES, self.count, getattr(gl, self.index_type), None)
+
+    def submit(self, queue, program, texture=0, depth=0.0, pass_index=0, setup=None):
+        """
+        Submit the batch as one draw item to a render queue.
+
+        Args:
+            queue (RenderQueue): Render queue.
+            program (int): Program GL name.
+            texture (int, optional): Texture GL name. Default 0.
+            depth (float, optional): Sort depth. Default 0.0.
+            pass_index (int, optional): Render pass. Default 0.
+            setup (callable, optional): `func(state)` before the draw. Default None.
+        """
+        queue.submit(self.vertex_array.id, self.count, program=program, texture=texture, depth=depth,
+                     pass_index=pass_index, index_type=self.index_type, setup=setup)
+
+    def delete(self):
+        """
+        Delete the GL buffers and the vertex array.
+        """
+        self.vertex_array.delete()
+        self.vertex_buffer.delete()
+        self.index_buffer.delete()
+
+
+
+class StaticBatcher(object):
+    """
+    Collects static meshes and merges them per material.
+
+    Args:
+        position (str, optional): Position field of the vertices. Default "position".
+        normal (str, optional): Normal field of the vertices (transformed if present). Default "normal".
+
+    Attributes:
+        meshes (dict[Hashable, list]): Material -> added (vertices, indices, transform).
+    """
+    def __init__(self, position="position", normal="normal"):
+        self.position = position
+        self.normal = normal
+        self.meshes = {}
+
+    def add(self, vertices, indices=None, material=0, transform=None):
+        """
+        Add a static mesh.
+
+        Args:
+            vertices (np.ndarray): Structured vertices (the same dtype per material).
+            indices (array_like, optional): Triangle indices. Default None (sequential).
+            material (Hashable, optional): Material, e.g. the texture GL name. Default 0.
+            transform (array_like, optional): (4, 4) model transform baked into the vertices. Default None.
+        """
+        self.meshes.setdefault(material, []).append((vertices, indices, transform))
+
+    def merge(self):
+        """
+        Merge the meshes of every material (no GL needed).
+
+        Returns:
+            dict[Hashable, tuple[np.ndarray, np.ndarray, list[tuple[int, int]]]]:
+                Material -> merged vertices, indices and mesh ranges (see `merge_meshes`).
+        """
+        return {material: merge_meshes([(vertices, indices) for vertices, indices, _ in meshes],
+                                        transforms=[transform for _, _, transform in meshes],
+                                        position=self.position, normal=self.normal)
+                for material, meshes in self.meshes.items()}
+
+    def build(self, locations=None, normalized=None, gl=None):
+        """
+        Merge the meshes and create the GL buffers of every material.
+
+        Args:
+            locations (dict[str, int], optional): Attribute name -> shader location. Default field order.
+            normalized (set[str], optional): Integer attributes read as normalized floats. Default None.
+            gl (module, optional): GL module. Default `get_gl()`.
+
+        Returns:
+            dict[Hashable, StaticBatch]: Material -> batch.
+        """
+        return {material: StaticBatch(material, vertices, indices, ranges,
+                                      locations=locations, normalized=normalized, gl=gl)
+                for material, (vertices, indices, ranges) in self.merge().items()}
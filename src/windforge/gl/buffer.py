@@ -0,0 +1,408 @@
+"""
+NumPy-backed vertex and index buffers for the Wind-Forge Engine.
+
+Vertex data lives in contiguous NumPy arrays, which PyOpenGL passes to
+the driver without copying. Several attributes (position, normal,
+color, ...) get interleaved into one structured array, so one buffer
+and one stride describe a whole vertex. Buffers keep their GL storage
+and update it with `glBufferSubData` instead of reallocating it; for
+data which changes every frame the storage can be orphaned (a new
+`glBufferData` without data lets the driver hand out fresh memory
+instead of waiting for the GPU to finish with the old one).
+
+Typical usage:
+    vertices = interleave(position=positions, color=colors)   # (n, 3) float32, (n, 4) uint8
+    vbo = VertexBuffer(vertices, usage="GL_STATIC_DRAW")
+    vao = VertexArray(vbo, locations={"position": 0, "color": 1}, normalized={"color"})
+    vao.bind()
+    gl.glDrawArrays(gl.GL_TRIANGLES, 0, vbo.count)
+
+Provides:
+- `interleave(...)`: Pack attribute arrays into one structured array.
+- `attribute_layout(dtype)`: Size, type and offset of every attribute of a structured dtype.
+- `VertexBuffer`: GL buffer object for a NumPy array with storage reuse.
+- `IndexBuffer`: `VertexBuffer` for element indices.
+- `VertexArray`: Vertex array object with the attribute pointers of a buffer.
+"""
+
+# -------------------------------
+#        >>> Imports <<<
+# -------------------------------
+import ctypes
+
+import numpy as np
+
+from . import get_gl
+
+
+
+# -------------------------------
+# >>> Variables and Constants <<<
+# -------------------------------
+# NumPy scalar type -> name of the GL type constant
+GL_TYPES = {
+    np.dtype(np.float32): "GL_FLOAT",
+    np.dtype(np.float64): "GL_DOUBLE",
+    np.dtype(np.float16): "GL_HALF_FLOAT",
+    np.dtype(np.int8): "GL_BYTE",
+    np.dtype(np.uint8): "GL_UNSIGNED_BYTE",
+    np.dtype(np.int16): "GL_SHORT",
+    np.dtype(np.uint16): "GL_UNSIGNED_SHORT",
+    np.dtype(np.int32): "GL_INT",
+    np.dtype(np.uint32): "GL_UNSIGNED_INT",
+}
+
+# growth of the buffer storage when data does not fit anymore (amortizes reallocations)
+GROWTH_FACTOR = 1.5
+
+
+
+# -------------------------------
+#       >>> Functions <<<
+# -------------------------------
+def interleave(attributes=None, **named_attributes):
+    """
+    Pack attribute arrays into one interleaved structured array.
+
+    Every attribute becomes one field with the dtype of its array and
+    as many components as its last axis has (a 1-D array gives a scalar
+    field). The field order is the argument order.
+
+    Args:
+        attributes (dict[str, array_like], optional): Attribute name -> array of shape (n,) or (n, k).
+        **named_attributes (array_like): Further attributes by keyword.
+
+    Returns:
+        np.ndarray: Contiguous structured array of length n.
+
+    Raises:
+        ValueError: If no attribute is given or the vertex counts differ.
+    """
+    attributes = {**(attributes or {}), **named_attributes}
+    if not attributes:
+        raise ValueError("interleave needs at least one attribute.")
+
+    arrays = {name: np.asarray(values) for name, values in attributes.items()}
+    counts = {len(values) for values in arrays.values()}
+    if len(counts) != 1:
+        raise ValueError(f"All attributes need the same number of vertices (got {sorted(counts)}).")
+
+    fields = []
+    for name, values in arrays.items():
+        if values.ndim == 1:
+            fields += [(name, values.dtype)]
+        else:
+            fields += [(name, values.dtype, values.shape[1:])]
+    vertices = np.empty(counts.pop(), dtype=fields)
+    for name, values in arrays.items():
+        vertices[name] = values
+    return vertices
+
+def attribute_layout(dtype):
+    """
+    Get the vertex attribute layout of a (structured) dtype.
+
+    A plain dtype describes one attribute with one component, a sub-array
+    dtype (e.g. `np.dtype((np.float32, 3))`) one attribute with its
+    components.
+
+    Args:
+        dtype (np.dtype): Vertex dtype.
+
+    Returns:
+        list[tuple[str, int, str, int]]: Per attribute (name, components,
+            GL type name, byte offset); the stride is `dtype.itemsize`.
+
+    Raises:
+        TypeError: If a field has no GL type (see `GL_TYPES`).
+    """
+    dtype = np.dtype(dtype)
+    if dtype.names is None:
+        fields = [(None, dtype, 0)]
+    else:
+        fields = [(name, dtype.fields[name][0], dtype.fields[name][1]) for name in dtype.names]
+
+    layout = []
+    for name, field_dtype, offset in fields:
+        base, shape = (field_dtype.base, field_dtype.shape) if field_dtype.subdtype else (field_dtype, ())
+        components = int(np.prod(shape)) if shape else 1
+        gl_type = GL_TYPES.get(base)
+        if gl_type is None:
+            raise TypeError(f"Vertex attribute '{name}' has no GL type ({base}).")
+        layout += [(name, components, gl_type, offset)]
+    return layout
+
+def _as_buffer_data(data):
+    # contiguous 1-D byte view: no copy for contiguous arrays, also works for structured dtypes
+    data = np.ascontiguousarray(data)
+    return data, data.reshape(-1).view(np.uint8)
+
+
+
+# -------------------------------
+#        >>> Classes <<<
+# -------------------------------
+class VertexBuffer(object):
+    """
+    GL buffer object holding a NumPy array.
+
+    The storage is only (re)allocated with `glBufferData` if the data
+    does not fit anymore (then with `GROWTH_FACTOR` headroom), otherwise
+    `upload` writes with `glBufferSubData`. With `orphan` the storage gets
+    orphaned before every upload (`glBufferData` with the same size and
+    no data) -> no stall on data the GPU still reads (streaming).
+
+    Args:
+        data (np.ndarray, optional): Initial data, a structured array (see `interleave`) or
+            a plain (n,) / (n, k) array (one attribute). Default None.
+        usage (str, optional): GL usage hint. Default "GL_DYNAMIC_DRAW".
+        orphan (bool, optional): Orphan the storage before every upload. Default False.
+        target (str, optional): GL buffer target. Default "GL_ARRAY_BUFFER".
+        gl (module, optional): GL module (`OpenGL.GL` or a stub). Default `get_gl()`.
+
+    Attributes:
+        id (int): GL buffer name.
+        dtype (np.dtype): Dtype of the last uploaded data.
+        count (int): Elements of the last uploaded data.
+        nbytes (int): Bytes of the last uploaded data.
+        capacity (int): Bytes of the allocated storage.
+        allocations (int): `glBufferData` calls with new storage.
+        uploads (int): Uploads via `glBufferSubData`.
+    """
+    def __init__(self, data=None, usage="GL_DYNAMIC_DRAW", orphan=False, target="GL_ARRAY_BUFFER", gl=None):
+        self.gl = gl if gl is not None else get_gl()
+        self.target = getattr(self.gl, target)
+        self.usage = getattr(self.gl, usage)
+        self.orphan = orphan
+        self.id = self.gl.glGenBuffers(1)
+        self.dtype = None
+        self.count = 0
+        self.nbytes = 0
+        self.capacity = 0
+        self.allocations = 0
+        self.uploads = 0
+        if data is not None:
+            self.upload(data)
+
+    def bind(self):
+        """
+        Bind the buffer to its target.
+        """
+        self.gl.glBindBuffer(self.target, self.id)
+
+    def reserve(self, nbytes):
+        """
+        Allocate storage for at least `nbytes` bytes (keeps larger storage).
+
+        The content of newly allocated storage is undefined.
+
+        Args:
+            nbytes (int): Needed bytes.
+        """
+        if nbytes <= self.capacity:
+            return
+        self.bind()
+        self._allocate(nbytes)
+
+    def _allocate(self, nbytes):
+        # new storage (bound buffer) with headroom for growing data
+        capacity = max(int(nbytes), int(self.capacity * GROWTH_FACTOR))
+        self.gl.glBufferData(self.target, capacity, None, self.usage)
+        self.capacity = capacity
+        self.allocations += 1
+
+    def upload(self, data):
+        """
+        Replace the content of the buffer.
+
+        Data which fits into the storage is written with `glBufferSubData`
+        (after orphaning it with `orphan`), larger data grows the storage
+        first. The first upload allocates and fills in one `glBufferData`.
+
+        Args:
+            data (np.ndarray): New content (contiguous arrays are not copied).
+        """
+        data, raw = _as_buffer_data(data)
+        nbytes = raw.nbytes
+        self.bind()
+        if nbytes > self.capacity and self.capacity == 0:
+            # first allocation -> allocate and fill in one call
+            self.gl.glBufferData(self.target, nbytes, raw, self.usage)
+            self.capacity = nbytes
+            self.allocations += 1
+        else:
+            if nbytes > self.capacity:
+                self._allocate(nbytes)
+            elif self.orphan:
+                self.gl.glBufferData(self.target, self.capacity, None, self.usage)
+            if nbytes:
+                self.gl.glBufferSubData(self.target, 0, nbytes, raw)
+            self.uploads += 1
+        # rows of a plain (n, k) array are the elements -> k components per vertex
+        self.dtype = data.dtype if data.ndim <= 1 else np.dtype((data.dtype, data.shape[1:]))
+        self.count = len(data) if data.ndim else 1
+        self.nbytes = nbytes
+
+    def update(self, data, offset=0):
+        """
+        Overwrite a part of the buffer (no reallocation).
+
+        Args:
+            data (np.ndarray): New elements (same dtype as the buffer content).
+            offset (int, optional): First element to overwrite. Default 0.
+
+        Raises:
+            ValueError: If the data does not fit into the uploaded content.
+        """
+        data, raw = _as_buffer_data(data)
+        offset_bytes = offset * (self.dtype.itemsize if self.dtype is not None else data.dtype.itemsize)
+        if offset_bytes + raw.nbytes > self.nbytes:
+            raise ValueError(f"Update of {raw.nbytes} bytes at byte {offset_bytes} exceeds the "
+                             f"buffer content of {self.nbytes} bytes (use upload to grow it).")
+        self.bind()
+        self.gl.glBufferSubData(self.target, offset_bytes, raw.nbytes, raw)
+        self.uploads += 1
+
+    def delete(self):
+        """
+        Delete the GL buffer.
+        """
+        if self.id is not None:
+            self.gl.glDeleteBuffers(1, [self.id])
+            self.id = None
+            self.capacity = 0
+
+
+
+class IndexBuffer(VertexBuffer):
+    """
+    GL element buffer for vertex indices (uint8, uint16 or uint32).
+
+    Args:
+        indices (array_like, optional): Initial indices. Default None.
+        usage (str, optional): GL usage hint. Default "GL_STATIC_DRAW".
+        orphan (bool, optional): Orphan the storage before every upload. Default False.
+        gl (module, optional): GL module (`OpenGL.GL` or a stub). Default `get_gl()`.
+    """
+    def __init__(self, indices=None, usage="GL_STATIC_DRAW", orphan=False, gl=None):
+        super().__init__(None, usage=usage, orphan=orphan, target="GL_ELEMENT_ARRAY_BUFFER", gl=gl)
+        if indices is not None:
+            self.upload(indices)
+
+    def upload(self, indices):
+        """
+        Replace the indices (other integer types get converted to uint32).
+
+        Args:
+            indices (array_like): Vertex indices.
+        """
+        indices = np.asarray(indices)
+        if indices.dtype not in (np.uint8, np.uint16, np.uint32):
+            indices = indices.astype(np.uint32)
+        super().upload(indices.reshape(-1))
+
+    @property
+    def gl_type(self):
+        """
+        GL type constant of the indices (for `glDrawElements`).
+        """
+        return getattr(self.gl, GL_TYPES[np.dtype(self.dtype)])
+
+
+
+class VertexArray(object):
+    """
+    GL vertex array object with the attribute pointers of vertex buffers.
+
+    Args:
+        buffer (VertexBuffer, optional): Buffer whose attributes get added. Default None.
+        locations (dict[str, int], optional): Attribute name -> shader location.
+            Default: the field order (0, 1, 2, ...).
+        normalized (set[str], optional): Integer attributes which the shader reads as
+            normalized floats (e.g. uint8 colors). Other integer attributes are passed as integers.
+        index_buffer (IndexBuffer, optional): Element buffer of the vertex array. Default None.
+        gl (module, optional): GL module (`OpenGL.GL` or a stub). Default `get_gl()`.
+
+    Attributes:
+        attributes (dict[str, int]): Attribute name -> (first) location.
+        next_location (int): First location after the added attributes (default of the next buffer).
+    """
+    def __init__(self, buffer=None, locations=None, normalized=None, index_buffer=None, gl=None):
+        self.gl = gl if gl is not None else get_gl()
+        self.id = self.gl.glGenVertexArrays(1)
+        self.index_buffer = None
+        self.attributes = {}
+        self.next_location = 0
+        if buffer is not None:
+            self.add_buffer(buffer, locations=locations, normalized=normalized)
+        if index_buffer is not None:
+            self.set_index_buffer(index_buffer)
+
+    def bind(self):
+        """
+        Bind the vertex array.
+        """
+        self.gl.glBindVertexArray(self.id)
+
+    def add_buffer(self, buffer, locations=None, normalized=None, divisor=0):
+        """
+        Add the attributes of a vertex buffer (from the dtype of its content).
+
+        A matrix field (shape (columns, rows), e.g. a (4, 4) `mat4`) takes
+        one location per column, starting at its location.
+
+        Args:
+            buffer (VertexBuffer): Buffer with uploaded data.
+            locations (dict[str, int], optional): Attribute name -> shader location.
+                Default: the field order after the already added attributes.
+            normalized (set[str], optional): Integer attributes read as normalized floats.
+            divisor (int, optional): Attribute divisor (0 = per vertex, 1 = per instance). Default 0.
+
+        Returns:
+            dict[str, int]: Attribute name -> location of the added attributes.
+        """
+        gl = self.gl
+        normalized = normalized or set()
+        stride = buffer.dtype.itemsize
+        self.bind()
+        buffer.bind()
+        added = {}
+        for name, components, gl_type, offset in attribute_layout(buffer.dtype):
+            location = locations[name] if locations is not None else self.next_location
+            field_dtype = buffer.dtype.fields[name][0] if name is not None else buffer.dtype
+            columns = field_dtype.shape[0] if len(field_dtype.shape) == 2 else 1
+            column_bytes = field_dtype.itemsize // columns
+            for column in range(columns):
+                column_location = location + column
+                gl.glEnableVertexAttribArray(column_location)
+                pointer = ctypes.c_void_p(offset + column * column_bytes)
+                if gl_type in ("GL_FLOAT", "GL_DOUBLE", "GL_HALF_FLOAT") or name in normalized:
+                    gl.glVertexAttribPointer(column_location, components // columns, getattr(gl, gl_type),
+                                             gl.GL_TRUE if name in normalized else gl.GL_FALSE, stride, pointer)
+                else:
+                    gl.glVertexAttribIPointer(column_location, components // columns, getattr(gl, gl_type), stride, pointer)
+                if divisor:
+                    gl.glVertexAttribDivisor(column_location, divisor)
+            self.next_location = max(self.next_location, location + columns)
+            added[name] = location
+        self.attributes.update(added)
+        return added
+
+    def set_index_buffer(self, index_buffer):
+        """
+        Attach an element buffer (stored in the vertex array state).
+
+        Args:
+            index_buffer (IndexBuffer): Element buffer.
+        """
+        self.bind()
+        index_buffer.bind()
+        self.index_buffer = index_buffer
+
+    def delete(self):
+        """
+        Delete the GL vertex array (the buffers stay).
+        """
+        if self.id is not None:
+            self.gl.glDeleteVertexArrays(1, [self.id])
+            self.id = None
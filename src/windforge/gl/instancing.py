@@ -0,0 +1,228 @@
+"""
+Instanced drawing of repeated meshes.
+
+Drawing N copies of a mesh with N draw calls costs N Python and
+PyOpenGL round trips. `InstancedMesh` collects the per-instance
+transform and color of all copies in one structured NumPy array,
+uploads it once per frame as instance buffer (attribute divisor 1)
+and draws all copies with one `glDrawArraysInstanced` /
+`glDrawElementsInstanced`.
+
+The shader reads the instance attributes as:
+
+    layout(location = 2) in mat4 instance_transform;   // locations 2..5
+    layout(location = 6) in vec4 instance_color;
+
+(by default the locations directly after the vertex attributes of the
+vertex array).
+
+Typical usage:
+    trees = InstancedMesh(tree_vao)                # vertex count from the index buffer
+    ...
+    trees.set(transforms, colors)                  # (n, 4, 4) and (n, 4) per frame, or trees.add(...)
+    trees.submit(self.render_queue, program=tree_program.id, texture=bark_texture)
+
+Provides:
+- `INSTANCE_DTYPE`: Per-instance data (column-major transform, color).
+- `pack_instances(...)`: Pack transforms and colors into an instance array.
+- `InstancedMesh`: Mesh drawn once per frame with all its instances.
+"""
+
+# -------------------------------
+#        >>> Imports <<<
+# -------------------------------
+import ctypes
+
+import numpy as np
+
+from .buffer import VertexBuffer, GL_TYPES, GROWTH_FACTOR
+
+
+
+# -------------------------------
+# >>> Variables and Constants <<<
+# -------------------------------
+# transform stored column-major (as GLSL reads a mat4 attribute: one column per location)
+INSTANCE_DTYPE = np.dtype([("transform", np.float32, (4, 4)), ("color", np.float32, (4,))])
+
+WHITE = np.ones(4, dtype=np.float32)
+
+
+
+# -------------------------------
+#       >>> Functions <<<
+# -------------------------------
+def pack_instances(transforms, colors=None, out=None):
+    """
+    Pack per-instance transforms and colors into one instance array.
+
+    The transforms are given in the NumPy convention (`transform @ point`)
+    and get stored column-major, so the shader's `mat4` equals them.
+
+    Args:
+        transforms (array_like): (n, 4, 4) transforms.
+        colors (array_like, optional): (n, 4) or one (4,) RGBA color in [0, 1]. Default white.
+        out (np.ndarray, optional): `INSTANCE_DTYPE` array with at least n entries to write
+            into (no allocation). Default None.
+
+    Returns:
+        np.ndarray: `INSTANCE_DTYPE` array of length n (a view of `out` if given).
+
+    Raises:
+        ValueError: If the transforms are not (n, 4, 4) or `out` is too small.
+    """
+    transforms = np.asarray(transforms, dtype=np.float32)
+    if transforms.ndim != 3 or transforms.shape[1:] != (4, 4):
+        raise ValueError(f"Instance transforms have to be of shape (n, 4, 4) (got {transforms.shape}).")
+    n = len(transforms)
+    if out is None:
+        out = np.empty(n, dtype=INSTANCE_DTYPE)
+    elif len(out) < n:
+        raise ValueError(f"Instance array too small ({len(out)} < {n}).")
+    instances = out[:n]
+    instances["transform"] = transforms.transpose(0, 2, 1)
+    instances["color"] = WHITE if colors is None else colors
+    return instances
+
+
+
+# -------------------------------
+#        >>> Classes <<<
+# -------------------------------
+class InstancedMesh(object):
+    """
+    Mesh drawn with all its instances in one instanced draw call.
+
+    The instance buffer gets added to the vertex array with divisor 1 on
+    creation (do this at load time; creating it binds the vertex array
+    directly, so call `invalidate()` of a `RenderState` in use). It streams: the instances get
+    uploaded at most once per change (`upload`, called by `draw` and
+    `submit`), with orphaning, into storage which only grows.
+
+    Args:
+        vertex_array (VertexArray): Vertex array of the mesh.
+        count (int, optional): Vertices (or indices) per instance. Default: count of the
+            index buffer of the vertex array.
+        mode (str, optional): Primitive type. Default "GL_TRIANGLES".
+        locations (dict[str, int], optional): Locations of "transform" (4 consecutive) and
+            "color". Default: after the attributes of the vertex array.
+        capacity (int, optional): Initially allocated instances. Default 256.
+        gl (module, optional): GL module. Default the one of the vertex array.
+
+    Attributes:
+        instances (np.ndarray): `INSTANCE_DTYPE` storage, the first `size` entries are used.
+        size (int): Number of instances.
+        buffer (VertexBuffer): Instance buffer.
+    """
+    def __init__(self, vertex_array, count=None, mode="GL_TRIANGLES", locations=None, capacity=256, gl=None):
+        self.gl = gl if gl is not None else vertex_array.gl
+        self.vertex_array = vertex_array
+        index_buffer = vertex_array.index_buffer
+        self.index_type = GL_TYPES[np.dtype(index_buffer.dtype)] if index_buffer is not None else None
+        if count is None:
+            if index_buffer is None:
+                raise ValueError("InstancedMesh needs a count for a vertex array without index buffer.")
+            count = index_buffer.count
+        self.count = count
+        self.mode = mode
+        self.instances = np.zeros(max(1, capacity), dtype=INSTANCE_DTYPE)
+        self.size = 0
+        self.dirty = False
+        self.buffer = VertexBuffer(self.instances, usage="GL_STREAM_DRAW", orphan=True, gl=self.gl)
+        vertex_array.add_buffer(self.buffer, locations=locations, divisor=1)
+
+    def _reserve(self, size):
+        if size > len(self.instances):
+            instances = np.zeros(max(size, int(len(self.instances) * GROWTH_FACTOR)), dtype=INSTANCE_DTYPE)
+            instances[:self.size] = self.instances[:self.size]
+            self.instances = instances
+
+    def clear(self):
+        """
+        Remove all instances (e.g. at the start of a frame).
+        """
+        self.size = 0
+        self.dirty = True
+
+    def add(self, transform, color=None):
+        """
+        Add one instance.
+
+        Args:
+            transform (array_like): (4, 4) transform (NumPy convention, see `pack_instances`).
+            color (array_like, optional): RGBA color in [0, 1]. Default white.
+
+        Returns:
+            int: Index of the instance.
+        """
+        self._reserve(self.size + 1)
+        instance = self.instances[self.size]
+        instance["transform"] = np.asarray(transform, dtype=np.float32).T
+        instance["color"] = WHITE if color is None else color
+        self.size += 1
+        self.dirty = True
+        return self.size - 1
+
+    def set(self, transforms, colors=None):
+        """
+        Replace all instances.
+
+        Args:
+            transforms (array_like): (n, 4, 4) transforms.
+            colors (array_like, optional): (n, 4) or one (4,) RGBA color. Default white.
+        """
+        n = len(transforms)
+        self.size = 0
+        self._reserve(n)
+        pack_instances(transforms, colors, out=self.instances)
+        self.size = n
+        self.dirty = True
+
+    def upload(self):
+        """
+        Upload the instances if they changed since the last upload.
+        """
+        if self.dirty:
+            if self.size:
+                self.buffer.upload(self.instances[:self.size])
+            self.dirty = False
+
+    def draw(self, state=None):
+        """
+        Upload and draw all instances with one instanced draw call.
+
+        Args:
+            state (RenderState, optional): State cache to bind the vertex array with. Default None.
+        """
+        self.upload()
+        if not self.size:
+            return
+        gl = self.gl
+        if state is not None:
+            state.bind_vertex_array(self.vertex_array.id)
+        else:
+            self.vertex_array.bind()
+        mode = getattr(gl, self.mode)
+        if self.index_type is None:
+            gl.glDrawArraysInstanced(mode, 0, self.count, self.size)
+        else:
+            gl.glDrawElementsInstanced(mode, self.count, getattr(gl, self.index_type), ctypes.c_void_p(0), self.size)
+
+    def submit(self, queue, program, texture=0, depth=0.0, pass_index=0, setup=None):
+        """
+        Upload the instances and submit them as one draw item to a render queue.
+
+        Args:
+            queue (RenderQueue): Render queue.
+            program (int): Program GL name.
+            texture (int, optional): Texture GL name. Default 0.
+            depth (float, optional): Sort depth. Default 0.0.
+            pass_index (int, optional): Render pass. Default 0.
+            setup (callable, optional): `func(state)` before the draw. Default None.
+        """
+        self.upload()
+        if not self.size:
+            return
+        queue.submit(self.vertex_array.id, self.count, program=program, texture=texture, depth=depth,
+                     pass_index=pass_index, mode=self.mode, index_type=self.index_type, setup=setup,
+                     instances=self.size)
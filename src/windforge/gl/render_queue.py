@@ -0,0 +1,284 @@
+"""
+Render queue which sorts the draws by state before submitting them.
+
+`generate_output` submits draw items in any order; `flush()` sorts them
+by a packed 64-bit key and issues them through the `RenderState` cache,
+so every program and texture gets bound once per run of equal items
+instead of once per draw. The key (most significant first):
+
+    bits 60-63  pass       (0..15, e.g. 0 opaque, 1 transparent)
+    bits 48-59  program    (sort id, up to 4096 programs per flush)
+    bits 32-47  material   (sort id, up to 65536 materials per flush)
+    bits  0-31  depth      (float32 bits in sortable order: front to back,
+                            back to front in the `back_to_front` passes)
+
+The queue maps the GL names of programs and materials (any value, e.g.
+a texture name above 65535) to small dense sort ids in the order of
+their first submit since the last flush, so only the number of distinct
+programs and materials of a frame is limited, not their names.
+
+The keys get built and sorted with NumPy (`argsort`), the runs of equal
+program and material (the batches) are found with one comparison of the
+shifted keys. Only the draw calls themselves run in a Python loop.
+
+`GraphicsApplication` owns one as `self.render_queue` (on its
+`render_state`), the default `generate_output` flushes it before the
+buffer swap:
+
+    def generate_output(self, alpha=None):
+        for mesh in self.meshes:
+            self.render_queue.submit(mesh.vao.id, mesh.count, program=mesh.program.id,
+                                     texture=mesh.texture, depth=mesh.view_depth)
+        self.render_queue.flush()
+        self.window.display()
+
+Provides:
+- `pack_keys(...)`: Packed 64-bit sort keys of draw items.
+- `RenderQueue`: Collects, sorts and submits draw items.
+"""
+
+# -------------------------------
+#        >>> Imports <<<
+# -------------------------------
+import ctypes
+
+import numpy as np
+
+from .state import RenderState
+
+
+
+# -------------------------------
+# >>> Variables and Constants <<<
+# -------------------------------
+PASS_BITS = 4
+PROGRAM_BITS = 12
+MATERIAL_BITS = 16
+DEPTH_BITS = 32
+
+PASS_SHIFT = np.uint64(PROGRAM_BITS + MATERIAL_BITS + DEPTH_BITS)
+PROGRAM_SHIFT = np.uint64(MATERIAL_BITS + DEPTH_BITS)
+MATERIAL_SHIFT = np.uint64(DEPTH_BITS)
+
+# bytes per index of the index types
+INDEX_SIZES = {"GL_UNSIGNED_BYTE": 1, "GL_UNSIGNED_SHORT": 2, "GL_UNSIGNED_INT": 4}
+
+
+
+# -------------------------------
+#       >>> Functions <<<
+# -------------------------------
+def _check_range(name, values, bits):
+    if len(values) and (values.min() < 0 or values.max() >= 1 << bits):
+        raise ValueError(f"Render queue {name} has to be in [0, {(1 << bits) - 1}] (got {values.min()}..{values.max()}).")
+
+def depth_bits(depths):
+    """
+    Convert depths into unsigned integers with the same order.
+
+    Positive float32 values already sort like their bits; negative ones
+    get all bits flipped, positive ones only the sign bit.
+
+    Args:
+        depths (array_like): Depth values.
+
+    Returns:
+        np.ndarray: uint32 per depth, ascending with the depth.
+    """
+    bits = np.ascontiguousarray(depths, dtype=np.float32).view(np.uint32)
+    return bits ^ np.where(bits >> np.uint32(31), np.uint32(0xFFFFFFFF), np.uint32(0x80000000))
+
+def pack_keys(passes, programs, materials, depths, back_to_front=()):
+    """
+    Pack the sort keys of draw items (layout see module docstring).
+
+    Args:
+        passes (array_like): Pass per item (0..15).
+        programs (array_like): Program sort id per item (0..4095).
+        materials (array_like): Material sort id per item (0..65535).
+        depths (array_like): Depth per item (view distance or window depth).
+        back_to_front (Iterable[int], optional): Passes sorted far to near (transparency). Default ().
+
+    Returns:
+        np.ndarray: uint64 key per item.
+
+    Raises:
+        ValueError: If a pass, program or material is out of its range.
+    """
+    passes = np.asarray(passes, dtype=np.int64)
+    programs = np.asarray(programs, dtype=np.int64)
+    materials = np.asarray(materials, dtype=np.int64)
+    _check_range("pass", passes, PASS_BITS)
+    _check_range("program", programs, PROGRAM_BITS)
+    _check_range("material", materials, MATERIAL_BITS)
+
+    depth = depth_bits(depths)
+    if back_to_front:
+        flip = np.isin(passes, list(back_to_front))
+        depth = np.where(flip, ~depth, depth)
+    return ((passes.astype(np.uint64) << PASS_SHIFT)
+            | (programs.astype(np.uint64) << PROGRAM_SHIFT)
+            | (materials.astype(np.uint64) << MATERIAL_SHIFT)
+            | depth.astype(np.uint64))
+
+
+
+# -------------------------------
+#        >>> Classes <<<
+# -------------------------------
+class RenderQueue(object):
+    """
+    Collects draw items and submits them sorted by state.
+
+    Args:
+        state (RenderState, optional): State cache the draws go through. Default a new `RenderState`.
+        back_to_front (Iterable[int], optional): Passes sorted far to near (transparency). Default ().
+        pass_setup (dict[int, callable], optional): Pass -> `func(state)` called when the pass
+            starts (e.g. `lambda state: state.set_blend(True)`). Default None.
+
+    Attributes:
+        items (int): Number of submitted items (until the next `flush`).
+        last_flush (dict): "items", "batches" and "passes" of the last flush.
+        program_ids (dict[int, int]): Program GL name -> sort id (until the next `flush`).
+        material_ids (dict[Hashable, int]): Material -> sort id (until the next `flush`).
+    """
+    def __init__(self, state=None, back_to_front=(), pass_setup=None):
+        self.state = state if state is not None else RenderState()
+        self.back_to_front = tuple(back_to_front)
+        self.pass_setup = dict(pass_setup or {})
+        self.last_flush = {"items": 0, "batches": 0, "passes": 0}
+        self.clear()
+
+    def clear(self):
+        """
+        Remove all submitted items.
+        """
+        self._passes = []
+        self._programs = []
+        self._program_keys = []
+        self._material_keys = []
+        self.program_ids = {}
+        self.material_ids = {}
+        self._depths = []
+        self._draws = []
+
+    @property
+    def items(self):
+        return len(self._draws)
+
+    def submit(self, vertex_array, count, program, texture=0, depth=0.0, pass_index=0,
+               mode="GL_TRIANGLES", first=0, index_type=None, material=None, setup=None, instances=None):
+        """
+        Add a draw item.
+
+        Args:
+            vertex_array (int): Vertex array GL name.
+            count (int): Number of vertices (or indices).
+            program (int): Program GL name.
+            texture (int, optional): Texture GL name bound to unit 0 (0 binds nothing). Default 0.
+            depth (float, optional): Sort depth (e.g. distance to the camera). Default 0.0.
+            pass_index (int, optional): Render pass (passes are drawn in ascending order). Default 0.
+            mode (str, optional): Primitive type. Default "GL_TRIANGLES".
+            first (int, optional): First vertex (or index). Default 0.
+            index_type (str, optional): Index type name for `glDrawElements` (e.g. "GL_UNSIGNED_INT"),
+                None draws with `glDrawArrays`. Default None.
+            material (Hashable, optional): Sort material of the item (items with the same
+                material get batched, their textures still get bound per item). Default `texture`.
+            setup (callable, optional): `func(state)` called after binding and before the draw
+                (e.g. per-object uniforms). Default None.
+            instances (int, optional): Instance count, draws with `glDrawArraysInstanced`/
+                `glDrawElementsInstanced` (see `windforge.gl.instancing`). Default None.
+        """
+        if material is None:
+            material = texture
+        # dense sort ids in first-submit order -> the key bits limit the count, not the GL names
+        program_ids = self.program_ids
+        program_key = program_ids.get(program)
+        if program_key is None:
+            program_key = program_ids[program] = len(program_ids)
+        material_ids = self.material_ids
+        material_key = material_ids.get(material)
+        if material_key is None:
+            material_key = material_ids[material] = len(material_ids)
+        self._passes.append(pass_index)
+        self._programs.append(program)
+        self._program_keys.append(program_key)
+        self._material_keys.append(material_key)
+        self._depths.append(depth)
+        self._draws.append((vertex_array, count, texture, mode, first, index_type, setup, instances))
+
+    def sort(self):
+        """
+        Get the draw order and the batches (runs of equal pass, program and material).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Item indices in draw order and the start
+                position (in the draw order) of every batch.
+        """
+        keys = pack_keys(self._passes, self._program_keys, self._material_keys, self._depths, self.back_to_front)
+        order = np.argsort(keys, kind="stable")
+        state_keys = keys[order] >> MATERIAL_SHIFT
+        starts = np.flatnonzero(np.concatenate(([True], state_keys[1:] != state_keys[:-1])))
+        return order, starts
+
+    def flush(self):
+        """
+        Sort and draw all submitted items, then clear the queue.
+
+        Returns:
+            dict: "items", "batches" and "passes" of this flush.
+        """
+        if not self._draws:
+            self.last_flush = {"items": 0, "batches": 0, "passes": 0}
+            return self.last_flush
+
+        order, starts = self.sort()
+        state = self.state
+        gl = state.gl
+        draws = self._draws
+        passes = self._passes
+        pass_setup = self.pass_setup
+        ends = np.append(starts[1:], len(order)).tolist()
+        order = order.tolist()
+        modes = {}
+        current_pass = None
+        n_passes = 0
+
+        for start, end in zip(starts.tolist(), ends):
+            first_item = order[start]
+            pass_index = passes[first_item]
+            if pass_index != current_pass:
+                current_pass = pass_index
+                n_passes += 1
+                setup_pass = pass_setup.get(pass_index)
+                if setup_pass is not None:
+                    setup_pass(state)
+            state.use_program(self._programs[first_item])
+
+            for item in order[start:end]:
+                vertex_array, count, texture, mode, first, index_type, setup, instances = draws[item]
+                # per item: a shared material may use several textures, the
+                # state cache skips the rebinds of equal textures
+                if texture:
+                    state.bind_texture(0, texture)
+                state.bind_vertex_array(vertex_array)
+                if setup is not None:
+                    setup(state)
+                gl_mode = modes.get(mode)
+                if gl_mode is None:
+                    gl_mode = modes[mode] = getattr(gl, mode)
+                if index_type is None:
+                    if instances is None:
+                        gl.glDrawArrays(gl_mode, first, count)
+                    else:
+                        gl.glDrawArraysInstanced(gl_mode, first, count, instances)
+                else:
+                    offset = ctypes.c_void_p(first * INDEX_SIZES[index_type])
+                    if instances is None:
+                        gl.glDrawElements(gl_mode, count, getattr(gl, index_type), offset)
+                    else:
+                        gl.glDrawElementsInstanced(gl_mode, count, getattr(gl, index_type), offset, instances)
+
+        self.last_flush = {"items": len(order), "batches": len(starts), "passes": n_passes}
+        self.clear()
+        return self.last_flush
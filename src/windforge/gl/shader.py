@@ -0,0 +1,438 @@
+"""
+Shader programs with deduplication, cached locations and a disk cache.
+
+`ShaderManager` hands out one `ShaderProgram` per distinct set of GLSL
+sources (identified by a hash of the sources), so the same shader used
+by many objects gets compiled once. Uniform and attribute locations are
+looked up once per name and then served from a dict, so drawing makes
+no `glGetUniformLocation` calls.
+
+With a `cache_dir` the linked programs get stored as program binaries
+(`glGetProgramBinary`) and loaded with `glProgramBinary` on the next
+start instead of compiling and linking again. The binaries are keyed by
+the source hash plus the driver string (vendor, renderer, version), the
+whole cache gets dropped when the driver changes, and a binary which the
+driver rejects gets compiled from source again.
+
+Typical usage:
+    shaders = ShaderManager(cache_dir=".shader_cache")
+    program = shaders.get_program(vertex_source, fragment_source)
+    program.use()
+    gl.glUniformMatrix4fv(program.uniform("u_mvp"), 1, gl.GL_FALSE, mvp)
+
+Provides:
+- `source_hash(...)`: Hash of the shader sources of a program.
+- `ProgramBinaryCache`: Index and files of the stored program binaries.
+- `ShaderProgram`: Linked program with cached locations.
+- `ShaderManager`: Creates, deduplicates and caches the programs.
+"""
+
+# -------------------------------
+#        >>> Imports <<<
+# -------------------------------
+import os
+import json
+import hashlib
+
+import numpy as np
+
+from . import get_gl
+
+
+
+# -------------------------------
+# >>> Variables and Constants <<<
+# -------------------------------
+# stage name -> name of the GL shader type constant
+SHADER_STAGES = {
+    "vertex": "GL_VERTEX_SHADER",
+    "geometry": "GL_GEOMETRY_SHADER",
+    "fragment": "GL_FRAGMENT_SHADER",
+}
+
+CACHE_INDEX_FILE = "index.json"
+
+
+
+# -------------------------------
+#       >>> Functions <<<
+# -------------------------------
+def source_hash(vertex_source, fragment_source, geometry_source=None):
+    """
+    Hash the shader sources of a program.
+
+    Every stage is hashed with its name, so the same source in another
+    stage gives another hash.
+
+    Args:
+        vertex_source (str): GLSL vertex shader.
+        fragment_source (str): GLSL fragment shader.
+        geometry_source (str, optional): GLSL geometry shader. Default None.
+
+    Returns:
+        str: SHA-256 hex digest.
+    """
+    sha = hashlib.sha256()
+    for stage, source in (("vertex", vertex_source), ("geometry", geometry_source), ("fragment", fragment_source)):
+        if source is not None:
+            sha.update(stage.encode())
+            sha.update(b"\0")
+            sha.update(source.encode())
+            sha.update(b"\0")
+    return sha.hexdigest()
+
+def _to_str(value):
+    if value is None:
+        return ""
+    return value.decode(errors="replace") if isinstance(value, (bytes, bytearray)) else str(value)
+
+
+
+# -------------------------------
+#        >>> Classes <<<
+# -------------------------------
+class ProgramBinaryCache(object):
+    """
+    Directory of program binaries with a JSON index.
+
+    The entries are keyed by `sha256(source hash + driver)`. The index
+    stores the driver it was written with: a different driver (update,
+    other GPU) drops all entries, because binaries are only valid for
+    the driver which created them.
+
+    Args:
+        directory (str): Cache directory (gets created).
+        driver (str): Driver string (vendor, renderer and version).
+    """
+    def __init__(self, directory, driver):
+        self.directory = directory
+        self.driver = driver
+        os.makedirs(directory, exist_ok=True)
+        self.entries = {}
+        index = self._read_index()
+        if index.get("driver") == driver:
+            self.entries = index.get("programs", {})
+        elif index:
+            print("[INFO] Shader cache invalidated (driver changed).")
+            self._remove_files(index.get("programs", {}))
+            self._write_index()
+
+    def key(self, program_hash):
+        """
+        Get the cache key of a program.
+
+        Args:
+            program_hash (str): Source hash (see `source_hash`).
+
+        Returns:
+            str: Key of the program binary for the current driver.
+        """
+        return hashlib.sha256(f"{program_hash}\0{self.driver}".encode()).hexdigest()
+
+    def get(self, program_hash):
+        """
+        Load a program binary.
+
+        Args:
+            program_hash (str): Source hash.
+
+        Returns:
+            tuple[int, bytes] | None: Binary format and data, None if not cached.
+        """
+        entry = self.entries.get(self.key(program_hash))
+        if entry is None:
+            return None
+        try:
+            with open(os.path.join(self.directory, entry["file"]), "rb") as file:
+                data = file.read()
+        except OSError:
+            self.remove(program_hash)
+            return None
+        if len(data) != entry["size"]:
+            self.remove(program_hash)
+            return None
+        return entry["format"], data
+
+    def put(self, program_hash, binary_format, data):
+        """
+        Store a program binary.
+
+        Args:
+            program_hash (str): Source hash.
+            binary_format (int): Binary format reported by the driver.
+            data (bytes): Program binary.
+        """
+        key = self.key(program_hash)
+        file_name = f"{key}.bin"
+        with open(os.path.join(self.directory, file_name), "wb") as file:
+            file.write(data)
+        self.entries[key] = {"format": int(binary_format), "file": file_name, "size": len(data)}
+        self._write_index()
+
+    def remove(self, program_hash):
+        """
+        Remove a program binary (e.g. rejected by the driver).
+
+        Args:
+            program_hash (str): Source hash.
+        """
+        entry = self.entries.pop(self.key(program_hash), None)
+        if entry is not None:
+            self._remove_files({None: entry})
+            self._write_index()
+
+    def _read_index(self):
+        try:
+            with open(os.path.join(self.directory, CACHE_INDEX_FILE)) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self):
+        # write + rename -> no half written index
+        path = os.path.join(self.directory, CACHE_INDEX_FILE)
+        with open(path + ".tmp", "w") as file:
+            json.dump({"driver": self.driver, "programs": self.entries}, file, indent=1)
+        os.replace(path + ".tmp", path)
+
+    def _remove_files(self, entries):
+        for entry in entries.values():
+            try:
+                os.remove(os.path.join(self.directory, entry["file"]))
+            except OSError:
+                pass
+
+
+
+class ShaderProgram(object):
+    """
+    Linked GL program with cached uniform and attribute locations.
+
+    Args:
+        program_id (int): GL program name.
+        program_hash (str): Source hash of the program.
+        gl (module): GL module.
+
+    Attributes:
+        uniforms (dict[str, int]): Looked up uniform locations (-1 if not active).
+        attributes (dict[str, int]): Looked up attribute locations (-1 if not active).
+    """
+    def __init__(self, program_id, program_hash, gl):
+        self.id = program_id
+        self.hash = program_hash
+        self.gl = gl
+        self.uniforms = {}
+        self.attributes = {}
+
+    def use(self):
+        """
+        Make the program current (`glUseProgram`).
+        """
+        self.gl.glUseProgram(self.id)
+
+    def uniform(self, name):
+        """
+        Get the location of a uniform (queried once per name).
+
+        Args:
+            name (str): Uniform name.
+
+        Returns:
+            int: Location, -1 if the uniform is not active.
+        """
+        location = self.uniforms.get(name)
+        if location is None:
+            location = self.uniforms[name] = int(self.gl.glGetUniformLocation(self.id, name))
+        return location
+
+    def attribute(self, name):
+        """
+        Get the location of a vertex attribute (queried once per name).
+
+        Args:
+            name (str): Attribute name.
+
+        Returns:
+            int: Location, -1 if the attribute is not active.
+        """
+        location = self.attributes.get(name)
+        if location is None:
+            location = self.attributes[name] = int(self.gl.glGetAttribLocation(self.id, name))
+        return location
+
+    def delete(self):
+        """
+        Delete the GL program.
+        """
+        if self.id is not None:
+            self.gl.glDeleteProgram(self.id)
+            self.id = None
+
+
+
+class ShaderManager(object):
+    """
+    Creates shader programs once per distinct source and caches them.
+
+    Needs a current GL context (create it in `initialize` of a
+    `GraphicsApplication`).
+
+    Args:
+        cache_dir (str, optional): Directory for the program binaries. Default None (no disk cache).
+        gl (module, optional): GL module (`OpenGL.GL` or a stub). Default `get_gl()`.
+
+    Attributes:
+        programs (dict[str, ShaderProgram]): Source hash -> program.
+        compiled (int): Programs compiled and linked from source.
+        loaded (int): Programs loaded from the disk cache.
+        reused (int): Requests served by an already created program.
+    """
+    def __init__(self, cache_dir=None, gl=None):
+        self.gl = gl if gl is not None else get_gl()
+        self.programs = {}
+        self.compiled = 0
+        self.loaded = 0
+        self.reused = 0
+        self.cache = None
+        if cache_dir is not None:
+            if self.supports_program_binaries():
+                self.cache = ProgramBinaryCache(cache_dir, self.driver_string())
+            else:
+                print("[WARNING] The GL driver supports no program binaries, shader disk cache disabled.")
+
+    def driver_string(self):
+        """
+        Get the driver identification (vendor, renderer and version).
+
+        Returns:
+            str: Driver string.
+        """
+        gl = self.gl
+        return " | ".join(_to_str(gl.glGetString(getattr(gl, name)))
+                          for name in ("GL_VENDOR", "GL_RENDERER", "GL_VERSION"))
+
+    def supports_program_binaries(self):
+        """
+        Returns:
+            bool: Whether the driver offers at least one program binary format.
+        """
+        formats = self.gl.glGetIntegerv(self.gl.GL_NUM_PROGRAM_BINARY_FORMATS)
+        return int(np.asarray(formats if formats is not None else 0).reshape(-1)[0]) > 0
+
+    def get_program(self, vertex_source, fragment_source, geometry_source=None):
+        """
+        Get the program of these sources (created on the first request).
+
+        Args:
+            vertex_source (str): GLSL vertex shader.
+            fragment_source (str): GLSL fragment shader.
+            geometry_source (str, optional): GLSL geometry shader. Default None.
+
+        Returns:
+            ShaderProgram: The (shared) program.
+
+        Raises:
+            RuntimeError: If a shader does not compile or the program does not link.
+        """
+        program_hash = source_hash(vertex_source, fragment_source, geometry_source)
+        program = self.programs.get(program_hash)
+        if program is not None:
+            self.reused += 1
+            return program
+
+        program_id = self._load_binary(program_hash) if self.cache is not None else None
+        if program_id is None:
+            program_id = self._compile(program_hash, {"vertex": vertex_source, "geometry": geometry_source,
+                                                      "fragment": fragment_source})
+        program = self.programs[program_hash] = ShaderProgram(program_id, program_hash, self.gl)
+        return program
+
+    def load_program(self, vertex_path, fragment_path, geometry_path=None):
+        """
+        Get the program of shader files (see `get_program`).
+
+        Args:
+            vertex_path (str): Vertex shader file.
+            fragment_path (str): Fragment shader file.
+            geometry_path (str, optional): Geometry shader file. Default None.
+
+        Returns:
+            ShaderProgram: The (shared) program.
+        """
+        def read(path):
+            if path is None:
+                return None
+            with open(path) as file:
+                return file.read()
+        return self.get_program(read(vertex_path), read(fragment_path), read(geometry_path))
+
+    def delete_all(self):
+        """
+        Delete all programs.
+        """
+        for program in self.programs.values():
+            program.delete()
+        self.programs.clear()
+
+    def _load_binary(self, program_hash):
+        cached = self.cache.get(program_hash)
+        if cached is None:
+            return None
+        gl = self.gl
+        binary_format, data = cached
+        binary = np.frombuffer(data, dtype=np.uint8)
+        program_id = gl.glCreateProgram()
+        gl.glProgramBinary(program_id, binary_format, binary, len(data))
+        if not gl.glGetProgramiv(program_id, gl.GL_LINK_STATUS):
+            # rejected by the driver -> compile from source again
+            gl.glDeleteProgram(program_id)
+            self.cache.remove(program_hash)
+            return None
+        self.loaded += 1
+        return program_id
+
+    def _compile(self, program_hash, sources):
+        gl = self.gl
+        shaders = []
+        try:
+            for stage, source in sources.items():
+                if source is None:
+                    continue
+                shader = gl.glCreateShader(getattr(gl, SHADER_STAGES[stage]))
+                shaders += [shader]
+                gl.glShaderSource(shader, source)
+                gl.glCompileShader(shader)
+                if not gl.glGetShaderiv(shader, gl.GL_COMPILE_STATUS):
+                    raise RuntimeError(f"Compiling the {stage} shader failed:\n{_to_str(gl.glGetShaderInfoLog(shader))}")
+
+            program_id = gl.glCreateProgram()
+            for shader in shaders:
+                gl.glAttachShader(program_id, shader)
+            if self.cache is not None:
+                gl.glProgramParameteri(program_id, gl.GL_PROGRAM_BINARY_RETRIEVABLE_HINT, gl.GL_TRUE)
+            gl.glLinkProgram(program_id)
+            if not gl.glGetProgramiv(program_id, gl.GL_LINK_STATUS):
+                log = _to_str(gl.glGetProgramInfoLog(program_id))
+                gl.glDeleteProgram(program_id)
+                raise RuntimeError(f"Linking the shader program failed:\n{log}")
+            for shader in shaders:
+                gl.glDetachShader(program_id, shader)
+        finally:
+            for shader in shaders:
+                gl.glDeleteShader(shader)
+        self.compiled += 1
+
+        if self.cache is not None:
+            self._store_binary(program_hash, program_id)
+        return program_id
+
+    def _store_binary(self, program_hash, program_id):
+        gl = self.gl
+        size = int(gl.glGetProgramiv(program_id, gl.GL_PROGRAM_BINARY_LENGTH) or 0)
+        if size <= 0:
+            return
+        binary = np.zeros(size, dtype=np.uint8)
+        length = np.zeros(1, dtype=np.int32)
+        binary_format = np.zeros(1, dtype=np.uint32)
+        gl.glGetProgramBinary(program_id, size, length, binary_format, binary)
+        self.cache.put(program_hash, int(binary_format[0]), binary[:int(length[0])].tobytes())
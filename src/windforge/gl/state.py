@@ -0,0 +1,294 @@
+"""
+Render-state cache which filters redundant GL state changes.
+
+Every PyOpenGL call costs microseconds of Python and wrapper overhead,
+also when it changes nothing (binding the program which is already
+bound, enabling blending which is already on, ...). `RenderState`
+shadows the state it sets (program, vertex array, textures per unit,
+blend, depth, culling and viewport) and only issues a GL call if the
+value differs from the shadowed one. Issued and skipped calls are
+counted per frame.
+
+`GraphicsApplication` owns one as `self.render_state` (also
+`self.window.render_state`): `Window.display()` closes its frame and
+returns the counters of the frame. State changed with direct GL calls
+is unknown to the cache, call `invalidate()` afterwards.
+
+Typical usage:
+    state = self.render_state
+    state.set_depth_test(True)
+    state.set_blend(True, "GL_SRC_ALPHA", "GL_ONE_MINUS_SRC_ALPHA")
+    for mesh in meshes:
+        state.use_program(mesh.program.id)
+        state.bind_texture(0, mesh.texture)
+        state.bind_vertex_array(mesh.vao.id)
+        gl.glDrawArrays(gl.GL_TRIANGLES, 0, mesh.count)
+
+Provides:
+- `RenderState`: Shadowed GL state with issued/skipped counters.
+"""
+
+# -------------------------------
+#        >>> Imports <<<
+# -------------------------------
+from . import get_gl
+
+
+
+# -------------------------------
+#        >>> Classes <<<
+# -------------------------------
+class RenderState(object):
+    """
+    Shadow of the GL render state which skips redundant calls.
+
+    The shadowed state starts unknown (the first change of every value
+    gets issued). GL constants are given by name (e.g. `"GL_BACK"`), as
+    in `windforge.gl.buffer`.
+
+    Args:
+        gl (module, optional): GL module (`OpenGL.GL` or a stub). Default `get_gl()`,
+            imported on the first issued call.
+
+    Attributes:
+        issued (int): GL calls issued in the current frame.
+        skipped (int): GL calls skipped in the current frame (state already set).
+        last_frame (dict): Counters of the last closed frame ("issued", "skipped").
+        total_issued (int): Issued calls of all closed frames.
+        total_skipped (int): Skipped calls of all closed frames.
+    """
+    def __init__(self, gl=None):
+        self._gl = gl
+        self.issued = 0
+        self.skipped = 0
+        self.total_issued = 0
+        self.total_skipped = 0
+        self.last_frame = {"issued": 0, "skipped": 0}
+        self.invalidate()
+
+    @property
+    def gl(self):
+        """
+        GL module (imported on first use, so a headless application never imports OpenGL).
+        """
+        if self._gl is None:
+            self._gl = get_gl()
+        return self._gl
+
+    def invalidate(self):
+        """
+        Forget the shadowed state (after GL calls which bypassed the cache,
+        e.g. from another library or a context switch).
+        """
+        self.program = None
+        self.vertex_array = None
+        self.active_unit = None
+        self.textures = {}
+        self.capabilities = {}
+        self.blend_func = None
+        self.depth_func = None
+        self.depth_mask = None
+        self.cull_mode = None
+        self.viewport_rect = None
+
+    def end_frame(self):
+        """
+        Close the counters of the current frame (called by `Window.display()`).
+
+        Returns:
+            dict: Counters of the frame ("issued", "skipped").
+        """
+        self.last_frame = {"issued": self.issued, "skipped": self.skipped}
+        self.total_issued += self.issued
+        self.total_skipped += self.skipped
+        self.issued = 0
+        self.skipped = 0
+        return self.last_frame
+
+    def get_stats(self):
+        """
+        Get the counters.
+
+        Returns:
+            dict: "frame" (counters of the last closed frame), "current"
+                (counters of the running frame) and "total_issued", "total_skipped".
+        """
+        return {"frame": dict(self.last_frame),
+                "current": {"issued": self.issued, "skipped": self.skipped},
+                "total_issued": self.total_issued,
+                "total_skipped": self.total_skipped}
+
+    def use_program(self, program):
+        """
+        Make a program current (`glUseProgram`).
+
+        Args:
+            program (int): GL program name (0 for none).
+        """
+        if program == self.program:
+            self.skipped += 1
+            return
+        self.gl.glUseProgram(program)
+        self.program = program
+        self.issued += 1
+
+    def bind_vertex_array(self, vertex_array):
+        """
+        Bind a vertex array object (`glBindVertexArray`).
+
+        Args:
+            vertex_array (int): GL vertex array name (0 for none).
+        """
+        if vertex_array == self.vertex_array:
+            self.skipped += 1
+            return
+        self.gl.glBindVertexArray(vertex_array)
+        self.vertex_array = vertex_array
+        self.issued += 1
+
+    def active_texture(self, unit):
+        """
+        Select the active texture unit (`glActiveTexture`).
+
+        Args:
+            unit (int): Texture unit index (0 for `GL_TEXTURE0`).
+        """
+        if unit == self.active_unit:
+            self.skipped += 1
+            return
+        gl = self.gl
+        gl.glActiveTexture(gl.GL_TEXTURE0 + unit)
+        self.active_unit = unit
+        self.issued += 1
+
+    def bind_texture(self, unit, texture, target="GL_TEXTURE_2D"):
+        """
+        Bind a texture to a texture unit (`glActiveTexture` only if the unit changes, `glBindTexture`).
+
+        Args:
+            unit (int): Texture unit index.
+            texture (int): GL texture name (0 for none).
+            target (str, optional): Texture target. Default "GL_TEXTURE_2D".
+        """
+        key = (unit, target)
+        if self.textures.get(key) == texture:
+            self.skipped += 1
+            return
+        self.active_texture(unit)
+        gl = self.gl
+        gl.glBindTexture(getattr(gl, target), texture)
+        self.textures[key] = texture
+        self.issued += 1
+
+    def set_capability(self, capability, enabled):
+        """
+        Enable or disable a GL capability (`glEnable`/`glDisable`).
+
+        Args:
+            capability (str): Capability name (e.g. "GL_BLEND").
+            enabled (bool): Whether it should be enabled.
+        """
+        enabled = bool(enabled)
+        if self.capabilities.get(capability) is enabled:
+            self.skipped += 1
+            return
+        gl = self.gl
+        if enabled:
+            gl.glEnable(getattr(gl, capability))
+        else:
+            gl.glDisable(getattr(gl, capability))
+        self.capabilities[capability] = enabled
+        self.issued += 1
+
+    def set_blend(self, enabled, source="GL_SRC_ALPHA", destination="GL_ONE_MINUS_SRC_ALPHA"):
+        """
+        Set blending (`GL_BLEND` and `glBlendFunc`, the function only while enabled).
+
+        Args:
+            enabled (bool): Whether blending is enabled.
+            source (str, optional): Source factor. Default "GL_SRC_ALPHA".
+            destination (str, optional): Destination factor. Default "GL_ONE_MINUS_SRC_ALPHA".
+        """
+        self.set_capability("GL_BLEND", enabled)
+        if not enabled:
+            return
+        blend_func = (source, destination)
+        if blend_func == self.blend_func:
+            self.skipped += 1
+            return
+        gl = self.gl
+        gl.glBlendFunc(getattr(gl, source), getattr(gl, destination))
+        self.blend_func = blend_func
+        self.issued += 1
+
+    def set_depth_test(self, enabled, func="GL_LESS"):
+        """
+        Set depth testing (`GL_DEPTH_TEST` and `glDepthFunc`, the function only while enabled).
+
+        Args:
+            enabled (bool): Whether depth testing is enabled.
+            func (str, optional): Depth comparison. Default "GL_LESS".
+        """
+        self.set_capability("GL_DEPTH_TEST", enabled)
+        if not enabled:
+            return
+        if func == self.depth_func:
+            self.skipped += 1
+            return
+        gl = self.gl
+        gl.glDepthFunc(getattr(gl, func))
+        self.depth_func = func
+        self.issued += 1
+
+    def set_depth_mask(self, write):
+        """
+        Enable or disable depth writes (`glDepthMask`).
+
+        Args:
+            write (bool): Whether the depth buffer gets written.
+        """
+        write = bool(write)
+        if write is self.depth_mask:
+            self.skipped += 1
+            return
+        gl = self.gl
+        gl.glDepthMask(gl.GL_TRUE if write else gl.GL_FALSE)
+        self.depth_mask = write
+        self.issued += 1
+
+    def set_cull_face(self, enabled, mode="GL_BACK"):
+        """
+        Set face culling (`GL_CULL_FACE` and `glCullFace`, the mode only while enabled).
+
+        Args:
+            enabled (bool): Whether culling is enabled.
+            mode (str, optional): Culled faces. Default "GL_BACK".
+        """
+        self.set_capability("GL_CULL_FACE", enabled)
+        if not enabled:
+            return
+        if mode == self.cull_mode:
+            self.skipped += 1
+            return
+        gl = self.gl
+        gl.glCullFace(getattr(gl, mode))
+        self.cull_mode = mode
+        self.issued += 1
+
+    def viewport(self, x, y, width, height):
+        """
+        Set the viewport (`glViewport`).
+
+        Args:
+            x (int): Left edge.
+            y (int): Bottom edge.
+            width (int): Width.
+            height (int): Height.
+        """
+        rect = (x, y, width, height)
+        if rect == self.viewport_rect:
+            self.skipped += 1
+            return
+        self.gl.glViewport(x, y, width, height)
+        self.viewport_rect = rect
+        self.issued += 1
@@ -0,0 +1,120 @@
+"""
+Recording GL stub for headless tests and benchmarks.
+
+`RecordingGL` can be passed as `gl` to every `windforge.gl` class.
+It records each `gl*` call with its arguments instead of talking to a
+GPU, returns new ids for the `glGen*`/`glCreate*` calls and resolves
+every `GL_*` constant to a unique integer (which prints with its name).
+Return values of other functions can be given with `returns`.
+
+    gl = RecordingGL()
+    vbo = VertexBuffer(vertices, gl=gl)
+    assert gl.count("glBufferData") == 1
+
+Provides:
+- `RecordingGL`: GL stub with call log.
+- `GLConstant`: Integer constant which prints with its name.
+"""
+
+# -------------------------------
+#        >>> Imports <<<
+# -------------------------------
+import itertools
+
+
+
+# -------------------------------
+#        >>> Classes <<<
+# -------------------------------
+class GLConstant(int):
+    """
+    Integer GL constant which keeps its name (readable call logs).
+    """
+    def __new__(cls, name, value):
+        constant = super().__new__(cls, value)
+        constant.name = name
+        return constant
+
+    def __repr__(self):
+        return self.name
+
+
+
+class RecordingGL(object):
+    """
+    GL stub which records every call.
+
+    - `GL_*` attributes are unique `GLConstant`s (GL_FALSE is 0, GL_TRUE is 1).
+    - `glGen*(n)` and `glCreate*()` return new ids (an int for one object,
+      a list for more).
+    - Other `gl*` functions return the value from `returns` (a value or a
+      callable with the call arguments) or None.
+
+    Args:
+        returns (dict[str, Any], optional): Function name -> return value or callable.
+
+    Attributes:
+        calls (list[tuple[str, tuple]]): Recorded calls (function name, arguments).
+    """
+    def __init__(self, returns=None):
+        self.returns = dict(returns or {})
+        self.calls = []
+        self._constants = {"GL_FALSE": GLConstant("GL_FALSE", 0), "GL_TRUE": GLConstant("GL_TRUE", 1)}
+        self._constant_values = itertools.count(0x10000)
+        self._ids = itertools.count(1)
+
+    def __getattr__(self, name):
+        if name.startswith("GL_"):
+            constant = self._constants.get(name)
+            if constant is None:
+                constant = self._constants[name] = GLConstant(name, next(self._constant_values))
+            return constant
+        if not name.startswith("gl"):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        calls = self.calls
+        if name.startswith("glGen"):
+            def function(n, *args):
+                calls.append((name, (n,) + args))
+                ids = [next(self._ids) for _ in range(n)]
+                return ids[0] if n == 1 else ids
+        elif name.startswith("glCreate"):
+            def function(*args):
+                calls.append((name, args))
+                return next(self._ids)
+        else:
+            returns = self.returns
+            def function(*args):
+                calls.append((name, args))
+                value = returns.get(name)
+                return value(*args) if callable(value) else value
+        # cache the function -> later lookups skip __getattr__
+        setattr(self, name, function)
+        return function
+
+    def count(self, name=None):
+        """
+        Count the recorded calls.
+
+        Args:
+            name (str, optional): Only calls of this function. Default all calls.
+
+        Returns:
+            int: Number of calls.
+        """
+        if name is None:
+            return len(self.calls)
+        return sum(1 for call_name, _ in self.calls if call_name == name)
+
+    def names(self):
+        """
+        Returns:
+            list[str]: Function names of the recorded calls in call order.
+        """
+        return [call_name for call_name, _ in self.calls]
+
+    def reset(self):
+        """
+        Remove the recorded calls (ids and constants stay unique).
+        """
+        self.calls.clear()
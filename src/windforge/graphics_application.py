@@ -31,8 +31,12 @@ Typical usage:
 # -------------------------------
 import sys
 
-from .window import Window, EventType, Key, MouseButton, ControllerButton, ControllerAxis, WindowLib
-from .time import Clock
+from .window import Window, EventType, Key, MouseButton, ControllerButton, ControllerAxis, WindowLib, INPUT_EVENT_TYPES
+from .time import Clock, TimerScheduler, FrameRateGovernor
+from .recording import InputRecorder, InputReplay
+from .profiler import Profiler
+from .gl.state import RenderState
+from .gl.render_queue import RenderQueue
 
 
 
@@ -56,11 +60,38 @@ class GraphicsApplication():
         depth_buffer (int, optional): Depth buffer size in bits. Default 24.
         gl_version (tuple[int, int], optional): OpenGL version (major, minor). Default None.
         post_process (list, optional): List of post-processing effects. Default [].
-        background_lib (WindowLib, optional): Window backend (PYGAME or GLFW). Default PYGAME.
+        background_lib (WindowLib, optional): Window backend (PYGAME, GLFW or HEADLESS). Default PYGAME.
         goal_fps (int, optional): Target FPS. Default 60.
+        precise_pacing (bool, optional): Pace the frames against absolute deadlines with
+            sleep + spin instead of a plain sleep (see `windforge.time.Clock`). Default False.
         deactivate_pre_input_processing (bool, optional): If True, disables automatic pre-input processing. Default False.
         print_missed_events (bool, optional): Print debug messages for missed events. Default False.
         print_catched_events (bool, optional): Print detailed event info for debugging. Default False.
+        coalesce_motion (bool, optional): Merge mouse moves and collapse controller axis
+            events to one per frame (less events under fast input). Default False.
+        input_poll_rate (float, optional): Sample the controllers in a background thread with
+            this rate (samples per second), the events carry `perf_counter_ns` timestamps.
+            Experimental, only the GLFW backend supports it. Default None.
+        event_source (iterable | callable, optional): Events for the HEADLESS backend
+            (see `windforge.window.HeadlessBackend`), for example a
+            `windforge.recording.InputReplay`: then the recorded frame deltas are used as
+            `delta_time` and drive the timers, so a replay reproduces the session. Default None.
+        record_input (str, optional): Record the events and frame deltas of the
+            session into this file (see `windforge.recording`). Default None.
+        update_rate (float, optional): Enables the fixed-timestep mode: `update(dt)` is called
+            with a constant `dt = 1 / update_rate` as often as the passed time requires and
+            `generate_output(alpha)` gets the interpolation factor between the last two
+            simulation states. None calls `update()` once per frame. Default None.
+        max_update_steps (int, optional): Maximum number of `update(dt)` calls per frame in the
+            fixed-timestep mode; time beyond that is dropped (avoids the spiral of death). Default 5.
+        profile (bool, optional): Record the phases of every frame with `self.profiler`
+            (see `windforge.profiler`). Can also be enabled later. Default False.
+        profile_trace (str, optional): Write the recorded zones as Chrome trace JSON into
+            this file when the application ends (enables `profile`). Default None.
+        governor (bool | FrameRateGovernor, optional): Adapt the frame rate: lower it while
+            the window is inactive, render on demand after a while without input and back
+            off when the frames are over budget (see `windforge.time.FrameRateGovernor`).
+            True uses the default settings. `goal_fps` stays the full rate. Default None.
     """
     def __init__(self, 
                  size=[512, 512],
@@ -73,9 +104,19 @@ class GraphicsApplication():
                  post_process=[],
                  background_lib=WindowLib.PYGAME,
                  goal_fps=60,
+                 precise_pacing=False,
                  deactivate_pre_input_processing=False,
                  print_missed_events=False,
-                 print_catched_events=False):
+                 print_catched_events=False,
+                 coalesce_motion=False,
+                 input_poll_rate=None,
+                 event_source=None,
+                 record_input=None,
+                 update_rate=None,
+                 max_update_steps=5,
+                 profile=False,
+                 profile_trace=None,
+                 governor=None):
         self.goal_fps = goal_fps
         self.window = Window(size=size,
                              resizable=resizable,
@@ -86,7 +127,10 @@ class GraphicsApplication():
                              gl_version=gl_version, 
                              post_process=post_process,
                              background_lib=background_lib,
-                             print_missed_events=print_missed_events)
+                             print_missed_events=print_missed_events,
+                             event_source=event_source,
+                             coalesce_motion=coalesce_motion,
+                             input_poll_rate=input_poll_rate)
 
         # main-loop bool
         self.should_run = True
@@ -96,7 +140,45 @@ class GraphicsApplication():
         self.print_catched_events = print_catched_events
 
         # start clock (for FPS goal reaching)
-        self.clock = Clock(goal_fps=self.goal_fps)
+        self.clock = Clock(goal_fps=self.goal_fps, precise_pacing=precise_pacing)
+
+        # input latency (event timestamp -> buffer swap) -> self.clock.get_latency_stats()
+        self.window.latency_tracker = self.clock.latency
+
+        # central timers (ticked once per frame with the frame start of the clock)
+        self.timers = TimerScheduler(now=self.clock.start_time)
+
+        # fixed-timestep simulation
+        self.update_rate = update_rate
+        self.max_update_steps = max_update_steps
+        self.delta_time = 0.0
+        self.accumulator = 0.0
+        self.dropped_update_time = 0.0
+
+        # replay: the recorded frame deltas replace the measured ones (deterministic updates and timers)
+        self.replay = event_source if isinstance(event_source, InputReplay) else None
+        self.replay_time = self.clock.start_time
+
+        # adaptive frame rate
+        self.governor = FrameRateGovernor() if governor is True else (governor or None)
+
+        # GL state cache (skips redundant state changes, counts issued/skipped calls per frame)
+        # -> closed by self.window.display(), see self.get_render_stats()
+        self.render_state = RenderState()
+        self.window.render_state = self.render_state
+        # draw items of generate_output, sorted by state on flush
+        self.render_queue = RenderQueue(state=self.render_state)
+
+        # frame-phase profiler
+        self.profiler = Profiler(enabled=profile or bool(profile_trace))
+        self.profile_trace = profile_trace
+        self.window.profiler = self.profiler
+
+        # input recording
+        self.recorder = None
+        if record_input:
+            self.recorder = InputRecorder(record_input)
+            self.window.recorder = self.recorder
 
     def initialize(self):
         """
@@ -170,28 +252,167 @@ class GraphicsApplication():
         events = self.window.events()
         for event in events:
             if self.print_catched_events:
-                event_details = [f"{name}:{value}" for name, value in vars(event).items() if value and name != "type"]
+                event_details = [f"{name}:{value}" for name, value in event.as_dict().items() if value and name != "type"]
                 print(f"[INFO] Catched Event: {event.type} ({', '.join(event_details)})")
             if event.type == EventType.QUIT:
                 self.should_run = False
         return events
 
-    def update(self):
+    def update(self, dt=None):
         """
         Update application state each frame.
 
         Override this to update objects, animations, physics, etc.
+
+        Args:
+            dt (float, optional): Fixed simulation step in seconds when `update_rate`
+                is set, else None (use `self.delta_time` for the last frame delta).
         """
         pass
 
-    def generate_output(self):
+    def generate_output(self, alpha=None):
         """
         Render output each frame.
 
-        Override this to perform drawing calls.
-        By default, swaps buffers to display content.
+        Override this to perform drawing calls (directly or by submitting
+        draw items to `self.render_queue` and flushing it).
+        By default, flushes the render queue and swaps buffers to display content.
+
+        Args:
+            alpha (float, optional): Interpolation factor in [0, 1) between the previous
+                and the current simulation state when `update_rate` is set, else None.
+
+        Returns:
+            dict: Issued and skipped GL state calls of `self.render_state` in this frame
+                (returned by `self.window.display()`).
+        """
+        self.render_queue.flush()
+        return self.window.display()
+
+    def get_render_stats(self):
+        """
+        Get the GL state calls of the last displayed frame.
+
+        Only calls made through `self.render_state` are counted.
+
+        Returns:
+            dict: "issued" and "skipped" calls of the frame.
+        """
+        return dict(self.render_state.last_frame)
+
+    def fixed_update(self):
+        """
+        Run the due fixed-timestep updates of the current frame.
+
+        Adds the last frame delta to the accumulator and calls `update(dt)`
+        once per full step (at most `max_update_steps` times), the rest of
+        a too long frame is dropped.
+
+        Returns:
+            float: Interpolation factor for `generate_output(alpha)`.
+        """
+        dt = 1.0 / self.update_rate
+        self.accumulator += self.delta_time
+
+        steps = 0
+        while self.accumulator >= dt and steps < self.max_update_steps:
+            with self.profiler.zone("update"):
+                self.update(dt)
+            self.accumulator -= dt
+            steps += 1
+
+        # could not catch up -> drop the remaining full steps (keep the fraction for alpha)
+        if self.accumulator >= dt:
+            dropped = self.accumulator - self.accumulator % dt
+            self.dropped_update_time += dropped
+            self.accumulator -= dropped
+
+        return self.accumulator / dt
+
+    def govern_frame_rate(self):
         """
-        self.window.display()
+        Let the governor set the frame rate of the clock for this frame.
+
+        Input means any key, mouse or controller event in `self.events`
+        (with `deactivate_pre_input_processing` call
+        `self.governor.notify_input()` yourself). Active means the window
+        has the focus (`input_state.window["active"]`, lost on minimize);
+        the mouse leaving the window (`"accessed"`) does not count.
+
+        Returns:
+            bool: Whether this frame should be rendered (`generate_output`).
+        """
+        window_state = self.window.input_state.window
+        has_input = False
+        for event in self.events:
+            if event.type in INPUT_EVENT_TYPES:
+                has_input = True
+                break
+        target_fps = self.governor.update(goal_fps=self.goal_fps,
+                                          work_time=self.clock.frame_time,
+                                          has_input=has_input,
+                                          is_active=window_state["active"])
+        if target_fps != self.clock.goal_fps:
+            self.clock.set_fps(target_fps)
+        return self.governor.should_render()
+
+    def run_frame(self):
+        """
+        Run one frame of the main loop.
+
+        Calls the due timers, processes the input, updates (once or
+        in fixed steps), generates the output and waits for the goal FPS
+        (or the rate of the governor, which can also skip the output).
+        Every phase is recorded as zone of `self.profiler`.
+        """
+        # profiler zones (shared no-op context manager while the profiler is disabled)
+        zone = self.profiler.zone
+
+        # call due timers
+        with zone("timers"):
+            self.timers.tick(self.clock.start_time if self.replay is None else self.replay_time)
+
+        # process input
+        if self.deactivate_pre_input_processing == False:
+            with zone("pre_input_processing"):
+                self.events = self.pre_input_processing()
+        with zone("process_input"):
+            self.process_input()
+
+        # adapt the frame rate (inactive, idle -> on demand rendering, over budget)
+        render = True
+        if self.governor is not None:
+            render = self.govern_frame_rate()
+
+        # update + generate output (render)
+        if self.update_rate:
+            alpha = self.fixed_update()
+            if render:
+                with zone("generate_output"):
+                    self.generate_output(alpha)
+        else:
+            with zone("update"):
+                self.update()
+            if render:
+                with zone("generate_output"):
+                    self.generate_output()
+        if not render:
+            # no buffer swap -> close the GL call counters of the frame here, so they do not add up
+            # with the next one (pending input latencies get measured at the next presented frame)
+            self.render_state.end_frame()
+
+        # pausing to come to 60 FPS (goal fps)
+        with zone("wait"):
+            frame_time = self.clock.tick()
+        if self.replay is not None:
+            # recorded delta of the frame whose events were replayed
+            frame_time = self.replay.frame_time
+            self.replay_time += frame_time
+        # frame_time = delta is the time since the last frame -> feeds the fixed-timestep accumulator of the next frame
+        self.delta_time = frame_time
+
+        if self.recorder:
+            self.recorder.end_frame(frame_time)
 
     def run(self):
         """
@@ -209,21 +430,17 @@ class GraphicsApplication():
         self.initialize()
 
         # loop
-        while self.should_run:
-            # process input
-            if self.deactivate_pre_input_processing == False:
-                self.events = self.pre_input_processing()
-            self.process_input()
-
-            # update
-            self.update()
-
-            # generate output (render)
-            self.generate_output()
-
-            # pausing to come to 60 FPS (goal fps)
-            frame_time = self.clock.tick()
-            # frame_time = delta is the time since the last frame -> can be used for updating the objects in equal also with different FPS
+        try:
+            while self.should_run:
+                with self.profiler.zone("frame"):
+                    self.run_frame()
+        finally:
+            # also after an exception -> the recording and the trace of a crashed session are kept
+            if self.recorder:
+                self.recorder.close()
+            if self.profile_trace:
+                self.profiler.save_chrome_trace(self.profile_trace)
+                print(f"[INFO] Profiler trace written to '{self.profile_trace}' (open it in https://ui.perfetto.dev).")
 
         # end
         self.window.quit()
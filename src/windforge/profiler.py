@@ -0,0 +1,313 @@
+"""
+Frame-phase profiler for the Wind-Forge Engine.
+
+Records named zones (start and end timestamps from
+`time.perf_counter_ns`) into a bounded record buffer and writes them as
+Chrome trace-event JSON, which can be opened in Perfetto
+(https://ui.perfetto.dev) or `chrome://tracing`.
+
+`GraphicsApplication` owns one as `self.profiler` and records the
+phases of every frame (timers, pre_input_processing, process_input,
+update, generate_output, display, wait). Own zones can be added with
+the context manager or the decorator:
+
+    with self.profiler.zone("physics"):
+        ...
+
+    @app.profiler.profiled("load_mesh")
+    def load_mesh(path):
+        ...
+
+Provides:
+- `Profiler`: Zone recording, statistics and Chrome trace export.
+"""
+
+# -------------------------------
+#        >>> Imports <<<
+# -------------------------------
+import os
+import json
+import functools
+from time import perf_counter_ns
+
+import numpy as np
+
+
+
+# -------------------------------
+#        >>> Classes <<<
+# -------------------------------
+class _Zone(object):
+    """
+    Reusable context manager of one zone name (created once per name by `Profiler.zone`).
+    """
+    __slots__ = ("append", "name_id", "end_code")
+
+    def __init__(self, profiler, name_id):
+        self.append = profiler._records.append
+        self.name_id = name_id
+        self.end_code = -1 - name_id
+
+    def __enter__(self):
+        append = self.append
+        append(self.name_id)
+        append(perf_counter_ns())
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        end = perf_counter_ns()
+        append = self.append
+        append(self.end_code)
+        append(end)
+
+
+
+class _NullZone(object):
+    """
+    Context manager which records nothing (returned while the profiler is disabled).
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+NULL_ZONE = _NullZone()
+
+
+
+class Profiler(object):
+    """
+    Low-overhead zone profiler.
+
+    Every zone appends a begin and an end record (name id and
+    `perf_counter_ns` timestamp) to one flat list (cheaper than index
+    writes into preallocated arrays in Python). When the list holds twice
+    `capacity` records, the oldest are dropped down to `capacity`
+    (amortized O(1), checked by `zone`, `begin` and `profiled` calls).
+    Nested zones are matched on export (the trace viewer nests them by
+    their time ranges). While disabled, `zone` returns a shared no-op
+    context manager and `begin`/`end` return immediately.
+
+    Args:
+        enabled (bool, optional): Start recording immediately. Default False.
+        capacity (int, optional): Number of begin/end records to keep at least (two per zone). Default 131072.
+    """
+    def __init__(self, enabled=False, capacity=131072):
+        if capacity < 2:
+            raise ValueError(f"Profiler capacity has to be at least 2 (got {capacity}).")
+        self.enabled = enabled
+        self.capacity = capacity
+        # flat (code, timestamp) pairs, code: name id for a begin record, -1 - name id for an end record
+        self._records = []
+        self.names = []
+        self._name_to_id = {}
+        self._zones = {}
+        self.reset()
+
+    def reset(self):
+        """
+        Remove all recorded zones (the zone names are kept).
+        """
+        # clear in place -> the bound append of the cached zones stays valid
+        self._records.clear()
+        self.origin = perf_counter_ns()
+
+    def enable(self):
+        """
+        Start recording.
+        """
+        self.enabled = True
+
+    def disable(self):
+        """
+        Stop recording.
+        """
+        self.enabled = False
+
+    def name_id(self, name):
+        """
+        Get the id of a zone name (registers new names).
+
+        Args:
+            name (str): Zone name.
+
+        Returns:
+            int: Id of the name (index into `names`).
+        """
+        name_id = self._name_to_id.get(name)
+        if name_id is None:
+            name_id = len(self.names)
+            self.names += [name]
+            self._name_to_id[name] = name_id
+        return name_id
+
+    def _trim(self):
+        # keep the newest `capacity` records
+        records = self._records
+        if len(records) >= 4 * self.capacity:
+            del records[:len(records) - 2 * self.capacity]
+
+    def begin(self, name):
+        """
+        Open a zone. Has to be closed by `end` with the same name.
+
+        Args:
+            name (str): Zone name.
+        """
+        if self.enabled:
+            records = self._records
+            if len(records) >= 4 * self.capacity:
+                self._trim()
+            name_id = self._name_to_id.get(name)
+            if name_id is None:
+                name_id = self.name_id(name)
+            records += [name_id, perf_counter_ns()]
+
+    def end(self, name):
+        """
+        Close the innermost open zone of this name.
+
+        Args:
+            name (str): Zone name (the same as in `begin`).
+        """
+        if self.enabled:
+            end = perf_counter_ns()
+            name_id = self._name_to_id.get(name)
+            if name_id is None:
+                name_id = self.name_id(name)
+            self._records += [-1 - name_id, end]
+
+    def zone(self, name):
+        """
+        Get a context manager which records a zone.
+
+        The context managers are cached per name, so using
+        `with profiler.zone("name"):` in a hot loop creates no objects.
+
+        Args:
+            name (str): Zone name.
+
+        Returns:
+            context manager: Records the `with` block as zone (no-op while disabled).
+        """
+        if not self.enabled:
+            return NULL_ZONE
+        if len(self._records) >= 4 * self.capacity:
+            self._trim()
+        zone = self._zones.get(name)
+        if zone is None:
+            zone = self._zones[name] = _Zone(self, self.name_id(name))
+        return zone
+
+    def profiled(self, name=None):
+        """
+        Decorator which records every call of a function as zone.
+
+        Args:
+            name (str, optional): Zone name. Default is the qualified function name.
+
+        Returns:
+            callable: The decorator.
+        """
+        def decorator(func):
+            name_id = self.name_id(name or func.__qualname__)
+            end_code = -1 - name_id
+            # cleared and trimmed in place -> the list stays the same
+            records = self._records
+            append = records.append
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                if len(records) >= 4 * self.capacity:
+                    self._trim()
+                # records of the zone inline (no context manager calls)
+                append(name_id)
+                append(perf_counter_ns())
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    end = perf_counter_ns()
+                    append(end_code)
+                    append(end)
+            return wrapper
+        return decorator
+
+    def get_zones(self):
+        """
+        Get the recorded zones (ordered by their end).
+
+        Begin and end records are matched per name; zones which are still
+        open or whose begin got dropped are left out.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: Start and end timestamps
+                (`perf_counter_ns`) and name ids of the zones.
+        """
+        records = self._records
+        starts, ends, name_ids = [], [], []
+        open_zones = {}
+        for code, timestamp in zip(records[0::2], records[1::2]):
+            if code >= 0:
+                open_zones.setdefault(code, []).append(timestamp)
+            else:
+                name_id = -1 - code
+                stack = open_zones.get(name_id)
+                if stack:
+                    starts += [stack.pop()]
+                    ends += [timestamp]
+                    name_ids += [name_id]
+        return (np.array(starts, dtype=np.int64), np.array(ends, dtype=np.int64),
+                np.array(name_ids, dtype=np.int32))
+
+    def get_stats(self):
+        """
+        Get the statistics per zone name of the recorded zones.
+
+        Returns:
+            dict: Zone name -> dict with "count" (int) and "total", "mean",
+                "max" (float, milliseconds).
+        """
+        starts, ends, name_ids = self.get_zones()
+        durations = (ends - starts) / 1e6
+        stats = {}
+        for name_id in np.unique(name_ids).tolist():
+            zone_durations = durations[name_ids == name_id]
+            stats[self.names[name_id]] = {
+                "count": len(zone_durations),
+                "total": float(zone_durations.sum()),
+                "mean": float(zone_durations.mean()),
+                "max": float(zone_durations.max())
+            }
+        return stats
+
+    def to_chrome_trace(self):
+        """
+        Convert the recorded zones into the Chrome trace-event format.
+
+        Returns:
+            dict: Trace with complete ("X") events, timestamps in microseconds
+                relative to the last `reset`.
+        """
+        starts, ends, name_ids = self.get_zones()
+        pid = os.getpid()
+        trace_events = [{"name": self.names[name_id], "ph": "X", "pid": pid, "tid": 0,
+                         "ts": (start - self.origin) / 1000, "dur": (end - start) / 1000}
+                        for start, end, name_id in zip(starts.tolist(), ends.tolist(), name_ids.tolist())]
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, path):
+        """
+        Write the recorded zones as Chrome trace-event JSON (open it in Perfetto).
+
+        Args:
+            path (str): Output file.
+        """
+        with open(path, "w") as file:
+            json.dump(self.to_chrome_trace(), file)
+
+
@@ -0,0 +1,297 @@
+"""
+Input recording and replay for the Wind-Forge Engine.
+
+Records the normalized events of every frame (the events the window
+backend delivers to `InputState.update`) together with the frame delta
+of the `Clock` into a compact binary file, and replays them as event
+source of the headless backend. Replaying reproduces the same
+`InputState` transitions, so the same session can be profiled and
+regression-tested repeatedly.
+
+Provides:
+- `InputRecorder`: Write events and frame deltas frame by frame.
+- `InputReplay`: Stream the recorded frames from disk (bounded memory).
+
+Typical usage:
+    app = MyApp(record_input="session.wfinput")
+    ...
+    app = MyApp(background_lib=WindowLib.HEADLESS, goal_fps=None,
+                event_source=InputReplay("session.wfinput"))
+
+File format (little endian):
+    header:  magic (7 bytes) | version (uint16)
+    frame:   event count (uint32) | frame delta in seconds (float64)
+    event:   type | code | extra (uint8 each) | controller id (int32) | 4 values (float64 each)
+"""
+
+# -------------------------------
+#        >>> Imports <<<
+# -------------------------------
+import math
+import struct
+
+from .window import EventType, Key, MouseButton, ControllerButton, ControllerAxis, DpadState, \
+                    QuitEvent, WindowEvent, KeyEvent, MouseEvent, MouseWheelEvent, \
+                    ControllerEvent, ControllerButtonEvent, ControllerAxisEvent, \
+                    members_by_value
+
+
+
+# -------------------------------
+# >>> Variables and Constants <<<
+# -------------------------------
+MAGIC = b"WFINPUT"
+VERSION = 1
+
+HEADER_STRUCT = struct.Struct("<7sH")
+FRAME_STRUCT = struct.Struct("<Id")
+EVENT_STRUCT = struct.Struct("<BBBidddd")
+
+# None is stored as NaN (values) / 0 (enum codes, enum values start at 1) / -1 (controller id)
+NONE = math.nan
+
+EVENT_TYPES_BY_VALUE = members_by_value(EventType)
+KEYS_BY_VALUE = members_by_value(Key)
+MOUSE_BUTTONS_BY_VALUE = members_by_value(MouseButton)
+CONTROLLER_BUTTONS_BY_VALUE = members_by_value(ControllerButton)
+CONTROLLER_AXES_BY_VALUE = members_by_value(ControllerAxis)
+DPAD_STATES_BY_VALUE = members_by_value(DpadState)
+
+
+
+# -------------------------------
+#       >>> Functions <<<
+# -------------------------------
+def _value(value):
+    return NONE if value is None else value
+
+def _pair(values):
+    return (NONE, NONE) if values is None else values
+
+def _int_pair(a, b):
+    return None if math.isnan(a) else (int(a), int(b))
+
+def _float_pair(a, b):
+    return None if math.isnan(a) else (a, b)
+
+def _code(member):
+    return 0 if member is None else member.value
+
+def _controller_id(controller_id):
+    return -1 if controller_id is None else controller_id
+
+def encode_event(event):
+    """
+    Convert an event into a fixed-size binary record.
+
+    Args:
+        event (Event): The event to encode.
+
+    Returns:
+        bytes: Record of `EVENT_STRUCT.size` bytes.
+    """
+    event_type = event.type
+    code = extra = 0
+    controller_id = -1
+    a = b = c = d = NONE
+
+    if event_type in (EventType.KEY_DOWN, EventType.KEY_UP):
+        code = _code(event.key)
+    elif event_type in (EventType.MOUSE_MOVE, EventType.MOUSE_DOWN, EventType.MOUSE_UP):
+        code = _code(event.mouse_button)
+        a, b = _pair(event.mouse_position)
+        c, d = _pair(event.mouse_rel)
+    elif event_type == EventType.MOUSE_WHEEL:
+        a, b = _pair(event.mouse_scroll)
+        c, d = _pair(event.mouse_scroll_precise)
+    elif event_type in (EventType.CONTROLLER_ADDED, EventType.CONTROLLER_REMOVED):
+        controller_id = _controller_id(event.controller_id)
+    elif event_type in (EventType.CONTROLLER_BUTTON_DOWN, EventType.CONTROLLER_BUTTON_UP):
+        controller_id = _controller_id(event.controller_id)
+        code = _code(event.controller_button)
+        extra = _code(event.controller_dpad)
+    elif event_type == EventType.CONTROLLER_AXIS_MOVE:
+        controller_id = _controller_id(event.controller_id)
+        code = _code(event.axis)
+        a = _value(event.axis_value)
+    elif event_type == EventType.WINDOW_MOVE:
+        a, b = _pair(event.window_position)
+    elif event_type == EventType.WINDOW_RESIZE:
+        a, b = _pair(event.window_size)
+    elif event_type == EventType.WINDOW_ACCESS:
+        extra = 1 if event.is_accessed else 0
+    elif event_type == EventType.WINDOW_ACTIVATION:
+        extra = 1 if event.is_active else 0
+
+    return EVENT_STRUCT.pack(event_type.value, code, extra, controller_id, a, b, c, d)
+
+def decode_event(event_type_value, code, extra, controller_id, a, b, c, d):
+    """
+    Convert an unpacked binary record back into an event.
+
+    Args:
+        event_type_value, code, extra, controller_id, a, b, c, d: Fields
+            of `EVENT_STRUCT` (see `encode_event`).
+
+    Returns:
+        Event: The decoded event.
+    """
+    event_type = EVENT_TYPES_BY_VALUE[event_type_value]
+    controller_id = None if controller_id < 0 else controller_id
+
+    if event_type in (EventType.KEY_DOWN, EventType.KEY_UP):
+        return KeyEvent(event_type, key=KEYS_BY_VALUE[code])
+    elif event_type in (EventType.MOUSE_MOVE, EventType.MOUSE_DOWN, EventType.MOUSE_UP):
+        return MouseEvent(event_type, mouse_pos=_int_pair(a, b),
+                          mouse_button=MOUSE_BUTTONS_BY_VALUE[code],
+                          mouse_rel=_int_pair(c, d))
+    elif event_type == EventType.MOUSE_WHEEL:
+        return MouseWheelEvent(event_type, mouse_scroll=_int_pair(a, b), mouse_scroll_precise=_float_pair(c, d))
+    elif event_type in (EventType.CONTROLLER_ADDED, EventType.CONTROLLER_REMOVED):
+        return ControllerEvent(event_type, controller_id=controller_id)
+    elif event_type in (EventType.CONTROLLER_BUTTON_DOWN, EventType.CONTROLLER_BUTTON_UP):
+        return ControllerButtonEvent(event_type, controller_id=controller_id,
+                                     controller_button=CONTROLLER_BUTTONS_BY_VALUE[code],
+                                     controller_dpad=DPAD_STATES_BY_VALUE[extra])
+    elif event_type == EventType.CONTROLLER_AXIS_MOVE:
+        return ControllerAxisEvent(event_type, controller_id=controller_id,
+                                   axis=CONTROLLER_AXES_BY_VALUE[code],
+                                   axis_value=None if math.isnan(a) else a)
+    elif event_type == EventType.WINDOW_MOVE:
+        return WindowEvent(event_type, window_position=_int_pair(a, b))
+    elif event_type == EventType.WINDOW_RESIZE:
+        return WindowEvent(event_type, window_size=_int_pair(a, b))
+    elif event_type == EventType.WINDOW_ACCESS:
+        return WindowEvent(event_type, is_accessed=bool(extra))
+    elif event_type == EventType.WINDOW_ACTIVATION:
+        return WindowEvent(event_type, is_active=bool(extra))
+    return QuitEvent(event_type)
+
+
+
+# -------------------------------
+#        >>> Classes <<<
+# -------------------------------
+class InputRecorder(object):
+    """
+    Record the events and frame deltas of a session into a binary file.
+
+    Events of a frame are collected with `record_events` (done by
+    `Window.events()` when the recorder is set as `window.recorder`) and
+    written together with the frame delta by `end_frame` (done by
+    `GraphicsApplication.run` after `clock.tick()`).
+
+    Args:
+        path (str): File to write (gets overwritten).
+    """
+    def __init__(self, path):
+        self.path = path
+        self.recorded_frames = 0
+        self._frame_events = []
+        self._file = open(path, "wb")
+        self._file.write(HEADER_STRUCT.pack(MAGIC, VERSION))
+
+    def record_events(self, events):
+        """
+        Add events to the current frame.
+
+        Args:
+            events (list[Event]): Events delivered by the window backend.
+        """
+        self._frame_events += [encode_event(event) for event in events]
+
+    def end_frame(self, frame_time):
+        """
+        Write the current frame and start a new one.
+
+        Args:
+            frame_time (float): Delta time of the frame in seconds.
+        """
+        self._file.write(FRAME_STRUCT.pack(len(self._frame_events), frame_time))
+        self._file.write(b"".join(self._frame_events))
+        self._frame_events = []
+        self.recorded_frames += 1
+
+    def close(self):
+        """
+        Flush and close the file.
+
+        Events of an unfinished frame (e.g. the frame in which the
+        application crashed) get written as last frame with delta 0, so
+        the replay reaches the crash. Its delta would only feed the next
+        frame.
+        """
+        if not self._file.closed:
+            if self._frame_events:
+                self.end_frame(0.0)
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+
+class InputReplay(object):
+    """
+    Replay a recorded session frame by frame.
+
+    Can be used directly as `event_source` of the HEADLESS backend:
+    every iteration reads one frame from disk, so memory stays bounded
+    independent of the session length. The recorded delta of the
+    frame which was yielded last is available as `frame_time`
+    (`GraphicsApplication` uses it instead of the measured delta).
+
+    Args:
+        path (str): File written by `InputRecorder`.
+
+    Raises:
+        ValueError: If the file is no Wind-Forge input recording or has an unknown version.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.frame_time = 0.0
+        # check the header early
+        with open(path, "rb") as file:
+            self._read_header(file)
+
+    @staticmethod
+    def _read_header(file):
+        header = file.read(HEADER_STRUCT.size)
+        if len(header) < HEADER_STRUCT.size:
+            raise ValueError("File is no Wind-Forge input recording (too short).")
+        magic, version = HEADER_STRUCT.unpack(header)
+        if magic != MAGIC:
+            raise ValueError("File is no Wind-Forge input recording.")
+        if version != VERSION:
+            raise ValueError(f"Unsupported input recording version {version} (supported: {VERSION}).")
+
+    def frames(self):
+        """
+        Stream the recorded frames.
+
+        Yields:
+            tuple[list[Event], float]: Events and delta time of each frame.
+        """
+        with open(self.path, "rb") as file:
+            self._read_header(file)
+            while True:
+                frame_header = file.read(FRAME_STRUCT.size)
+                if len(frame_header) < FRAME_STRUCT.size:
+                    return
+                n_events, frame_time = FRAME_STRUCT.unpack(frame_header)
+                data = file.read(n_events * EVENT_STRUCT.size)
+                if len(data) < n_events * EVENT_STRUCT.size:
+                    # truncated recording (e.g. crashed session)
+                    return
+                events = [decode_event(*record) for record in EVENT_STRUCT.iter_unpack(data)]
+                yield events, frame_time
+
+    def __iter__(self):
+        for events, frame_time in self.frames():
+            self.frame_time = frame_time
+            yield events
+
+
@@ -2,20 +2,314 @@
 Time utilities for frame rate control and delayed execution.
 
 Provides:
+- `FrameStats`: Ring buffer of frame times with running mean/variance and percentiles.
+- `LatencyTracker`: Input-to-present latency of timestamped events.
 - `Clock`: Maintain a target FPS with frame-independent timing.
+- `FrameRateGovernor`: Lowers the target FPS while inactive, idle or over budget.
 - `Timer`: Execute functions after a time delay or frame delay.
+- `TimerScheduler`: Central heap of many timers, checked with one clock read per frame.
 """
 
 # -------------------------------
 #        >>> Imports <<<
 # -------------------------------
 import time
+from time import perf_counter_ns
+import heapq
+import itertools
+from bisect import bisect_right
+from enum import Enum, auto
+
+import numpy as np
+
+
+
+# -------------------------------
+# >>> Variables and Constants <<<
+# -------------------------------
+# upper bounds (seconds) of the overshoot histogram bins, the last bin collects everything above
+OVERSHOOT_BINS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.002, 0.004)
+
+# upper bounds (seconds) of the input latency histogram bins, the last bin collects everything above
+LATENCY_BINS = (0.004, 0.008, 0.016, 0.033, 0.050, 0.100)
+
+# remaining time (seconds) before a deadline which gets spun instead of slept in the precise pacing
+DEFAULT_SPIN_THRESHOLD = 0.002
+
+# frames used for the FPS values (get_fps, get_potential_fps, last_frames)
+FPS_AVERAGE_FRAMES = 8
+
+class GovernorMode(Enum):
+    FULL = auto()       # goal FPS
+    BACKOFF = auto()    # goal FPS / n, frames took longer than the budget
+    INACTIVE = auto()   # window unfocused or minimized
+    IDLE = auto()       # no input for a while -> render on demand
+
+
+
+# -------------------------------
+#       >>> Functions <<<
+# -------------------------------
+def _sorted_percentile(sorted_values, q):
+    # linear interpolation like np.percentile, on already sorted values
+    position = q / 100 * (len(sorted_values) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return float(sorted_values[lower] * (1 - fraction) + sorted_values[upper] * fraction)
 
 
 
 # -------------------------------
 #        >>> Classes <<<
 # -------------------------------
+class FrameStats(object):
+    """
+    Fixed-size ring buffer of frame times with statistics.
+
+    Adding a frame time is O(1) and updates the running mean and variance
+    of the buffered frames (sliding Welford update). Percentiles, 1% lows
+    and stutters are computed on demand from the buffer and cached until
+    the next frame, so querying them every frame stays cheap.
+
+    Args:
+        capacity (int, optional): Number of frame times to keep. Default 240.
+        stutter_factor (float, optional): A frame counts as stutter if it takes longer
+            than `stutter_factor` times the median frame time. Default 2.0.
+    """
+    def __init__(self, capacity=240, stutter_factor=2.0):
+        if capacity < 1:
+            raise ValueError(f"FrameStats capacity has to be at least 1 (got {capacity}).")
+        self.capacity = capacity
+        self.stutter_factor = stutter_factor
+        self.buffer = np.zeros(capacity, dtype=np.float64)
+        self.reset()
+
+    def reset(self):
+        """
+        Remove all frame times.
+        """
+        self.index = 0      # next write position
+        self.count = 0      # buffered frame times
+        self.total = 0      # frame times added since the last reset
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._stats_cache = None
+
+    def add(self, frame_time):
+        """
+        Add a frame time (overwrites the oldest one if the buffer is full).
+
+        Args:
+            frame_time (float): Frame time in seconds.
+        """
+        frame_time = float(frame_time)
+        if self.count < self.capacity:
+            self.count += 1
+            delta = frame_time - self.mean
+            self.mean += delta / self.count
+            self._m2 += delta * (frame_time - self.mean)
+        else:
+            old = float(self.buffer[self.index])
+            old_mean = self.mean
+            self.mean += (frame_time - old) / self.count
+            self._m2 += (frame_time - old) * (frame_time - self.mean + old - old_mean)
+        self.buffer[self.index] = frame_time
+        self.index = (self.index + 1) % self.capacity
+        self.total += 1
+
+    @property
+    def variance(self):
+        """
+        float: Population variance of the buffered frame times.
+        """
+        return max(self._m2, 0.0) / self.count if self.count > 0 else 0.0
+
+    @property
+    def std(self):
+        """
+        float: Standard deviation of the buffered frame times.
+        """
+        return self.variance ** 0.5
+
+    def values(self):
+        """
+        Get the buffered frame times from the oldest to the newest.
+
+        Returns:
+            np.ndarray: Copy of the frame times.
+        """
+        if self.count < self.capacity:
+            return self.buffer[:self.count].copy()
+        return np.concatenate((self.buffer[self.index:], self.buffer[:self.index]))
+
+    def last(self, n):
+        """
+        Get the newest `n` frame times from the oldest to the newest.
+
+        Args:
+            n (int): Number of frame times.
+
+        Returns:
+            np.ndarray: Copy of the (at most `n`) newest frame times.
+        """
+        n = min(n, self.count)
+        indices = (np.arange(self.index - n, self.index)) % self.capacity
+        return self.buffer[indices]
+
+    def percentile(self, q):
+        """
+        Get a percentile of the buffered frame times.
+
+        Args:
+            q (float | list[float]): Percentile(s) between 0 and 100.
+
+        Returns:
+            float | np.ndarray: Frame time(s) in seconds (0.0 without frames).
+        """
+        if self.count == 0:
+            return 0.0 if np.ndim(q) == 0 else np.zeros(len(q))
+        return np.percentile(self.buffer[:self.count], q)
+
+    def get_stats(self):
+        """
+        Get the statistics of the buffered frame times.
+
+        Returns:
+            dict: A dictionary containing (times in seconds):
+                - "frames" (int): Buffered frame times.
+                - "mean", "std", "min", "max" (float): Frame time statistics.
+                - "p50", "p95", "p99" (float): Frame time percentiles.
+                - "fps" (float): Average FPS (frames / time, not the mean of the single FPS values).
+                - "low_1_fps" (float): Average FPS of the slowest 1% frames.
+                - "stutters" (int): Frames longer than `stutter_factor` times the median.
+        """
+        if self._stats_cache is not None and self._stats_cache[0] == self.total:
+            return self._stats_cache[1]
+
+        if self.count == 0:
+            stats = {"frames": 0, "mean": 0.0, "std": 0.0, "min": 0.0, "max": 0.0,
+                     "p50": 0.0, "p95": 0.0, "p99": 0.0, "fps": 0.0, "low_1_fps": 0.0, "stutters": 0}
+        else:
+            # one sort serves percentiles, min/max, 1% lows and stutters
+            frame_times = np.sort(self.buffer[:self.count])
+            p50, p95, p99 = (_sorted_percentile(frame_times, q) for q in (50, 95, 99))
+            n_low = max(1, self.count // 100)
+            slowest_mean = float(frame_times[-n_low:].mean())
+            stats = {
+                "frames": self.count,
+                "mean": self.mean,
+                "std": self.std,
+                "min": float(frame_times[0]),
+                "max": float(frame_times[-1]),
+                "p50": p50,
+                "p95": p95,
+                "p99": p99,
+                "fps": 1 / self.mean if self.mean > 0 else 0.0,
+                "low_1_fps": 1 / slowest_mean if slowest_mean > 0 else 0.0,
+                "stutters": self.count - int(np.searchsorted(frame_times, self.stutter_factor * p50, side="right"))
+            }
+        self._stats_cache = (self.total, stats)
+        return stats
+
+
+
+class LatencyTracker(object):
+    """
+    Measures the input latency: from the timestamp of an event to the
+    buffer swap of the frame which consumed it.
+
+    `Window.events()` passes the events of a frame to `consume`,
+    `Window.display()` calls `presented` after the buffer swap. Every
+    consumed event with a `timestamp` (`perf_counter_ns`, set by the
+    backends when they poll the input) then adds one latency. Frames
+    without a swap (e.g. skipped rendering) carry their events to the
+    next presented frame.
+
+    The swap is the last point the application sees, so the values are
+    input-to-present: display scanout and compositor are not included,
+    the time an event waited in the OS queue before the poll neither.
+
+    Args:
+        capacity (int, optional): Number of latencies kept for the percentiles. Default 1024.
+        event_types (set[EventType], optional): Only track these event types
+            (e.g. key and button presses). Default None (every timestamped event).
+    """
+    def __init__(self, capacity=1024, event_types=None):
+        self.event_types = event_types
+        self.latencies = FrameStats(capacity=capacity)
+        self._pending = []
+        self.reset()
+
+    def reset(self):
+        """
+        Remove all measured latencies (pending events are kept).
+        """
+        self.latencies.reset()
+        self.histogram = [0] * (len(LATENCY_BINS) + 1)
+        self.max = 0.0
+
+    def consume(self, events):
+        """
+        Tag the timestamped events of the current frame.
+
+        Args:
+            events (list[Event]): Events consumed by the current frame.
+        """
+        event_types = self.event_types
+        for event in events:
+            timestamp = event.timestamp
+            if timestamp is not None and (event_types is None or event.type in event_types):
+                self._pending.append(timestamp)
+
+    def presented(self, now=None):
+        """
+        Complete the tagged events with the buffer swap of their frame.
+
+        Args:
+            now (int, optional): Swap time (`perf_counter_ns`). Default is the current time.
+        """
+        if not self._pending:
+            return
+        if now is None:
+            now = perf_counter_ns()
+        add = self.latencies.add
+        histogram = self.histogram
+        for timestamp in self._pending:
+            latency = (now - timestamp) / 1e9
+            add(latency)
+            histogram[bisect_right(LATENCY_BINS, latency)] += 1
+            if latency > self.max:
+                self.max = latency
+        self._pending.clear()
+
+    def get_stats(self):
+        """
+        Get the latency statistics.
+
+        Returns:
+            dict: A dictionary containing (times in seconds):
+                - "events" (int): Measured events since the last reset.
+                - "mean", "std", "min", "max", "p50", "p95", "p99" (float): Latency statistics
+                  of the last `capacity` events ("max" since the last reset).
+                - "histogram" (dict): Count of events per latency bin since the last reset,
+                  keyed by the upper bound of the bin in seconds (`inf` for the last bin).
+        """
+        stats = self.latencies.get_stats()
+        return {
+            "events": self.latencies.total,
+            "mean": stats["mean"],
+            "std": stats["std"],
+            "min": stats["min"],
+            "max": self.max,
+            "p50": stats["p50"],
+            "p95": stats["p95"],
+            "p99": stats["p99"],
+            "histogram": dict(zip(LATENCY_BINS + (float("inf"),), self.histogram))
+        }
+
+
+
 class Clock(object):
     """
     Clock to keep a consistent FPS.
@@ -24,16 +318,43 @@ class Clock(object):
     if rendering is too fast, and provides both corrected and uncorrected
     frame times for FPS measurement.
 
+    With `precise_pacing` the frames are scheduled against absolute
+    deadlines (`start + n / goal_fps`) instead of sleeping the remaining
+    time of each frame: the clock sleeps until shortly before the deadline
+    and yields in a spin loop for the last `spin_threshold` seconds (the
+    sleep of the OS often overshoots by 1-2 ms). One timestamp ends a frame
+    and starts the next, so the time spent in `tick` does not drift out of
+    the budget. The deviation from the deadlines is collected in the jitter
+    statistics (`get_jitter_stats`).
+
     Args:
         goal_fps (int): Target frames per second.
+        precise_pacing (bool, optional): Use the deadline based pacing. Default False.
+        spin_threshold (float, optional): Seconds before a deadline where the precise
+            pacing stops sleeping and spins. Default 0.002.
+        history_length (int, optional): Number of frame times kept for the frame
+            statistics (`frame_stats`, `potential_frame_stats`). Default 240.
+
+    Attributes:
+        latency (LatencyTracker): Input latency of the consumed events (fed by the
+            `Window` of a `GraphicsApplication`, see `get_latency_stats`).
     """
-    def __init__(self, goal_fps):
+    def __init__(self, goal_fps, precise_pacing=False, spin_threshold=DEFAULT_SPIN_THRESHOLD, history_length=240):
         self.goal_fps = goal_fps
+        self.precise_pacing = precise_pacing
+        self.spin_threshold = spin_threshold
         self.frame_time = 0
         self.frame_time_corrected = 0
         self.start_time = time.perf_counter()
-        self.last_frames = list()
-        self.last_frames_corrected = list()
+        # frame times with (frame_stats) and without (potential_frame_stats) waiting
+        self.frame_stats = FrameStats(capacity=history_length)
+        self.potential_frame_stats = FrameStats(capacity=history_length)
+        # input-to-present latency
+        self.latency = LatencyTracker()
+
+        # precise pacing
+        self.deadline = None
+        self.reset_jitter_stats()
 
     def set_fps(self, new_fps):
         """
@@ -43,6 +364,76 @@ class Clock(object):
             new_fps (int): New target FPS.
         """
         self.goal_fps = new_fps
+        # start a new deadline sequence
+        self.deadline = None
+
+    def reset_jitter_stats(self):
+        """
+        Reset the jitter statistics of the precise pacing.
+        """
+        self.paced_frames = 0
+        self.missed_deadlines = 0
+        self.overshoot_sum = 0.0
+        self.overshoot_max = 0.0
+        self.overshoot_histogram = [0] * (len(OVERSHOOT_BINS) + 1)
+
+    def get_jitter_stats(self):
+        """
+        Get the jitter statistics of the precise pacing.
+
+        A deadline is missed if the frame was already too late when
+        `tick` was called (no waiting possible). The overshoot is the
+        time between the deadline and the end of the waiting.
+
+        Returns:
+            dict: A dictionary containing:
+                - "frames" (int): Paced frames.
+                - "missed_deadlines" (int): Frames which ended after their deadline.
+                - "overshoot_mean" (float): Mean overshoot of the waited frames in seconds.
+                - "overshoot_max" (float): Maximum overshoot in seconds.
+                - "overshoot_histogram" (dict): Count of waited frames per overshoot bin,
+                  keyed by the upper bound of the bin in seconds (`inf` for the last bin).
+        """
+        waited_frames = self.paced_frames - self.missed_deadlines
+        return {
+            "frames": self.paced_frames,
+            "missed_deadlines": self.missed_deadlines,
+            "overshoot_mean": self.overshoot_sum / waited_frames if waited_frames > 0 else 0.0,
+            "overshoot_max": self.overshoot_max,
+            "overshoot_histogram": dict(zip(OVERSHOOT_BINS + (float("inf"),), self.overshoot_histogram))
+        }
+
+    def _wait_until(self, deadline):
+        # coarse sleep, then yield until the deadline is reached
+        remaining = deadline - time.perf_counter()
+        if remaining > self.spin_threshold:
+            time.sleep(remaining - self.spin_threshold)
+        now = time.perf_counter()
+        while now < deadline:
+            time.sleep(0)
+            now = time.perf_counter()
+        return now
+
+    def _tick_precise(self, now):
+        frame_duration = 1 / self.goal_fps
+        if self.deadline is None:
+            self.deadline = self.start_time
+        self.deadline += frame_duration
+        self.paced_frames += 1
+
+        if now >= self.deadline:
+            # too late -> no waiting, restart the deadline sequence from now (no catch-up burst)
+            self.missed_deadlines += 1
+            self.deadline = now
+            return now
+
+        end = self._wait_until(self.deadline)
+        overshoot = end - self.deadline
+        self.overshoot_sum += overshoot
+        if overshoot > self.overshoot_max:
+            self.overshoot_max = overshoot
+        self.overshoot_histogram[bisect_right(OVERSHOOT_BINS, overshoot)] += 1
+        return end
 
     # aliase: update, tick
     def tick(self):
@@ -59,12 +450,19 @@ class Clock(object):
         now = time.perf_counter()
         self.frame_time = now - self.start_time
 
-        # update history queue
-        if len(self.last_frames) >= 8:
-            self.last_frames.pop(0)
-        self.last_frames += [self.frame_time]
+        # update history
+        self.potential_frame_stats.add(self.frame_time)
+
+        if self.precise_pacing and self.goal_fps:
+            # one timestamp ends this frame and starts the next (drift-free)
+            end = self._tick_precise(now)
+            self.frame_time_corrected = end - self.start_time
+            self.frame_stats.add(self.frame_time_corrected)
+            self.start_time = end
+            return self.frame_time_corrected
         
         # check if frame was too fast
+        self.deadline = None
         if self.goal_fps:
             frame_duration = 1 / self.goal_fps
             if self.frame_time < frame_duration:
@@ -72,10 +470,8 @@ class Clock(object):
         
         # get corrected frametime
         self.frame_time_corrected = time.perf_counter() - self.start_time
-        # update history queue (corrected frametime)
-        if len(self.last_frames_corrected) >= 8:
-            self.last_frames_corrected.pop(0)
-        self.last_frames_corrected += [self.frame_time_corrected]
+        # update history (corrected frametime)
+        self.frame_stats.add(self.frame_time_corrected)
 
         # reset frame start time for new frame
         self.start_time = time.perf_counter()
@@ -90,22 +486,36 @@ class Clock(object):
         """
         return self.tick()
     
+    @property
+    def last_frames(self):
+        """
+        list[float]: The last 8 frame times without waiting.
+        """
+        return self.potential_frame_stats.last(FPS_AVERAGE_FRAMES).tolist()
+
+    @property
+    def last_frames_corrected(self):
+        """
+        list[float]: The last 8 frame times with waiting.
+        """
+        return self.frame_stats.last(FPS_AVERAGE_FRAMES).tolist()
+
     def calc_avg_fps(self, fps_list):
         """
         Compute the average FPS from a list of frame times.
 
+        Divides the number of frames by their total time (averaging the
+        single FPS values would overweight the fast frames).
+
         Args:
             fps_list (list[float]): List of frame times in seconds.
 
         Returns:
             int: Average FPS (rounded).
         """
-        if len(fps_list) > 0:
-            return int( 
-                        round( 
-                            sum( (1 / t if t > 0 else 0) for t in fps_list ) / len(fps_list) 
-                        )   
-                    )
+        total_time = float(np.sum(fps_list)) if len(fps_list) > 0 else 0.0
+        if total_time > 0:
+            return int(round(len(fps_list) / total_time))
         else:
             return 0
 
@@ -118,7 +528,7 @@ class Clock(object):
         Returns:
             int: Frames per second.
         """
-        return self.calc_avg_fps(self.last_frames_corrected)
+        return self.calc_avg_fps(self.frame_stats.last(FPS_AVERAGE_FRAMES))
     
     def get_potential_fps(self):
         """
@@ -129,7 +539,169 @@ class Clock(object):
         Returns:
             int: Frames per second.
         """
-        return self.calc_avg_fps(self.last_frames)
+        return self.calc_avg_fps(self.potential_frame_stats.last(FPS_AVERAGE_FRAMES))
+
+    def get_frame_stats(self, potential=False):
+        """
+        Get the statistics of the last `history_length` frames.
+
+        Args:
+            potential (bool, optional): Use the frame times without waiting
+                instead of the corrected ones. Default False.
+
+        Returns:
+            dict: See `FrameStats.get_stats`.
+        """
+        return (self.potential_frame_stats if potential else self.frame_stats).get_stats()
+
+    def get_latency_stats(self):
+        """
+        Get the input latency statistics (event timestamp -> buffer swap).
+
+        Returns:
+            dict: See `LatencyTracker.get_stats`.
+        """
+        return self.latency.get_stats()
+
+
+
+class FrameRateGovernor(object):
+    """
+    Adapts the target frame rate of a main loop to the situation.
+
+    Called once per frame with the input and window state (see
+    `GraphicsApplication(governor=...)`), it returns the FPS to pace with:
+
+    - INACTIVE: The window is unfocused or minimized -> `inactive_fps`.
+    - IDLE: No input for `idle_timeout` seconds -> the loop only polls the
+      input with `idle_fps` and renders on demand (`request_redraw`).
+    - BACKOFF: The smoothed frame time (without waiting) exceeds the
+      budget of the goal FPS -> the goal FPS is divided by the smallest
+      integer which fits the frame time (60 -> 30 -> 20 ...), so the
+      frames get paced evenly instead of missing every other deadline.
+      It steps up again once the frame time fits the higher rate with
+      `recover_headroom`, at most every `backoff_frames` frames.
+    - FULL: The goal FPS.
+
+    Any input restores the full rate (or the back-off rate) in the same
+    frame.
+
+    Args:
+        idle_timeout (float, optional): Seconds without input until the idle mode.
+            None disables the idle mode. Default 10.0.
+        idle_fps (float, optional): Input polling rate of the idle mode. Default 20.
+        inactive_fps (float, optional): Frame rate while the window is inactive.
+            None disables the inactive mode. Default 10.
+        backoff (bool, optional): Lower the rate when the frames are over budget. Default True.
+        backoff_frames (int, optional): Frames of the frame time smoothing and minimum
+            frames between two back-off steps. Default 30.
+        max_backoff (int, optional): Largest divisor of the goal FPS. Default 4.
+        recover_headroom (float, optional): Share of the higher rate's budget the frame
+            time has to stay below to step up again. Default 0.8.
+    """
+    def __init__(self, idle_timeout=10.0, idle_fps=20, inactive_fps=10, backoff=True,
+                 backoff_frames=30, max_backoff=4, recover_headroom=0.8):
+        self.idle_timeout = idle_timeout
+        self.idle_fps = idle_fps
+        self.inactive_fps = inactive_fps
+        self.backoff = backoff
+        self.backoff_frames = backoff_frames
+        self.max_backoff = max_backoff
+        self.recover_headroom = recover_headroom
+
+        self.mode = GovernorMode.FULL
+        self.divisor = 1
+        self.work_time = 0.0
+        self.last_input_time = time.perf_counter()
+        self.redraw_requested = True
+        self._frames_since_step = 0
+
+    def notify_input(self, now=None):
+        """
+        Report user input (ends the idle mode).
+
+        Args:
+            now (float, optional): Time of the input (`time.perf_counter()`). Default now.
+        """
+        self.last_input_time = time.perf_counter() if now is None else now
+        self.redraw_requested = True
+
+    def request_redraw(self):
+        """
+        Render the next frame also in the idle mode (e.g. content changed).
+        """
+        self.redraw_requested = True
+
+    def should_render(self):
+        """
+        Check whether the current frame has to be rendered.
+
+        Always True outside the idle mode. In the idle mode only after
+        `request_redraw` (or input), the request gets consumed.
+
+        Returns:
+            bool: Whether to render the current frame.
+        """
+        if self.mode != GovernorMode.IDLE:
+            return True
+        requested = self.redraw_requested
+        self.redraw_requested = False
+        return requested
+
+    def _update_backoff(self, work_time, goal_fps):
+        # exponential smoothing over ~backoff_frames frames
+        self.work_time += (work_time - self.work_time) / self.backoff_frames
+        self._frames_since_step += 1
+        if self._frames_since_step < self.backoff_frames:
+            return
+        budget = self.divisor / goal_fps
+        if self.work_time > budget and self.divisor < self.max_backoff:
+            # smallest divisor whose budget fits the frame time
+            self.divisor = min(self.max_backoff, max(self.divisor + 1, int(self.work_time * goal_fps) + 1))
+            self._frames_since_step = 0
+        elif self.divisor > 1 and self.work_time < self.recover_headroom * (self.divisor - 1) / goal_fps:
+            self.divisor -= 1
+            self._frames_since_step = 0
+
+    def update(self, goal_fps, work_time, has_input=False, is_active=True, now=None):
+        """
+        Determine the target frame rate of the next frame.
+
+        Args:
+            goal_fps (float | None): Full frame rate (None = unlimited).
+            work_time (float): Frame time without waiting of the last frame in seconds.
+            has_input (bool, optional): Whether the current frame received user input. Default False.
+            is_active (bool, optional): Whether the window is focused and visible. Default True.
+            now (float, optional): Current time (`time.perf_counter()`). Default now.
+
+        Returns:
+            float | None: Target FPS for the `Clock`.
+        """
+        if now is None:
+            now = time.perf_counter()
+        if has_input:
+            self.notify_input(now)
+
+        if goal_fps and self.backoff and self.mode in (GovernorMode.FULL, GovernorMode.BACKOFF):
+            # only frames which render count for the budget
+            self._update_backoff(work_time, goal_fps)
+
+        if not is_active and self.inactive_fps:
+            self.mode = GovernorMode.INACTIVE
+            return self.inactive_fps if not goal_fps else min(goal_fps, self.inactive_fps)
+
+        if self.idle_timeout is not None and now - self.last_input_time >= self.idle_timeout:
+            if self.mode != GovernorMode.IDLE:
+                # present the last state once more, then only on demand
+                self.redraw_requested = True
+            self.mode = GovernorMode.IDLE
+            return self.idle_fps if not goal_fps else min(goal_fps, self.idle_fps)
+
+        if goal_fps and self.divisor > 1:
+            self.mode = GovernorMode.BACKOFF
+            return goal_fps / self.divisor
+        self.mode = GovernorMode.FULL
+        return goal_fps
 
 
 
@@ -240,3 +812,263 @@ class Timer(object):
         frame_timer_finish = self.frames_to_wait < self.waited_frames
         return second_timer_finish and frame_timer_finish
 
+
+
+class ScheduledTimer(object):
+    """
+    Handle of a timer in a `TimerScheduler` (created by `TimerScheduler.schedule`).
+
+    Like `Timer` it waits first the seconds and then the frames before
+    calling `call_func`.
+
+    Attributes:
+        call_func (callable): Function to call when the timer finishes.
+        call_attributes (list | None): Arguments to pass to the function.
+        seconds_to_wait (float): Seconds to wait.
+        frames_to_wait (int): Frames to wait (after the seconds).
+        repeat (bool): Whether to start again after finishing.
+        active (bool): False if the timer finished (without repeat) or got cancelled.
+        calls (int): How often the function was called.
+    """
+    def __init__(self, scheduler, call_func, call_attributes, seconds_to_wait, frames_to_wait, repeat):
+        self.scheduler = scheduler
+        self.call_func = call_func
+        self.call_attributes = call_attributes
+        self.seconds_to_wait = seconds_to_wait
+        self.frames_to_wait = frames_to_wait
+        self.repeat = repeat
+        self.active = True
+        self.calls = 0
+        # heap entries with another generation are outdated (cancelled/rescheduled)
+        self.generation = 0
+
+    def cancel(self):
+        """
+        Remove the timer from its scheduler.
+        """
+        self.scheduler.cancel(self)
+
+    def reschedule(self, seconds_to_wait=None, frames_to_wait=None):
+        """
+        Restart the waiting from now (optionally with new waiting values).
+
+        Args:
+            seconds_to_wait (float, optional): New seconds to wait. Default keeps the current.
+            frames_to_wait (int, optional): New frames to wait. Default keeps the current.
+        """
+        self.scheduler.reschedule(self, seconds_to_wait=seconds_to_wait, frames_to_wait=frames_to_wait)
+
+    def __repr__(self):
+        return (f"ScheduledTimer(seconds_to_wait={self.seconds_to_wait}, frames_to_wait={self.frames_to_wait}, "
+                f"repeat={self.repeat}, active={self.active}, calls={self.calls})")
+
+
+
+class TimerScheduler(object):
+    """
+    Central scheduler for many timers.
+
+    Instead of ticking every `Timer` each frame, the pending timers are
+    kept in two heaps, one keyed by deadline time and one keyed by deadline
+    frame. `tick` is called once per frame with one shared timestamp and
+    only touches the timers which are due, so a frame without finished
+    timers costs O(1) independent of the number of timers. Scheduling,
+    cancelling and rescheduling are O(log n) (cancelled entries are
+    removed lazily).
+
+    A timer waits `seconds_to_wait` and then `frames_to_wait` ticks and
+    fires at the first tick where both are reached. Due timers fire in
+    order of their deadline (a frame deadline counts as reached at the
+    tick time, ties in scheduling order); a timer which an earlier callback
+    of the same tick cancels or reschedules does not fire; a repeating timer
+    fires at most once per tick and its next deadline continues from the
+    former deadline (no drift), unless it is already behind.
+
+    `GraphicsApplication` owns one as `self.timers` and ticks it at the
+    begin of every frame with the frame start time of its `Clock`.
+
+    Args:
+        now (float, optional): Start time (`time.perf_counter()` based). Default now.
+    """
+    def __init__(self, now=None):
+        self.now = time.perf_counter() if now is None else now
+        self.frame = 0
+        self._time_heap = []    # (deadline time, order, generation, timer)
+        self._frame_heap = []   # (deadline frame, order, generation, timer)
+        self._order = itertools.count()
+        self._active = 0
+        self._stale = 0
+
+    def __len__(self):
+        return self._active
+
+    def schedule(self, call_func=None, call_attributes=None, seconds_to_wait=0, frames_to_wait=0, repeat=False):
+        """
+        Add a timer.
+
+        Args:
+            call_func (callable, optional): Function to call when the timer finishes.
+            call_attributes (list, optional): Arguments to pass to the function.
+            seconds_to_wait (float, optional): Seconds to wait. Default 0.
+            frames_to_wait (int, optional): Frames to wait (after the seconds). Default 0.
+            repeat (bool, optional): Whether to repeat after finishing. Default False.
+
+        Returns:
+            ScheduledTimer: Handle to cancel or reschedule the timer.
+        """
+        if call_attributes is not None and type(call_attributes) != list:
+            call_attributes = [call_attributes]
+        elif call_attributes is not None and len(call_attributes) == 0:
+            call_attributes = None
+        timer = ScheduledTimer(self, call_func, call_attributes, seconds_to_wait, frames_to_wait, repeat)
+        self._active += 1
+        self._push(timer, self.now + seconds_to_wait)
+        return timer
+
+    def cancel(self, timer):
+        """
+        Remove a timer (does nothing if it is not active anymore).
+
+        Args:
+            timer (ScheduledTimer): The timer to remove.
+        """
+        if not timer.active:
+            return
+        timer.active = False
+        timer.generation += 1
+        self._active -= 1
+        self._mark_stale()
+
+    def reschedule(self, timer, seconds_to_wait=None, frames_to_wait=None):
+        """
+        Restart the waiting of a timer from now (also reactivates finished or cancelled timers).
+
+        Args:
+            timer (ScheduledTimer): The timer to restart.
+            seconds_to_wait (float, optional): New seconds to wait. Default keeps the current.
+            frames_to_wait (int, optional): New frames to wait. Default keeps the current.
+        """
+        if seconds_to_wait is not None:
+            timer.seconds_to_wait = seconds_to_wait
+        if frames_to_wait is not None:
+            timer.frames_to_wait = frames_to_wait
+
+        if timer.active:
+            timer.generation += 1
+            self._mark_stale()
+        else:
+            timer.active = True
+            self._active += 1
+        self._push(timer, self.now + timer.seconds_to_wait)
+
+    def clear(self):
+        """
+        Cancel all timers.
+        """
+        for _, _, generation, timer in self._time_heap + self._frame_heap:
+            if timer.generation == generation:
+                timer.active = False
+                timer.generation += 1
+        self._time_heap = []
+        self._frame_heap = []
+        self._active = 0
+        self._stale = 0
+
+    def tick(self, now=None):
+        """
+        Advance one frame and call the functions of all due timers.
+
+        Should be called once per frame.
+
+        Args:
+            now (float, optional): Current time (`time.perf_counter()` based),
+                for example the frame start of a `Clock`. Default reads the clock.
+
+        Returns:
+            int: Number of called timers.
+        """
+        self.now = now = time.perf_counter() if now is None else now
+        self.frame += 1
+        time_heap = self._time_heap
+        frame_heap = self._frame_heap
+        # (deadline time, order, generation, timer); frame deadlines are reached with this tick -> `now`
+        due = []
+
+        # seconds phase finished -> due or start of the frames phase
+        while time_heap and time_heap[0][0] <= now:
+            deadline, order, generation, timer = heapq.heappop(time_heap)
+            if timer.generation != generation:
+                self._stale -= 1
+            elif timer.frames_to_wait > 0:
+                heapq.heappush(frame_heap, (self.frame + timer.frames_to_wait, order, generation, timer))
+            else:
+                due.append((deadline, order, generation, timer))
+
+        frame_due = False
+        while frame_heap and frame_heap[0][0] <= self.frame:
+            _, order, generation, timer = heapq.heappop(frame_heap)
+            if timer.generation != generation:
+                self._stale -= 1
+            else:
+                due.append((now, order, generation, timer))
+                frame_due = True
+        if frame_due:
+            # merge both heaps by deadline (ties in scheduling order)
+            due.sort(key=lambda entry: entry[:2])
+
+        # repeating timers get pushed after calling -> at most one call per tick
+        called = 0
+        for deadline, order, generation, timer in due:
+            # cancelled or rescheduled by an earlier callback of this tick
+            if timer.generation != generation:
+                # its stale mark counted this (already popped) entry
+                if self._stale:
+                    self._stale -= 1
+                continue
+            if timer.frames_to_wait > 0:
+                # frame based -> the next period starts from now
+                deadline = None
+            if timer.repeat:
+                if deadline is None or deadline + timer.seconds_to_wait <= now:
+                    # frame based or behind -> start from now
+                    deadline = now
+                self._push(timer, deadline + timer.seconds_to_wait)
+            else:
+                timer.active = False
+                timer.generation += 1
+                self._active -= 1
+            timer.calls += 1
+            called += 1
+            if timer.call_func:
+                if timer.call_attributes:
+                    timer.call_func(*timer.call_attributes)
+                else:
+                    timer.call_func()
+        return called
+
+    def update(self, now=None):
+        """
+        Alias for :meth:`tick`.
+
+        Returns:
+            int: Number of called timers.
+        """
+        return self.tick(now=now)
+
+    def _push(self, timer, deadline):
+        if timer.seconds_to_wait > 0 or timer.frames_to_wait == 0:
+            heapq.heappush(self._time_heap, (deadline, next(self._order), timer.generation, timer))
+        else:
+            # only frames to wait
+            heapq.heappush(self._frame_heap, (self.frame + timer.frames_to_wait, next(self._order), timer.generation, timer))
+
+    def _mark_stale(self):
+        # rebuild the heaps when mostly outdated entries are left (amortized O(1))
+        self._stale += 1
+        if self._stale > 64 and self._stale > self._active:
+            self._time_heap = [entry for entry in self._time_heap if entry[3].generation == entry[2]]
+            self._frame_heap = [entry for entry in self._frame_heap if entry[3].generation == entry[2]]
+            heapq.heapify(self._time_heap)
+            heapq.heapify(self._frame_heap)
+            self._stale = 0
+
@@ -19,24 +19,17 @@ from enum import Enum, auto
 from abc import ABC, abstractmethod
 import re
 import ctypes
-
-# backends
+from collections import deque
+from collections.abc import MutableMapping
+import itertools
+import importlib
 import warnings
-warnings.filterwarnings("ignore", category=UserWarning, module="pygame.pkgdata")
-original_stdout = sys.stdout
-sys.stdout = open(os.devnull, 'w')
-try:
-    import pygame
-    BACKEND_LOADED_PYGAME = True
-except Exception:
-    BACKEND_LOADED_PYGAME = False
-try:
-    import glfw
-    BACKEND_LOADED_GLFW = True
-except Exception:
-    BACKEND_LOADED_GLFW = False
-sys.stdout.close()
-sys.stdout = original_stdout
+import threading
+from time import perf_counter, perf_counter_ns
+
+import numpy as np
+
+# backends (pygame, glfw) are imported on first use -> see load_backend
 
 
 
@@ -47,6 +40,7 @@ sys.stdout = original_stdout
 class WindowLib(Enum):
     PYGAME = auto()
     GLFW = auto()
+    HEADLESS = auto()  # no window, events from a scripted/recorded source
     # PyGLFW, PyQt, PySDL, ...
 
 class EventType(Enum):
@@ -70,6 +64,13 @@ class EventType(Enum):
     CONTROLLER_BUTTON_UP = auto()
     CONTROLLER_AXIS_MOVE = auto()
 
+# events caused by the user (no window or connection events)
+INPUT_EVENT_TYPES = frozenset({
+    EventType.KEY_DOWN, EventType.KEY_UP,
+    EventType.MOUSE_MOVE, EventType.MOUSE_DOWN, EventType.MOUSE_UP, EventType.MOUSE_WHEEL,
+    EventType.CONTROLLER_BUTTON_DOWN, EventType.CONTROLLER_BUTTON_UP, EventType.CONTROLLER_AXIS_MOVE
+})
+
 class Key(Enum):
     A = auto()
     B = auto()
@@ -159,192 +160,302 @@ class DpadState(Enum):
 # -------------------------------
 #     >>> Key Mappings <<<
 # -------------------------------
+# Built by load_backend when a backend gets used the first time, available
+# as module attributes afterwards (PYGAME_KEY_MAP, GLFW_KEY_MAP, ...).
+
 # PYGAME
-PYGAME_KEY_MAP = {
-    pygame.K_a: Key.A,
-    pygame.K_b: Key.B,
-    pygame.K_c: Key.C,
-    pygame.K_d: Key.D,
-    pygame.K_e: Key.E,
-    pygame.K_f: Key.F,
-    pygame.K_g: Key.G,
-    pygame.K_h: Key.H,
-    pygame.K_i: Key.I,
-    pygame.K_j: Key.J,
-    pygame.K_k: Key.K,
-    pygame.K_l: Key.L,
-    pygame.K_m: Key.M,
-    pygame.K_n: Key.N,
-    pygame.K_o: Key.O,
-    pygame.K_p: Key.P,
-    pygame.K_q: Key.Q,
-    pygame.K_r: Key.R,
-    pygame.K_s: Key.S,
-    pygame.K_t: Key.T,
-    pygame.K_u: Key.U,
-    pygame.K_v: Key.V,
-    pygame.K_w: Key.W,
-    pygame.K_x: Key.X,
-    pygame.K_y: Key.Y,
-    pygame.K_z: Key.Z,
-
-    pygame.K_SPACE: Key.SPACE,
-    pygame.K_RETURN: Key.ENTER,
-    pygame.K_LSHIFT: Key.SHIFT,
-    pygame.K_RSHIFT: Key.SHIFT,
-    pygame.K_LCTRL: Key.CTRL,
-    pygame.K_RCTRL: Key.CTRL,
-    pygame.K_LALT: Key.ALT,
-    pygame.K_RALT: Key.ALT,
-    pygame.K_ESCAPE: Key.ESC,
-    pygame.K_TAB: Key.TAB,
-    pygame.K_BACKSPACE: Key.BACKSPACE,
-    pygame.K_UP: Key.UP,
-    pygame.K_DOWN: Key.DOWN,
-    pygame.K_LEFT: Key.LEFT,
-    pygame.K_RIGHT: Key.RIGHT,
-}
+def _build_pygame_maps(pygame):
+    # translation of the native codes of pygame (called by load_backend)
+    PYGAME_KEY_MAP = {
+        pygame.K_a: Key.A,
+        pygame.K_b: Key.B,
+        pygame.K_c: Key.C,
+        pygame.K_d: Key.D,
+        pygame.K_e: Key.E,
+        pygame.K_f: Key.F,
+        pygame.K_g: Key.G,
+        pygame.K_h: Key.H,
+        pygame.K_i: Key.I,
+        pygame.K_j: Key.J,
+        pygame.K_k: Key.K,
+        pygame.K_l: Key.L,
+        pygame.K_m: Key.M,
+        pygame.K_n: Key.N,
+        pygame.K_o: Key.O,
+        pygame.K_p: Key.P,
+        pygame.K_q: Key.Q,
+        pygame.K_r: Key.R,
+        pygame.K_s: Key.S,
+        pygame.K_t: Key.T,
+        pygame.K_u: Key.U,
+        pygame.K_v: Key.V,
+        pygame.K_w: Key.W,
+        pygame.K_x: Key.X,
+        pygame.K_y: Key.Y,
+        pygame.K_z: Key.Z,
+
+        pygame.K_SPACE: Key.SPACE,
+        pygame.K_RETURN: Key.ENTER,
+        pygame.K_LSHIFT: Key.SHIFT,
+        pygame.K_RSHIFT: Key.SHIFT,
+        pygame.K_LCTRL: Key.CTRL,
+        pygame.K_RCTRL: Key.CTRL,
+        pygame.K_LALT: Key.ALT,
+        pygame.K_RALT: Key.ALT,
+        pygame.K_ESCAPE: Key.ESC,
+        pygame.K_TAB: Key.TAB,
+        pygame.K_BACKSPACE: Key.BACKSPACE,
+        pygame.K_UP: Key.UP,
+        pygame.K_DOWN: Key.DOWN,
+        pygame.K_LEFT: Key.LEFT,
+        pygame.K_RIGHT: Key.RIGHT,
+    }
+
+    PYGAME_MOUSE_BUTTON_MAP = {
+        1: MouseButton.LEFT,
+        2: MouseButton.MIDDLE,
+        3: MouseButton.RIGHT,
+        4: MouseButton.BUTTON4,
+        5: MouseButton.BUTTON5,
+    }
+
+    PYGAME_CONTROLLER_BUTTON_MAP = {
+        0: ControllerButton.A,
+        1: ControllerButton.B,
+        2: ControllerButton.X,
+        3: ControllerButton.Y,
+        4: ControllerButton.LB,
+        5: ControllerButton.RB,
+        6: ControllerButton.SELECT,
+        7: ControllerButton.START,
+        8: ControllerButton.LSTICK,
+        9: ControllerButton.RSTICK,
+        # hats/dpad often come as JOYHATMOTION, not buttons
+    }
+
+    PYGAME_CONTROLLER_DPAD_MAP = {
+        ( 0,  0): DpadState.NEUTRAL,
+        ( 0,  1): DpadState.UP,
+        ( 0, -1): DpadState.DOWN,
+        ( 1,  0): DpadState.RIGHT,
+        (-1,  0): DpadState.LEFT,
+        ( 1,  1): DpadState.UP_RIGHT,
+        ( 1, -1): DpadState.DOWN_RIGHT,
+        (-1,  1): DpadState.UP_LEFT,
+        (-1, -1): DpadState.DOWN_LEFT
+    }
+
+    PYGAME_CONTROLLER_AXIS_MAP = {
+        0: ControllerAxis.LEFT_STICK_X,
+        1: ControllerAxis.LEFT_STICK_Y,
+        2: ControllerAxis.RIGHT_STICK_X,   # depends on device!
+        3: ControllerAxis.RIGHT_STICK_Y,   # depends on device!
+        4: ControllerAxis.LEFT_TRIGGER,
+        5: ControllerAxis.RIGHT_TRIGGER,
+    }
+
+    return {
+        "PYGAME_KEY_MAP": PYGAME_KEY_MAP,
+        "PYGAME_MOUSE_BUTTON_MAP": PYGAME_MOUSE_BUTTON_MAP,
+        "PYGAME_CONTROLLER_BUTTON_MAP": PYGAME_CONTROLLER_BUTTON_MAP,
+        "PYGAME_CONTROLLER_DPAD_MAP": PYGAME_CONTROLLER_DPAD_MAP,
+        "PYGAME_CONTROLLER_AXIS_MAP": PYGAME_CONTROLLER_AXIS_MAP,
+    }
 
-PYGAME_MOUSE_BUTTON_MAP = {
-    1: MouseButton.LEFT,
-    2: MouseButton.MIDDLE,
-    3: MouseButton.RIGHT,
-    4: MouseButton.BUTTON4,
-    5: MouseButton.BUTTON5,
-}
 
-PYGAME_CONTROLLER_BUTTON_MAP = {
-    0: ControllerButton.A,
-    1: ControllerButton.B,
-    2: ControllerButton.X,
-    3: ControllerButton.Y,
-    4: ControllerButton.LB,
-    5: ControllerButton.RB,
-    6: ControllerButton.SELECT,
-    7: ControllerButton.START,
-    8: ControllerButton.LSTICK,
-    9: ControllerButton.RSTICK,
-    # hats/dpad often come as JOYHATMOTION, not buttons
-}
-    
-PYGAME_CONTROLLER_DPAD_MAP = {
-    ( 0,  0): DpadState.NEUTRAL,
-    ( 0,  1): DpadState.UP,
-    ( 0, -1): DpadState.DOWN,
-    ( 1,  0): DpadState.RIGHT,
-    (-1,  0): DpadState.LEFT,
-    ( 1,  1): DpadState.UP_RIGHT,
-    ( 1, -1): DpadState.DOWN_RIGHT,
-    (-1,  1): DpadState.UP_LEFT,
-    (-1, -1): DpadState.DOWN_LEFT
-}
+# GLFW
+def _build_glfw_maps(glfw):
+    # translation of the native codes of glfw (called by load_backend)
+    GLFW_KEY_MAP = {
+        glfw.KEY_A: Key.A,
+        glfw.KEY_B: Key.B,
+        glfw.KEY_C: Key.C,
+        glfw.KEY_D: Key.D,
+        glfw.KEY_E: Key.E,
+        glfw.KEY_F: Key.F,
+        glfw.KEY_G: Key.G,
+        glfw.KEY_H: Key.H,
+        glfw.KEY_I: Key.I,
+        glfw.KEY_J: Key.J,
+        glfw.KEY_K: Key.K,
+        glfw.KEY_L: Key.L,
+        glfw.KEY_M: Key.M,
+        glfw.KEY_N: Key.N,
+        glfw.KEY_O: Key.O,
+        glfw.KEY_P: Key.P,
+        glfw.KEY_Q: Key.Q,
+        glfw.KEY_R: Key.R,
+        glfw.KEY_S: Key.S,
+        glfw.KEY_T: Key.T,
+        glfw.KEY_U: Key.U,
+        glfw.KEY_V: Key.V,
+        glfw.KEY_W: Key.W,
+        glfw.KEY_X: Key.X,
+        glfw.KEY_Y: Key.Y,
+        glfw.KEY_Z: Key.Z,
+
+        glfw.KEY_SPACE: Key.SPACE,
+        glfw.KEY_ENTER: Key.ENTER,
+        glfw.KEY_LEFT_SHIFT: Key.SHIFT,
+        glfw.KEY_RIGHT_SHIFT: Key.SHIFT,
+        glfw.KEY_LEFT_CONTROL: Key.CTRL,
+        glfw.KEY_RIGHT_CONTROL: Key.CTRL,
+        glfw.KEY_LEFT_ALT: Key.ALT,
+        glfw.KEY_RIGHT_ALT: Key.ALT,
+        glfw.KEY_ESCAPE: Key.ESC,
+        glfw.KEY_TAB: Key.TAB,
+        glfw.KEY_BACKSPACE: Key.BACKSPACE,
+        glfw.KEY_UP: Key.UP,
+        glfw.KEY_DOWN: Key.DOWN,
+        glfw.KEY_LEFT: Key.LEFT,
+        glfw.KEY_RIGHT: Key.RIGHT,
+    }
+
+    GLFW_MOUSE_BUTTON_MAP = {
+        glfw.MOUSE_BUTTON_LEFT: MouseButton.LEFT,
+        glfw.MOUSE_BUTTON_RIGHT: MouseButton.RIGHT,
+        glfw.MOUSE_BUTTON_MIDDLE: MouseButton.MIDDLE,
+        glfw.MOUSE_BUTTON_4: MouseButton.BUTTON4,
+        glfw.MOUSE_BUTTON_5: MouseButton.BUTTON5,
+    }
+
+    GLFW_CONTROLLER_BUTTON_MAP = {
+        glfw.GAMEPAD_BUTTON_A: ControllerButton.A,
+        glfw.GAMEPAD_BUTTON_B: ControllerButton.B,
+        glfw.GAMEPAD_BUTTON_X: ControllerButton.X,
+        glfw.GAMEPAD_BUTTON_Y: ControllerButton.Y,
+        glfw.GAMEPAD_BUTTON_LEFT_BUMPER: ControllerButton.LB,
+        glfw.GAMEPAD_BUTTON_RIGHT_BUMPER: ControllerButton.RB,
+        glfw.GAMEPAD_BUTTON_BACK: ControllerButton.SELECT,
+        glfw.GAMEPAD_BUTTON_START: ControllerButton.START,
+        glfw.GAMEPAD_BUTTON_LEFT_THUMB: ControllerButton.LSTICK,
+        glfw.GAMEPAD_BUTTON_RIGHT_THUMB: ControllerButton.RSTICK,
+        glfw.GAMEPAD_BUTTON_DPAD_UP: ControllerButton.DPAD,
+        glfw.GAMEPAD_BUTTON_DPAD_DOWN: ControllerButton.DPAD,
+        glfw.GAMEPAD_BUTTON_DPAD_RIGHT: ControllerButton.DPAD,
+        glfw.GAMEPAD_BUTTON_DPAD_LEFT: ControllerButton.DPAD
+    }
+
+    GLFW_CONTROLLER_DPAD_MAP = {
+        glfw.HAT_CENTERED: DpadState.NEUTRAL,
+        glfw.HAT_UP: DpadState.UP,
+        glfw.HAT_DOWN: DpadState.DOWN,
+        glfw.HAT_LEFT: DpadState.LEFT,
+        glfw.HAT_RIGHT: DpadState.RIGHT,
+        glfw.HAT_UP | glfw.HAT_RIGHT: DpadState.UP_RIGHT,
+        glfw.HAT_UP | glfw.HAT_LEFT: DpadState.UP_LEFT,
+        glfw.HAT_DOWN | glfw.HAT_RIGHT: DpadState.DOWN_RIGHT,
+        glfw.HAT_DOWN | glfw.HAT_LEFT: DpadState.DOWN_LEFT,
+    }
+
+    GLFW_CONTROLLER_AXIS_MAP = {
+        glfw.GAMEPAD_AXIS_LEFT_X: ControllerAxis.LEFT_STICK_X,
+        glfw.GAMEPAD_AXIS_LEFT_Y: ControllerAxis.LEFT_STICK_Y,
+        glfw.GAMEPAD_AXIS_RIGHT_X: ControllerAxis.RIGHT_STICK_X,
+        glfw.GAMEPAD_AXIS_RIGHT_Y: ControllerAxis.RIGHT_STICK_Y,
+        glfw.GAMEPAD_AXIS_LEFT_TRIGGER: ControllerAxis.LEFT_TRIGGER,
+        glfw.GAMEPAD_AXIS_RIGHT_TRIGGER: ControllerAxis.RIGHT_TRIGGER,
+    }
+
+    return {
+        "GLFW_KEY_MAP": GLFW_KEY_MAP,
+        "GLFW_MOUSE_BUTTON_MAP": GLFW_MOUSE_BUTTON_MAP,
+        "GLFW_CONTROLLER_BUTTON_MAP": GLFW_CONTROLLER_BUTTON_MAP,
+        "GLFW_CONTROLLER_DPAD_MAP": GLFW_CONTROLLER_DPAD_MAP,
+        "GLFW_CONTROLLER_AXIS_MAP": GLFW_CONTROLLER_AXIS_MAP,
+    }
+
+
+
+# kinds of the raw callback records queued by the GlfwBackend
+RAW_KEY = 0
+RAW_MOUSE_BUTTON = 1
+RAW_CURSOR_POS = 2
+RAW_SCROLL = 3
+RAW_WINDOW_SIZE = 4
+RAW_WINDOW_POS = 5
+RAW_WINDOW_FOCUS = 6
 
-PYGAME_CONTROLLER_AXIS_MAP = {
-    0: ControllerAxis.LEFT_STICK_X,
-    1: ControllerAxis.LEFT_STICK_Y,
-    2: ControllerAxis.RIGHT_STICK_X,   # depends on device!
-    3: ControllerAxis.RIGHT_STICK_Y,   # depends on device!
-    4: ControllerAxis.LEFT_TRIGGER,
-    5: ControllerAxis.RIGHT_TRIGGER,
-}
 
-# GLFW
-GLFW_KEY_MAP = {
-    glfw.KEY_A: Key.A,
-    glfw.KEY_B: Key.B,
-    glfw.KEY_C: Key.C,
-    glfw.KEY_D: Key.D,
-    glfw.KEY_E: Key.E,
-    glfw.KEY_F: Key.F,
-    glfw.KEY_G: Key.G,
-    glfw.KEY_H: Key.H,
-    glfw.KEY_I: Key.I,
-    glfw.KEY_J: Key.J,
-    glfw.KEY_K: Key.K,
-    glfw.KEY_L: Key.L,
-    glfw.KEY_M: Key.M,
-    glfw.KEY_N: Key.N,
-    glfw.KEY_O: Key.O,
-    glfw.KEY_P: Key.P,
-    glfw.KEY_Q: Key.Q,
-    glfw.KEY_R: Key.R,
-    glfw.KEY_S: Key.S,
-    glfw.KEY_T: Key.T,
-    glfw.KEY_U: Key.U,
-    glfw.KEY_V: Key.V,
-    glfw.KEY_W: Key.W,
-    glfw.KEY_X: Key.X,
-    glfw.KEY_Y: Key.Y,
-    glfw.KEY_Z: Key.Z,
-
-    glfw.KEY_SPACE: Key.SPACE,
-    glfw.KEY_ENTER: Key.ENTER,
-    glfw.KEY_LEFT_SHIFT: Key.SHIFT,
-    glfw.KEY_RIGHT_SHIFT: Key.SHIFT,
-    glfw.KEY_LEFT_CONTROL: Key.CTRL,
-    glfw.KEY_RIGHT_CONTROL: Key.CTRL,
-    glfw.KEY_LEFT_ALT: Key.ALT,
-    glfw.KEY_RIGHT_ALT: Key.ALT,
-    glfw.KEY_ESCAPE: Key.ESC,
-    glfw.KEY_TAB: Key.TAB,
-    glfw.KEY_BACKSPACE: Key.BACKSPACE,
-    glfw.KEY_UP: Key.UP,
-    glfw.KEY_DOWN: Key.DOWN,
-    glfw.KEY_LEFT: Key.LEFT,
-    glfw.KEY_RIGHT: Key.RIGHT,
-}
 
-GLFW_MOUSE_BUTTON_MAP = {
-    glfw.MOUSE_BUTTON_LEFT: MouseButton.LEFT,
-    glfw.MOUSE_BUTTON_RIGHT: MouseButton.RIGHT,
-    glfw.MOUSE_BUTTON_MIDDLE: MouseButton.MIDDLE,
-    glfw.MOUSE_BUTTON_4: MouseButton.BUTTON4,
-    glfw.MOUSE_BUTTON_5: MouseButton.BUTTON5,
+# -------------------------------
+#       >>> Functions <<<
+# -------------------------------
+_BACKEND_LIBRARIES = {
+    WindowLib.PYGAME: ("pygame", _build_pygame_maps),
+    WindowLib.GLFW: ("glfw", _build_glfw_maps),
 }
 
-GLFW_CONTROLLER_BUTTON_MAP = {
-    glfw.GAMEPAD_BUTTON_A: ControllerButton.A,
-    glfw.GAMEPAD_BUTTON_B: ControllerButton.B,
-    glfw.GAMEPAD_BUTTON_X: ControllerButton.X,
-    glfw.GAMEPAD_BUTTON_Y: ControllerButton.Y,
-    glfw.GAMEPAD_BUTTON_LEFT_BUMPER: ControllerButton.LB,
-    glfw.GAMEPAD_BUTTON_RIGHT_BUMPER: ControllerButton.RB,
-    glfw.GAMEPAD_BUTTON_BACK: ControllerButton.SELECT,
-    glfw.GAMEPAD_BUTTON_START: ControllerButton.START,
-    glfw.GAMEPAD_BUTTON_LEFT_THUMB: ControllerButton.LSTICK,
-    glfw.GAMEPAD_BUTTON_RIGHT_THUMB: ControllerButton.RSTICK,
-    glfw.GAMEPAD_BUTTON_DPAD_UP: ControllerButton.DPAD,
-    glfw.GAMEPAD_BUTTON_DPAD_DOWN: ControllerButton.DPAD,
-    glfw.GAMEPAD_BUTTON_DPAD_RIGHT: ControllerButton.DPAD,
-    glfw.GAMEPAD_BUTTON_DPAD_LEFT: ControllerButton.DPAD
-}
+# WindowLib -> import succeeded
+_loaded_backends = {}
 
-GLFW_CONTROLLER_DPAD_MAP = {
-    glfw.HAT_CENTERED: DpadState.NEUTRAL,
-    glfw.HAT_UP: DpadState.UP,
-    glfw.HAT_DOWN: DpadState.DOWN,
-    glfw.HAT_LEFT: DpadState.LEFT,
-    glfw.HAT_RIGHT: DpadState.RIGHT,
-    glfw.HAT_UP | glfw.HAT_RIGHT: DpadState.UP_RIGHT,
-    glfw.HAT_UP | glfw.HAT_LEFT: DpadState.UP_LEFT,
-    glfw.HAT_DOWN | glfw.HAT_RIGHT: DpadState.DOWN_RIGHT,
-    glfw.HAT_DOWN | glfw.HAT_LEFT: DpadState.DOWN_LEFT,
-}
+def load_backend(background_lib):
+    """
+    Import the library of a window backend and build its key maps.
 
-GLFW_CONTROLLER_AXIS_MAP = {
-    glfw.GAMEPAD_AXIS_LEFT_X: ControllerAxis.LEFT_STICK_X,
-    glfw.GAMEPAD_AXIS_LEFT_Y: ControllerAxis.LEFT_STICK_Y,
-    glfw.GAMEPAD_AXIS_RIGHT_X: ControllerAxis.RIGHT_STICK_X,
-    glfw.GAMEPAD_AXIS_RIGHT_Y: ControllerAxis.RIGHT_STICK_Y,
-    glfw.GAMEPAD_AXIS_LEFT_TRIGGER: ControllerAxis.LEFT_TRIGGER,
-    glfw.GAMEPAD_AXIS_RIGHT_TRIGGER: ControllerAxis.RIGHT_TRIGGER,
-}
+    Only done on the first call per backend: afterwards the library
+    (`pygame`, `glfw`) and its maps (`PYGAME_KEY_MAP`, `GLFW_KEY_MAP`, ...)
+    are module attributes of `windforge.window`. Importing `windforge`
+    alone loads no backend library.
 
+    Args:
+        background_lib (WindowLib): The backend to load (HEADLESS needs no library).
 
+    Returns:
+        bool: True if the backend is usable, False if its library is not installed.
+    """
+    if background_lib not in _BACKEND_LIBRARIES:
+        return True
+    if background_lib in _loaded_backends:
+        return _loaded_backends[background_lib]
+
+    library_name, build_maps = _BACKEND_LIBRARIES[background_lib]
+    # pygame prints a welcome message and warns about its package data
+    warnings.filterwarnings("ignore", category=UserWarning, module="pygame.pkgdata")
+    original_stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        library = importlib.import_module(library_name)
+        loaded = True
+    except Exception:
+        library = None
+        loaded = False
+    finally:
+        sys.stdout.close()
+        sys.stdout = original_stdout
+
+    if loaded:
+        globals()[library_name] = library
+        globals().update(build_maps(library))
+    globals()[f"BACKEND_LOADED_{background_lib.name}"] = loaded
+    _loaded_backends[background_lib] = loaded
+    return loaded
+
+def _lazy_attributes():
+    attributes = {}
+    for background_lib, (library_name, _) in _BACKEND_LIBRARIES.items():
+        attributes[library_name] = background_lib
+        attributes[f"BACKEND_LOADED_{background_lib.name}"] = background_lib
+        for map_name in ("KEY_MAP", "MOUSE_BUTTON_MAP", "CONTROLLER_BUTTON_MAP",
+                         "CONTROLLER_DPAD_MAP", "CONTROLLER_AXIS_MAP"):
+            attributes[f"{background_lib.name}_{map_name}"] = background_lib
+    return attributes
+
+_LAZY_ATTRIBUTES = _lazy_attributes()
+
+def __getattr__(name):
+    # module attributes of a backend (windforge.window.glfw, GLFW_KEY_MAP, BACKEND_LOADED_GLFW, ...) load it on first access
+    background_lib = _LAZY_ATTRIBUTES.get(name)
+    if background_lib is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    loaded = load_backend(background_lib)
+    if name.startswith("BACKEND_LOADED_"):
+        return loaded
+    if not loaded:
+        raise AttributeError(f"'{name}' is not available: the {background_lib.name.lower()} backend "
+                             f"library is not installed (pip install {_BACKEND_LIBRARIES[background_lib][0]}).")
+    return globals()[name]
 
-# -------------------------------
-#       >>> Functions <<<
-# -------------------------------
 def str_to_version(version_str, number_amount=None) -> list:
     """
     Convert a version string into a list of integers.
@@ -382,11 +493,172 @@ def str_to_version(version_str, number_amount=None) -> list:
     
     return numbers
 
+def members_by_value(enum_class) -> list:
+    """
+    Build a lookup list from enum value to enum member.
+
+    Used to translate indices of the state arrays (indexed by
+    enum value) back to enum members.
+
+    Args:
+        enum_class (Enum): Enum with integer values.
+
+    Returns:
+        list[Enum | None]: Member at the index of its value, None for unused indices.
+    """
+    members = [None] * (max(member.value for member in enum_class) + 1)
+    for member in enum_class:
+        members[member.value] = member
+    return members
+
+def coalesce_motion_events(events):
+    """
+    Reduce the motion events of one frame.
+
+    - Consecutive `MOUSE_MOVE` events are merged into the first of them,
+      carrying the final position and the accumulated relative movement
+      (and the `timestamp` of the first, the oldest input).
+      Only non-motion events (keys, buttons, window, ...) end a run.
+    - `CONTROLLER_AXIS_MOVE` events are collapsed to one per
+      (controller, axis), placed at the position of the latest sample.
+
+    The order of all other events is preserved.
+
+    Args:
+        events (list[Event]): Events of one frame.
+
+    Returns:
+        list[Event]: The coalesced events.
+    """
+    coalesced = []
+    append = coalesced.append
+    mouse_move = None   # merge target of the current mouse move run
+    axis_index = {}     # (controller_id, axis) -> index in coalesced
+    removed = False
+    for event in events:
+        event_type = event.type
+        if event_type == EventType.MOUSE_MOVE:
+            if mouse_move is None:
+                mouse_move = MouseEvent(EventType.MOUSE_MOVE, mouse_pos=event.mouse_position, mouse_rel=event.mouse_rel)
+                mouse_move.timestamp = event.timestamp
+                append(mouse_move)
+            else:
+                mouse_move.mouse_position = event.mouse_position
+                if mouse_move.mouse_rel is not None and event.mouse_rel is not None:
+                    mouse_move.mouse_rel = (mouse_move.mouse_rel[0] + event.mouse_rel[0],
+                                            mouse_move.mouse_rel[1] + event.mouse_rel[1])
+        elif event_type == EventType.CONTROLLER_AXIS_MOVE:
+            key = (event.controller_id, event.axis)
+            idx = axis_index.get(key)
+            if idx is not None:
+                coalesced[idx] = None
+                removed = True
+            axis_index[key] = len(coalesced)
+            append(event)
+        else:
+            mouse_move = None
+            append(event)
+
+    if removed:
+        coalesced = [event for event in coalesced if event is not None]
+    return coalesced
+
+def apply_deadzone(axes, deadzone):
+    """
+    Apply an axial deadzone to axis values (vectorized).
+
+    Values inside the deadzone become 0.0, the remaining range is
+    rescaled so that the output still reaches -1.0 / 1.0.
+
+    Args:
+        axes (np.ndarray): Axis values of any shape.
+        deadzone (float): Deadzone in range [0.0, 1.0).
+
+    Returns:
+        np.ndarray: New array with the deadzone applied (same dtype).
+    """
+    magnitude = np.abs(axes)
+    scaled = np.sign(axes) * (magnitude - deadzone) / (1.0 - deadzone)
+    return np.where(magnitude > deadzone, scaled, 0.0).astype(axes.dtype, copy=False)
+
+# enum value -> enum member (index 0 is unused, auto() starts at 1)
+KEYS_BY_VALUE = members_by_value(Key)
+MOUSE_BUTTONS_BY_VALUE = members_by_value(MouseButton)
+CONTROLLER_BUTTONS_BY_VALUE = members_by_value(ControllerButton)
+CONTROLLER_AXES_BY_VALUE = members_by_value(ControllerAxis)
+
 # -------------------------------
 #        >>> Classes <<<
 # -------------------------------
 
-class Event(object):
+class BaseEvent(object):
+    """
+    Compact base of all events.
+
+    Every subclass only stores the attributes of its event type
+    in `__slots__`, all other event attributes read as None. Own
+    attributes can still be set on an event (they live in the instance
+    `__dict__`, which CPython only creates on the first write, and are
+    part of `as_dict()`).
+
+    `timestamp` is the `perf_counter_ns` time when the input got polled
+    (set by the backends, by the input polling thread at sampling time).
+    Events created elsewhere read it as None.
+    """
+    __slots__ = ("type", "timestamp", "__dict__")
+    _fields = ()
+    # keyword arguments of `__init__` (used by the `Event(...)` constructor)
+    _arguments = frozenset()
+
+    # defaults for all attributes an event type does not carry
+    key = None
+    mouse_position = None
+    mouse_rel = None
+    mouse_button = None
+    mouse_scroll = None
+    mouse_scroll_precise = None
+    controller_id = None
+    controller_button = None
+    controller_dpad = None
+    axis = None
+    axis_value = None
+    window_position = None
+    window_size = None
+    is_accessed = None
+    is_active = None
+
+    def __init__(self, event_type):
+        self.type = event_type
+
+    def __getattr__(self, name):
+        # only called for missing attributes -> unset declared slots read as None, everything else (typos) raises
+        for cls in type(self).__mro__:
+            if name in cls.__dict__.get("__slots__", ()) and name != "__dict__":
+                return None
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def as_dict(self):
+        """
+        Get all attributes of the event.
+
+        Returns:
+            dict[str, Any]: Attribute name to value (including `type` and own attributes).
+        """
+        return {"type": self.type, **{name: getattr(self, name) for name in self._fields}, **self.__dict__}
+
+    def __repr__(self):
+        details = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({self.type}{', ' if details else ''}{details})"
+
+class _EventMeta(type):
+    # every compact event counts as `Event` (isinstance/issubclass)
+    def __instancecheck__(cls, instance):
+        return isinstance(instance, BaseEvent)
+
+    def __subclasscheck__(cls, subclass):
+        return issubclass(subclass, BaseEvent)
+
+class Event(BaseEvent, metaclass=_EventMeta):
     """
     Represents an input or window event.
 
@@ -394,10 +666,18 @@ class Event(object):
     such as keyboard input, mouse actions, controller input, and window events.
     Each event stores its type and relevant attributes depending on the context.
 
+    Calling `Event(...)` returns an instance of the compact event class
+    matching `event_type` (see `EVENT_CLASSES`). Backends create these
+    classes directly, which avoids the lookup. The constructor keeps the
+    full signature (also positional, in the order below with `mouse_rel`
+    last): the arguments of the compact class get passed to it directly,
+    other non-None attributes get set as own attributes of the event.
+
     Args:
         event_type (str): The type of the event (see `EventType` enum).
         key (int, optional): Keyboard key identifier.
         mouse_pos (tuple[int, int], optional): Mouse position (x, y).
+        mouse_rel (tuple[int, int], optional): Relative mouse movement (dx, dy).
         mouse_button (int, optional): Mouse button identifier.
         mouse_scroll (int, optional): Mouse scroll amount.
         mouse_scroll_precise (float, optional): Precise mouse scroll amount.
@@ -410,37 +690,297 @@ class Event(object):
         window_size (tuple[int, int], optional): Window size (width, height).
         is_accessed (bool, optional): Whether the window is accessed.
         is_active (bool, optional): Whether the window is active.
+
+    Raises:
+        ValueError: If `event_type` is no `EventType` with an event class.
+        TypeError: If an argument is unknown or given twice.
+    """
+    __slots__ = ()
+
+    def __new__(cls, event_type, *args, **kwargs):
+        # list by enum value -> no (Python level) enum hash per event
+        if type(event_type) is not EventType:
+            raise ValueError(f"Unknown event type {event_type!r} (expected an EventType).")
+        event_class = EVENT_CLASSES_BY_VALUE[event_type._value_]
+        if args:
+            # positional -> names of the full signature
+            if len(args) > len(EVENT_ARGUMENTS):
+                raise TypeError(f"Event() takes at most {len(EVENT_ARGUMENTS) + 1} arguments ({len(args) + 1} given)")
+            for name, value in zip(EVENT_ARGUMENTS, args):
+                if name in kwargs:
+                    raise TypeError(f"Event() got multiple values for argument '{name}'")
+                kwargs[name] = value
+        # common case: only arguments of the compact class -> passed straight to it
+        try:
+            return event_class(event_type, **kwargs)
+        except TypeError:
+            # attributes the compact class does not carry (or unknown arguments)
+            pass
+
+        own_attributes = {}
+        for name in [name for name in kwargs if name not in event_class._arguments]:
+            attribute = EVENT_ARGUMENT_ATTRIBUTES.get(name)
+            if attribute is None:
+                raise TypeError(f"Event() got an unexpected keyword argument '{name}'")
+            value = kwargs.pop(name)
+            if value is not None:
+                own_attributes[attribute] = value
+        event = event_class(event_type, **kwargs)
+        event.__dict__.update(own_attributes)
+        return event
+
+class QuitEvent(BaseEvent):
+    """
+    Event without payload (`QUIT`).
+    """
+    __slots__ = ()
+
+class WindowEvent(BaseEvent):
+    """
+    Window event (`WINDOW_MOVE`, `WINDOW_RESIZE`, `WINDOW_ACCESS`, `WINDOW_ACTIVATION`).
+    """
+    __slots__ = ("window_position", "window_size", "is_accessed", "is_active")
+    _fields = __slots__
+    _arguments = frozenset(__slots__)
+
+    def __init__(self, event_type, window_position=None, window_size=None, is_accessed=None, is_active=None):
+        self.type = event_type
+        self.window_position = window_position
+        self.window_size = window_size
+        self.is_accessed = is_accessed
+        self.is_active = is_active
+
+class KeyEvent(BaseEvent):
+    """
+    Keyboard event (`KEY_DOWN`, `KEY_UP`).
+    """
+    __slots__ = ("key",)
+    _fields = __slots__
+    _arguments = frozenset(__slots__)
+
+    def __init__(self, event_type, key=None):
+        self.type = event_type
+        self.key = key
+
+class MouseEvent(BaseEvent):
+    """
+    Mouse button or motion event (`MOUSE_MOVE`, `MOUSE_DOWN`, `MOUSE_UP`).
     """
-    def __init__(self, event_type, 
-                 key=None, 
-                 mouse_pos=None, 
-                 mouse_button=None,
-                 mouse_scroll=None,
-                 mouse_scroll_precise=None,
-                 controller_id=None, 
-                 controller_button=None, 
-                 controller_dpad=None,
-                 axis=None, 
-                 axis_value=None,
-                 window_position=None,
-                 window_size=None,
-                 is_accessed=None,
-                 is_active=None):
+    __slots__ = ("mouse_position", "mouse_rel", "mouse_button")
+    _fields = __slots__
+    _arguments = frozenset(("mouse_pos", "mouse_rel", "mouse_button"))
+
+    def __init__(self, event_type, mouse_pos=None, mouse_button=None, mouse_rel=None):
         self.type = event_type
-        self.key = key                  # keyboard key
-        self.mouse_position = mouse_pos      # (x, y)
+        self.mouse_position = mouse_pos
+        self.mouse_rel = mouse_rel
         self.mouse_button = mouse_button
+
+class MouseWheelEvent(BaseEvent):
+    """
+    Mouse wheel event (`MOUSE_WHEEL`).
+    """
+    __slots__ = ("mouse_scroll", "mouse_scroll_precise")
+    _fields = __slots__
+    _arguments = frozenset(__slots__)
+
+    def __init__(self, event_type, mouse_scroll=None, mouse_scroll_precise=None):
+        self.type = event_type
         self.mouse_scroll = mouse_scroll
         self.mouse_scroll_precise = mouse_scroll_precise
-        self.controller_id = controller_id  # which controller
+
+class ControllerEvent(BaseEvent):
+    """
+    Controller device event (`CONTROLLER_ADDED`, `CONTROLLER_REMOVED`).
+    """
+    __slots__ = ("controller_id",)
+    _fields = __slots__
+    _arguments = frozenset(__slots__)
+
+    def __init__(self, event_type, controller_id=None):
+        self.type = event_type
+        self.controller_id = controller_id
+
+class ControllerButtonEvent(BaseEvent):
+    """
+    Controller button event (`CONTROLLER_BUTTON_DOWN`, `CONTROLLER_BUTTON_UP`).
+    """
+    __slots__ = ("controller_id", "controller_button", "controller_dpad")
+    _fields = __slots__
+    _arguments = frozenset(__slots__)
+
+    def __init__(self, event_type, controller_id=None, controller_button=None, controller_dpad=None):
+        self.type = event_type
+        self.controller_id = controller_id
         self.controller_button = controller_button
         self.controller_dpad = controller_dpad
-        self.axis = axis                  # axis name or index
-        self.axis_value = axis_value      # axis value (-1.0 .. 1.0), triggers = 0.0 -> 1.0
-        self.window_position = window_position
-        self.window_size = window_size    # (width, height)
-        self.is_accessed = is_accessed
-        self.is_active = is_active
+
+class ControllerAxisEvent(BaseEvent):
+    """
+    Controller axis event (`CONTROLLER_AXIS_MOVE`).
+    """
+    __slots__ = ("controller_id", "axis", "axis_value")
+    _fields = __slots__
+    _arguments = frozenset(__slots__)
+
+    def __init__(self, event_type, controller_id=None, axis=None, axis_value=None):
+        self.type = event_type
+        self.controller_id = controller_id
+        self.axis = axis
+        self.axis_value = axis_value
+
+# event type -> compact event class
+EVENT_CLASSES = {
+    EventType.WINDOW_MOVE: WindowEvent,
+    EventType.WINDOW_RESIZE: WindowEvent,
+    EventType.WINDOW_ACCESS: WindowEvent,
+    EventType.WINDOW_ACTIVATION: WindowEvent,
+    EventType.QUIT: QuitEvent,
+
+    EventType.KEY_DOWN: KeyEvent,
+    EventType.KEY_UP: KeyEvent,
+
+    EventType.MOUSE_MOVE: MouseEvent,
+    EventType.MOUSE_DOWN: MouseEvent,
+    EventType.MOUSE_UP: MouseEvent,
+    EventType.MOUSE_WHEEL: MouseWheelEvent,
+
+    EventType.CONTROLLER_ADDED: ControllerEvent,
+    EventType.CONTROLLER_REMOVED: ControllerEvent,
+    EventType.CONTROLLER_BUTTON_DOWN: ControllerButtonEvent,
+    EventType.CONTROLLER_BUTTON_UP: ControllerButtonEvent,
+    EventType.CONTROLLER_AXIS_MOVE: ControllerAxisEvent,
+}
+
+# event type value -> compact event class (fast lookup of `Event(...)`)
+EVENT_CLASSES_BY_VALUE = [None] * (max(event_type.value for event_type in EVENT_CLASSES) + 1)
+for _event_type, _event_class in EVENT_CLASSES.items():
+    EVENT_CLASSES_BY_VALUE[_event_type.value] = _event_class
+del _event_type, _event_class
+
+# arguments of `Event(...)` after the event type (positional order) -> event attribute
+EVENT_ARGUMENT_ATTRIBUTES = {
+    "key": "key",
+    "mouse_pos": "mouse_position",
+    "mouse_button": "mouse_button",
+    "mouse_scroll": "mouse_scroll",
+    "mouse_scroll_precise": "mouse_scroll_precise",
+    "controller_id": "controller_id",
+    "controller_button": "controller_button",
+    "controller_dpad": "controller_dpad",
+    "axis": "axis",
+    "axis_value": "axis_value",
+    "window_position": "window_position",
+    "window_size": "window_size",
+    "is_accessed": "is_accessed",
+    "is_active": "is_active",
+    "mouse_rel": "mouse_rel",
+}
+EVENT_ARGUMENTS = tuple(EVENT_ARGUMENT_ATTRIBUTES)
+
+class InputPollingThread(object):
+    """
+    Background thread which samples an input source at a fixed rate.
+
+    Calls `poll(events)` `rate` times per second, stamps the produced
+    events with the `perf_counter_ns` time of their sample and hands
+    them to the main loop over a single-producer/single-consumer queue
+    (a `deque`: `append` and `popleft` are atomic, so neither side takes
+    a lock). The main loop collects them with `drain` once per frame.
+    So changes between two frames are not lost (e.g. a short axis flick)
+    and the input latency can be measured from the timestamps.
+
+    If the main loop stops draining, the queue keeps the newest
+    `capacity` events. An exception of `poll` drops only its sample
+    (counted in `errors`, reported once per exception type), the
+    thread keeps sampling until `stop`.
+
+    Args:
+        poll (callable): `poll(events)`, appends the new events of one sample to the list.
+        rate (float, optional): Samples per second. Default 1000.
+        capacity (int, optional): Maximum number of queued events. Default 4096.
+        name (str, optional): Thread name. Default "windforge-input".
+    """
+    def __init__(self, poll, rate=1000, capacity=4096, name="windforge-input"):
+        if rate <= 0:
+            raise ValueError(f"Input polling rate has to be positive (got {rate}).")
+        self.poll = poll
+        self.rate = rate
+        self.queue = deque(maxlen=capacity)
+        self.samples = 0
+        self.errors = 0
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self):
+        """
+        Start sampling.
+        """
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        """
+        Stop sampling and wait for the thread to end.
+
+        Args:
+            timeout (float, optional): Maximum wait in seconds. Default 1.0.
+        """
+        self._stop_event.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def is_running(self):
+        """
+        Returns:
+            bool: Whether the thread is sampling.
+        """
+        return self._thread.is_alive()
+
+    def drain(self, events):
+        """
+        Move all queued events into a list (called by the main loop).
+
+        Args:
+            events (list[Event]): List to append the events to (in sample order).
+        """
+        queue = self.queue
+        popleft = queue.popleft
+        append = events.append
+        while queue:
+            append(popleft())
+
+    def _run(self):
+        period = 1.0 / self.rate
+        append = self.queue.append
+        wait = self._stop_event.wait
+        next_sample = perf_counter()
+        sample = []
+        warned = set()
+        while not self._stop_event.is_set():
+            timestamp = perf_counter_ns()
+            try:
+                self.poll(sample)
+            except Exception as error:
+                # transient (e.g. a device unplugged while read) -> drop the sample, keep sampling
+                self.errors += 1
+                if type(error) not in warned:
+                    warned.add(type(error))
+                    print(f"[WARNING] Input polling failed, sample skipped (further {type(error).__name__} not reported): {error}")
+                sample.clear()
+            if sample:
+                for event in sample:
+                    event.timestamp = timestamp
+                    append(event)
+                sample.clear()
+            self.samples += 1
+
+            # absolute schedule -> no drift, but no catch-up burst after a stall
+            next_sample += period
+            delay = next_sample - perf_counter()
+            if delay > 0:
+                wait(delay)
+            else:
+                next_sample = perf_counter()
 
 class InputState(object):
     """
@@ -450,18 +990,35 @@ class InputState(object):
     Provides methods for updating input states from events and querying
     active inputs.
 
+    Keys and mouse buttons are stored in preallocated bool arrays indexed
+    by enum value together with the presses and releases of the current
+    frame, so `is_down`, `was_pressed_this_frame` and
+    `was_released_this_frame` are single array reads. A frame starts with
+    every `update` call; a press and release within one frame (a fast
+    tap) reports both edges.
+
+    `keys` and `mouse_buttons` are mappings on these arrays: reading
+    gives the current state, writing (`input_state.keys[Key.B] = True`)
+    goes through `set_button` like an event.
+
     Args:
         controller_event_tolerance (float, optional): Threshold for ignoring
             minor axis movements (default: 0.01).
         controllers (dict, optional): A mapping of controller IDs to
-            `Controller` objects (default: {}).
+            `Controller` objects (default: None -> {}).
     """
-    def __init__(self, controller_event_tolerance=0.01, controllers={}):
+    def __init__(self, controller_event_tolerance=0.01, controllers=None):
         self.controller_event_tolerance = controller_event_tolerance
-        self.keys = {}  # dict[int, bool]
-        self.mouse_buttons = {}  # dict[int, bool]
+        self._keys = np.zeros(len(KEYS_BY_VALUE), dtype=bool)
+        self._keys_pressed = np.zeros_like(self._keys)
+        self._keys_released = np.zeros_like(self._keys)
+        self._mouse_buttons = np.zeros(len(MOUSE_BUTTONS_BY_VALUE), dtype=bool)
+        self._mouse_buttons_pressed = np.zeros_like(self._mouse_buttons)
+        self._mouse_buttons_released = np.zeros_like(self._mouse_buttons)
+        self._keys_view = ButtonStateView(self, Key)
+        self._mouse_buttons_view = ButtonStateView(self, MouseButton)
         self.mouse_position = (0, 0)
-        self.controllers = controllers  # per controller id -> Controller
+        self.controllers = controllers if controllers is not None else {}  # per controller id -> Controller
         self.missed_controllers = {}
         self.window = {"position": [0, 0],
                        "size": [512, 512],
@@ -469,10 +1026,39 @@ class InputState(object):
                        "active": True}
         self.quit = False
 
+        # bumped on every key/mouse button change -> cache of get_all_active
+        self._version = 0
+        self._active_cache = {}
+
+        # dispatch table: event type -> tuple of handlers (built-in first)
+        self._builtin_handlers = {
+            EventType.KEY_DOWN: self._handle_key_down,
+            EventType.KEY_UP: self._handle_key_up,
+            EventType.MOUSE_DOWN: self._handle_mouse_down,
+            EventType.MOUSE_UP: self._handle_mouse_up,
+            EventType.MOUSE_MOVE: self._handle_mouse_move,
+            EventType.CONTROLLER_BUTTON_DOWN: self._handle_controller_button_down,
+            EventType.CONTROLLER_BUTTON_UP: self._handle_controller_button_up,
+            EventType.CONTROLLER_AXIS_MOVE: self._handle_controller_axis_move,
+            EventType.CONTROLLER_ADDED: self._handle_controller_added,
+            EventType.CONTROLLER_REMOVED: self._handle_controller_removed,
+            EventType.QUIT: self._handle_quit,
+            EventType.WINDOW_MOVE: self._handle_window_move,
+            EventType.WINDOW_RESIZE: self._handle_window_resize,
+            EventType.WINDOW_ACCESS: self._handle_window_access,
+            EventType.WINDOW_ACTIVATION: self._handle_window_activation,
+        }
+        self._user_handlers = {}
+        self._handlers = {}
+        self._build_handler_table()
+
     def update(self, events):
         """
         Update the input state based on a sequence of events.
 
+        Every event is dispatched to the handlers registered for its
+        type (see `register_handler`).
+
         Args:
             events (list[Event]): A list of events to process.
 
@@ -480,66 +1066,280 @@ class InputState(object):
             list[Event]: The list of processed events, possibly including
             new events generated during processing (e.g. auto-added controllers).
         """
+        self.begin_frame()
+
         new_events = []
+        append = new_events.append
+        handlers = self._handlers
         for event in events:
-            # Keyboard
-            if event.type == EventType.KEY_DOWN:
-                self.keys[event.key] = True
-            elif event.type == EventType.KEY_UP:
-                self.keys[event.key] = False
-
-            # Mouse
-            elif event.type == EventType.MOUSE_DOWN:
-                self.mouse_buttons[event.mouse_button] = True
-            elif event.type == EventType.MOUSE_UP:
-                self.mouse_buttons[event.mouse_button] = False
-            elif event.type == EventType.MOUSE_MOVE:
-                self.mouse_position = event.mouse_position
-
-            # Controller buttons
-            elif event.type == EventType.CONTROLLER_BUTTON_DOWN:
-                cid = event.controller_id
-                if cid in self.controllers.keys():
-                    self.controllers[cid].update_button(button=event.controller_button, pressed=True)
-                else:
-                    new_events += self.missing_controller_process(event=event)
-            elif event.type == EventType.CONTROLLER_BUTTON_UP:
-                cid = event.controller_id
-                if cid in self.controllers.keys():
-                    self.controllers[cid].update_button(button=event.controller_button, pressed=False)
-                else:
-                    new_events += self.missing_controller_process(event=event)
-
-            # Controller axes
-            elif event.type == EventType.CONTROLLER_AXIS_MOVE:
-                cid = event.controller_id
-                if cid in self.controllers.keys():
-                    if abs(self.controllers[cid].get_axis(axis=event.axis) - event.axis_value) < self.controller_event_tolerance:
-                        continue
-                    self.controllers[cid].update_axis(axis=event.axis, value=event.axis_value)
-                else:
-                    new_events += self.missing_controller_process(event=event)
-            elif event.type == EventType.CONTROLLER_ADDED:
-                self.controllers[event.controller_id] = Controller(controller_id=event.controller_id)
-            elif event.type == EventType.CONTROLLER_REMOVED:
-                # del self.controllers[event.controller_id]
-                self.controllers.pop(event.controller_id, None)
-
-            # Window
-            elif event.type == EventType.QUIT:
-                self.quit = True
-            elif event.type == EventType.WINDOW_MOVE:
-                self.window["position"] = event.window_position
-            elif event.type == EventType.WINDOW_RESIZE:
-                self.window["size"] = event.window_size
-            elif event.type == EventType.WINDOW_ACCESS:
-                self.window["accessed"] = event.is_accessed
-            elif event.type == EventType.WINDOW_ACTIVATION:
-                self.window["active"] = event.is_active
-
-            new_events += [event]
+            for handler in handlers.get(event.type, ()):
+                if handler(event, new_events) is False:
+                    break
+            else:
+                append(event)
         return new_events
 
+    def begin_frame(self):
+        """
+        Forget the presses and releases of the last frame.
+
+        Called by `update`, only call it yourself if you feed the
+        input state without `update`.
+        """
+        self._keys_pressed.fill(False)
+        self._keys_released.fill(False)
+        self._mouse_buttons_pressed.fill(False)
+        self._mouse_buttons_released.fill(False)
+        for controller in self.controllers.values():
+            controller.begin_frame()
+
+    def _state_arrays(self, button, controller_id):
+        # (current, pressed this frame, released this frame)
+        button_type = type(button)
+        if button_type is Key:
+            return self._keys, self._keys_pressed, self._keys_released
+        elif button_type is MouseButton:
+            return self._mouse_buttons, self._mouse_buttons_pressed, self._mouse_buttons_released
+        elif button_type is ControllerButton:
+            controller = self.controllers.get(controller_id)
+            if controller is not None:
+                return controller.buttons, controller.pressed_buttons, controller.released_buttons
+            return None, None, None
+        raise ValueError(f"Can't query the state of '{button}'.")
+
+    def set_button(self, button, down):
+        """
+        Set the state of a key or mouse button (as its down/up event would).
+
+        Args:
+            button (Key | MouseButton): Input to set.
+            down (bool): Whether it is held.
+
+        Raises:
+            ValueError: If `button` is no `Key` or `MouseButton`.
+        """
+        button_type = type(button)
+        if button_type is not Key and button_type is not MouseButton:
+            raise ValueError(f"Can't set the state of '{button}'.")
+        current, pressed, released = self._state_arrays(button, None)
+        index = button.value
+        down = bool(down)
+        if current[index] != down:
+            current[index] = down
+            (pressed if down else released)[index] = True
+        self._version += 1
+
+    def is_down(self, button, controller_id=None):
+        """
+        Check if a key or button is currently held.
+
+        Args:
+            button (Key | MouseButton | ControllerButton): Input to query.
+            controller_id (int, optional): Controller ID, needed for `ControllerButton`.
+
+        Returns:
+            bool: True if held (False for unknown controllers).
+        """
+        current, _, _ = self._state_arrays(button, controller_id)
+        return current is not None and bool(current[button.value])
+
+    def was_pressed_this_frame(self, button, controller_id=None):
+        """
+        Check if a key or button went down in the current frame.
+
+        Args:
+            button (Key | MouseButton | ControllerButton): Input to query.
+            controller_id (int, optional): Controller ID, needed for `ControllerButton`.
+
+        Returns:
+            bool: True if it got pressed since the frame started (also if already released again).
+        """
+        _, pressed, _ = self._state_arrays(button, controller_id)
+        return pressed is not None and bool(pressed[button.value])
+
+    def was_released_this_frame(self, button, controller_id=None):
+        """
+        Check if a key or button went up in the current frame.
+
+        Args:
+            button (Key | MouseButton | ControllerButton): Input to query.
+            controller_id (int, optional): Controller ID, needed for `ControllerButton`.
+
+        Returns:
+            bool: True if it got released since the frame started (also if pressed again).
+        """
+        _, _, released = self._state_arrays(button, controller_id)
+        return released is not None and bool(released[button.value])
+
+    @property
+    def keys(self):
+        """
+        ButtonStateView: State of every key (mapping `Key -> bool`, writes go through `set_button`).
+        """
+        return self._keys_view
+
+    @property
+    def mouse_buttons(self):
+        """
+        ButtonStateView: State of every mouse button (mapping `MouseButton -> bool`, writes go through `set_button`).
+        """
+        return self._mouse_buttons_view
+
+    def axes_matrix(self, deadzone=None):
+        """
+        Get the axis values of all controllers as one array.
+
+        Rows follow the order of `self.controllers`, columns are indexed
+        by `ControllerAxis` value (column 0 is unused).
+
+        Args:
+            deadzone (float, optional): Apply this deadzone to all values
+                (see `apply_deadzone`). Default: None -> raw values.
+
+        Returns:
+            np.ndarray: float32 array with shape (controllers, axes).
+        """
+        matrix = np.zeros((len(self.controllers), len(CONTROLLER_AXES_BY_VALUE)), dtype=np.float32)
+        for row, controller in enumerate(self.controllers.values()):
+            matrix[row] = controller.axes
+        if deadzone:
+            matrix = apply_deadzone(matrix, deadzone)
+        return matrix
+
+    def buttons_matrix(self):
+        """
+        Get the button states of all controllers as one array.
+
+        Rows follow the order of `self.controllers`, columns are indexed
+        by `ControllerButton` value (column 0 is unused).
+
+        Returns:
+            np.ndarray: bool array with shape (controllers, buttons).
+        """
+        matrix = np.zeros((len(self.controllers), len(CONTROLLER_BUTTONS_BY_VALUE)), dtype=bool)
+        for row, controller in enumerate(self.controllers.values()):
+            matrix[row] = controller.buttons
+        return matrix
+
+    def register_handler(self, event_type, handler):
+        """
+        Register an additional handler for an event type.
+
+        Handlers are called in registration order after the built-in
+        handler with `(event, new_events)`. A handler can append generated
+        events to `new_events` and can return False to drop the event
+        (later handlers are skipped then).
+
+        Args:
+            event_type (EventType): The event type to handle.
+            handler (callable): Function `(event, new_events) -> bool | None`.
+        """
+        self._user_handlers.setdefault(event_type, []).append(handler)
+        self._build_handler_table()
+
+    def unregister_handler(self, event_type, handler):
+        """
+        Remove a handler registered with `register_handler`.
+
+        Args:
+            event_type (EventType): The event type of the handler.
+            handler (callable): The registered handler.
+        """
+        handlers = self._user_handlers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+        self._build_handler_table()
+
+    def _build_handler_table(self):
+        self._handlers = {}
+        for event_type in EventType:
+            handlers = []
+            if event_type in self._builtin_handlers:
+                handlers += [self._builtin_handlers[event_type]]
+            handlers += self._user_handlers.get(event_type, [])
+            if handlers:
+                self._handlers[event_type] = tuple(handlers)
+
+    # Keyboard (edges only on a change -> key repeats are no new press)
+    def _handle_key_down(self, event, new_events):
+        index = event.key.value
+        if not self._keys[index]:
+            self._keys[index] = True
+            self._keys_pressed[index] = True
+            self._version += 1
+
+    def _handle_key_up(self, event, new_events):
+        index = event.key.value
+        if self._keys[index]:
+            self._keys[index] = False
+            self._keys_released[index] = True
+            self._version += 1
+
+    # Mouse
+    def _handle_mouse_down(self, event, new_events):
+        index = event.mouse_button.value
+        if not self._mouse_buttons[index]:
+            self._mouse_buttons[index] = True
+            self._mouse_buttons_pressed[index] = True
+            self._version += 1
+
+    def _handle_mouse_up(self, event, new_events):
+        index = event.mouse_button.value
+        if self._mouse_buttons[index]:
+            self._mouse_buttons[index] = False
+            self._mouse_buttons_released[index] = True
+            self._version += 1
+
+    def _handle_mouse_move(self, event, new_events):
+        self.mouse_position = event.mouse_position
+
+    # Controller buttons
+    def _handle_controller_button_down(self, event, new_events):
+        controller = self.controllers.get(event.controller_id)
+        if controller is not None:
+            controller.update_button(button=event.controller_button, pressed=True)
+        else:
+            new_events.extend(self.missing_controller_process(event=event))
+
+    def _handle_controller_button_up(self, event, new_events):
+        controller = self.controllers.get(event.controller_id)
+        if controller is not None:
+            controller.update_button(button=event.controller_button, pressed=False)
+        else:
+            new_events.extend(self.missing_controller_process(event=event))
+
+    # Controller axes
+    def _handle_controller_axis_move(self, event, new_events):
+        controller = self.controllers.get(event.controller_id)
+        if controller is not None:
+            if abs(controller.get_axis(axis=event.axis) - event.axis_value) < self.controller_event_tolerance:
+                return False
+            controller.update_axis(axis=event.axis, value=event.axis_value)
+        else:
+            new_events.extend(self.missing_controller_process(event=event))
+
+    def _handle_controller_added(self, event, new_events):
+        self.controllers[event.controller_id] = Controller(controller_id=event.controller_id)
+
+    def _handle_controller_removed(self, event, new_events):
+        self.controllers.pop(event.controller_id, None)
+
+    # Window
+    def _handle_quit(self, event, new_events):
+        self.quit = True
+
+    def _handle_window_move(self, event, new_events):
+        self.window["position"] = event.window_position
+
+    def _handle_window_resize(self, event, new_events):
+        self.window["size"] = event.window_size
+
+    def _handle_window_access(self, event, new_events):
+        self.window["accessed"] = event.is_accessed
+
+    def _handle_window_activation(self, event, new_events):
+        self.window["active"] = event.is_active
+
     def missing_controller_process(self, event):
         """
         Handle events for controllers that have not yet been registered.
@@ -558,7 +1358,7 @@ class InputState(object):
         print(f"[WARNING] Catched Controller Event with missed Controller ID ({cid})")
         self.missed_controllers[cid] = self.missed_controllers.get(cid, 0) + 1
         if self.missed_controllers[cid] >= 3:
-            new_event_list = [Event(EventType.CONTROLLER_ADDED, controller_id=cid)]
+            new_event_list = [ControllerEvent(EventType.CONTROLLER_ADDED, controller_id=cid)]
             self.controllers[cid] = Controller(controller_id=cid)
             print(f"[INFO] Wind-Forge added Controller by itself -> window backend did not added the device.")
         return new_event_list
@@ -567,6 +1367,9 @@ class InputState(object):
         """
         Get all currently active input states.
 
+        The result is cached and only rebuilt if a key, mouse button
+        or controller changed since the last call -> treat it as read-only.
+
         Args:
             as_string (bool, optional): Whether to return identifiers as
                 human-readable strings (`.name`) instead of numeric values.
@@ -578,8 +1381,13 @@ class InputState(object):
                 - "mouse" (list): Active mouse buttons.
                 - "controllers" (dict): Active controller inputs per controller ID.
         """
-        active_keys = [key for key, pressed in self.keys.items() if pressed]
-        active_mouse_buttons = [btn for btn, pressed in self.mouse_buttons.items() if pressed]
+        version = (self._version, tuple((cid, controller.version) for cid, controller in self.controllers.items()))
+        cached = self._active_cache.get(as_string)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        active_keys = [KEYS_BY_VALUE[idx] for idx in self._keys.nonzero()[0].tolist()]
+        active_mouse_buttons = [MOUSE_BUTTONS_BY_VALUE[idx] for idx in self._mouse_buttons.nonzero()[0].tolist()]
 
         active_controllers = {}
         for cid, controller in self.controllers.items():
@@ -587,13 +1395,73 @@ class InputState(object):
             # if actives:
             active_controllers[cid] = actives
 
-        return {
-            "keys": list(map(lambda x: x.name, active_keys)) if as_string else active_keys,
-            "mouse": list(map(lambda x: x.name, active_mouse_buttons)) if as_string else active_mouse_buttons,
+        active = {
+            "keys": [key.name for key in active_keys] if as_string else active_keys,
+            "mouse": [button.name for button in active_mouse_buttons] if as_string else active_mouse_buttons,
             "controllers": active_controllers
         }
+        self._active_cache[as_string] = (version, active)
+        return active
+
+
+
+class ButtonStateView(MutableMapping):
+    """
+    Mapping view `button -> bool` on the key or mouse button array of an `InputState`.
+
+    Reads give the current state, writes go through
+    `InputState.set_button` (with press/release edges like an event).
+    Buttons can not be removed.
+
+    Args:
+        input_state (InputState): Input state to view.
+        button_enum (type[Key] | type[MouseButton]): Buttons of the view.
+    """
+    def __init__(self, input_state, button_enum):
+        self._input_state = input_state
+        self._button_enum = button_enum
+
+    def __getitem__(self, button):
+        if type(button) is not self._button_enum:
+            raise KeyError(button)
+        return self._input_state.is_down(button)
+
+    def __setitem__(self, button, down):
+        if type(button) is not self._button_enum:
+            raise KeyError(button)
+        self._input_state.set_button(button, down)
+
+    def __delitem__(self, button):
+        raise TypeError(f"Buttons can't be removed from {type(self).__name__}.")
+
+    def __iter__(self):
+        return iter(self._button_enum)
 
+    def __len__(self):
+        return len(self._button_enum)
 
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+def _button_property(button):
+    # attribute access (controller.A) as view on the button array
+    def getter(self):
+        return bool(self.buttons[button.value])
+
+    def setter(self, pressed):
+        self.update_button(button, pressed)
+
+    return property(getter, setter, doc=f"bool: Whether {button.name} is held.")
+
+def _axis_property(axis):
+    # attribute access (controller.LEFT_STICK_X) as view on the axis array
+    def getter(self):
+        return float(self.axes[axis.value])
+
+    def setter(self, value):
+        self.update_axis(axis, value)
+
+    return property(getter, setter, doc=f"float: Value of {axis.name}.")
 
 class Controller(object):
     """
@@ -603,57 +1471,65 @@ class Controller(object):
     It provides methods for querying and updating the state of the controller,
     including pressed buttons and active axes.
 
+    Buttons are stored in a bool array indexed by `ControllerButton` value
+    (`buttons`, state at the frame start in `previous_buttons`, presses and
+    releases of the current frame in `pressed_buttons`/`released_buttons`)
+    and axes in a float32
+    array indexed by `ControllerAxis` value (`axes`). The attributes
+    `A`, `B`, ..., `LEFT_STICK_X`, ... are views on these arrays.
+
     Args:
         controller_id (int): Unique identifier for the controller instance.
+        active_threshold (float, optional): Minimum axis magnitude to count
+            an axis as active in `get_active`. Default 0.1.
     """
-    def __init__(self, controller_id):
+    def __init__(self, controller_id, active_threshold=0.1):
         self.controller_id = controller_id
+        self.active_threshold = active_threshold
+        self._active_cache = {}
+
+        # bumped on every state change
+        self.version = 0
 
         # Press Buttons -> holded or not
-        self.A = False
-        self.B = False
-        self.X = False
-        self.Y = False
-        self.LB = False       # Left bumper
-        self.RB = False       # Right bumper
-        self.START = False
-        self.SELECT = False
-        self.LSTICK = False   # Left stick click
-        self.RSTICK = False   # Right stick click
-        self.DPAD = False
+        self.buttons = np.zeros(len(CONTROLLER_BUTTONS_BY_VALUE), dtype=bool)
+        self.previous_buttons = np.zeros_like(self.buttons)
+        self.pressed_buttons = np.zeros_like(self.buttons)
+        self.released_buttons = np.zeros_like(self.buttons)
         self.dpad_state = DpadState.NEUTRAL
 
         # Axis -> analog values
-        self.LEFT_STICK_X = 0.0
-        self.LEFT_STICK_Y = 0.0
-        self.RIGHT_STICK_X = 0.0
-        self.RIGHT_STICK_Y = 0.0
-        self.LEFT_TRIGGER = 0.0
-        self.RIGHT_TRIGGER = 0.0
-
-        # maps for lookup
-        self._button_map = {
-            ControllerButton.A: "A",
-            ControllerButton.B: "B",
-            ControllerButton.X: "X",
-            ControllerButton.Y: "Y",
-            ControllerButton.LB: "LB",
-            ControllerButton.RB: "RB",
-            ControllerButton.START: "START",
-            ControllerButton.SELECT: "SELECT",
-            ControllerButton.LSTICK: "LSTICK",
-            ControllerButton.RSTICK: "RSTICK",
-            ControllerButton.DPAD: "DPAD"
-        }
-
-        self._axis_map = {
-            ControllerAxis.LEFT_STICK_X: "LEFT_STICK_X",
-            ControllerAxis.LEFT_STICK_Y: "LEFT_STICK_Y",
-            ControllerAxis.RIGHT_STICK_X: "RIGHT_STICK_X",
-            ControllerAxis.RIGHT_STICK_Y: "RIGHT_STICK_Y",
-            ControllerAxis.LEFT_TRIGGER: "LEFT_TRIGGER",
-            ControllerAxis.RIGHT_TRIGGER: "RIGHT_TRIGGER"
-        }
+        self.axes = np.zeros(len(CONTROLLER_AXES_BY_VALUE), dtype=np.float32)
+
+    # Press Buttons -> views on self.buttons
+    A = _button_property(ControllerButton.A)
+    B = _button_property(ControllerButton.B)
+    X = _button_property(ControllerButton.X)
+    Y = _button_property(ControllerButton.Y)
+    LB = _button_property(ControllerButton.LB)          # Left bumper
+    RB = _button_property(ControllerButton.RB)          # Right bumper
+    START = _button_property(ControllerButton.START)
+    SELECT = _button_property(ControllerButton.SELECT)
+    LSTICK = _button_property(ControllerButton.LSTICK)  # Left stick click
+    RSTICK = _button_property(ControllerButton.RSTICK)  # Right stick click
+    DPAD = _button_property(ControllerButton.DPAD)
+
+    # Axis -> views on self.axes
+    LEFT_STICK_X = _axis_property(ControllerAxis.LEFT_STICK_X)
+    LEFT_STICK_Y = _axis_property(ControllerAxis.LEFT_STICK_Y)
+    RIGHT_STICK_X = _axis_property(ControllerAxis.RIGHT_STICK_X)
+    RIGHT_STICK_Y = _axis_property(ControllerAxis.RIGHT_STICK_Y)
+    LEFT_TRIGGER = _axis_property(ControllerAxis.LEFT_TRIGGER)
+    RIGHT_TRIGGER = _axis_property(ControllerAxis.RIGHT_TRIGGER)
+
+    def begin_frame(self):
+        """
+        Store the current button states as previous frame and forget the
+        presses and releases of the last frame.
+        """
+        np.copyto(self.previous_buttons, self.buttons)
+        self.pressed_buttons.fill(False)
+        self.released_buttons.fill(False)
 
     def get_button(self, button:ControllerButton):
         """
@@ -665,8 +1541,9 @@ class Controller(object):
         Returns:
             bool | None: True if pressed, False if not, None if unknown.
         """
-        attr = self._button_map.get(button)
-        return getattr(self, attr) if attr else None
+        if type(button) is not ControllerButton:
+            return None
+        return bool(self.buttons[button.value])
 
     def get_axis(self, axis:ControllerAxis):
         """
@@ -678,8 +1555,23 @@ class Controller(object):
         Returns:
             float | None: Axis value in range [-1.0, 1.0] or None if unknown.
         """
-        attr = self._axis_map.get(axis)
-        return getattr(self, attr) if attr else None
+        if type(axis) is not ControllerAxis:
+            return None
+        return float(self.axes[axis.value])
+
+    def get_axes(self, deadzone=None):
+        """
+        Get all axis values as array.
+
+        Args:
+            deadzone (float, optional): Apply this deadzone (see `apply_deadzone`).
+                Default: None -> raw values.
+
+        Returns:
+            np.ndarray: float32 array indexed by `ControllerAxis` value
+            (a copy if a deadzone is applied, else the internal array).
+        """
+        return apply_deadzone(self.axes, deadzone) if deadzone else self.axes
 
     def update_button(self, button, pressed: bool, dpad_state=None):
         """
@@ -690,12 +1582,17 @@ class Controller(object):
             pressed (bool): Whether the button is pressed.
             dpad_state (DpadState, optional): Update D-Pad state if provided.
         """
-        attr = self._button_map.get(button)
-        if attr:
-            setattr(self, attr, pressed)
+        if type(button) is ControllerButton:
+            index = button.value
+            pressed = bool(pressed)
+            if self.buttons[index] != pressed:
+                self.buttons[index] = pressed
+                (self.pressed_buttons if pressed else self.released_buttons)[index] = True
+            self.version += 1
 
         if dpad_state:
             self.dpad_state = dpad_state
+            self.version += 1
 
     def update_axis(self, axis, value: float):
         """
@@ -705,9 +1602,9 @@ class Controller(object):
             axis (ControllerAxis): The axis to update.
             value (float): The new axis value (-1.0 .. 1.0).
         """
-        attr = self._axis_map.get(axis)
-        if attr:
-            setattr(self, attr, value)
+        if type(axis) is ControllerAxis:
+            self.axes[axis.value] = value
+            self.version += 1
     
     def get_pressed_buttons(self):
         """
@@ -716,19 +1613,14 @@ class Controller(object):
         Returns:
             list[ControllerButton]: List of pressed buttons.
         """
-        return [btn for btn, pressed in {
-                                        ControllerButton.A: self.A, ControllerButton.B: self.B, 
-                                        ControllerButton.X: self.X, ControllerButton.Y: self.Y,
-                                        ControllerButton.LB: self.LB, ControllerButton.RB: self.RB,
-                                        ControllerButton.START: self.START, ControllerButton.SELECT: self.SELECT,
-                                        ControllerButton.LSTICK: self.LSTICK, ControllerButton.RSTICK: self.RSTICK,
-                                        ControllerButton.DPAD: self.DPAD
-                                        }.items() if pressed]
+        return [CONTROLLER_BUTTONS_BY_VALUE[idx] for idx in self.buttons.nonzero()[0].tolist()]
 
     def get_active(self, as_string=False):
         """
         Get all active inputs (buttons + axes).
 
+        The result is cached until the controller state changes -> treat it as read-only.
+
         Args:
             as_string (bool, optional): If True, return names as strings.
                 If False, return enum values. Default: False.
@@ -736,18 +1628,17 @@ class Controller(object):
         Returns:
             list[str | Enum]: Active buttons and axes.
         """
-        precision = 0.1
+        cached = self._active_cache.get(as_string)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+
         active = self.get_pressed_buttons()
-        active += [axis_name for axis_name, active in {
-                                                        ControllerAxis.LEFT_STICK_X: -precision > self.LEFT_STICK_X or self.LEFT_STICK_X > precision,
-                                                        ControllerAxis.LEFT_STICK_Y: -precision > self.LEFT_STICK_Y or self.LEFT_STICK_Y > precision,
-                                                        ControllerAxis.RIGHT_STICK_X: -precision > self.RIGHT_STICK_X or self.RIGHT_STICK_X > precision,
-                                                        ControllerAxis.RIGHT_STICK_Y: -precision > self.RIGHT_STICK_Y or self.RIGHT_STICK_Y > precision,
-                                                        ControllerAxis.LEFT_TRIGGER: self.LEFT_TRIGGER > precision,
-                                                        ControllerAxis.RIGHT_TRIGGER: self.RIGHT_TRIGGER > precision,
-                                                      }.items() if active] 
-        return list(map(lambda x: x.name, active)) if as_string else active
-        
+        active += [CONTROLLER_AXES_BY_VALUE[idx]
+                   for idx in (np.abs(self.axes) > self.active_threshold).nonzero()[0].tolist()]
+        if as_string:
+            active = [input_.name for input_ in active]
+        self._active_cache[as_string] = (self.version, active)
+        return active
 
     def get_dpad_state(self):
         """
@@ -775,8 +1666,16 @@ class Window(object):
         depth_buffer (int, optional): Depth buffer size in bits. Default 24.
         gl_version (tuple[int, int], optional): OpenGL version (major, minor). Default None.
         post_process (list, optional): List of post-processing effects. Default [].
-        background_lib (WindowLib, optional): Backend to use (PYGAME or GLFW). Default PYGAME.
+        background_lib (WindowLib, optional): Backend to use (PYGAME, GLFW or HEADLESS). Default PYGAME.
         print_missed_events (bool, optional): Print debug messages for missed events. Default False.
+        event_source (iterable | callable, optional): Event source of the HEADLESS
+            backend (see `HeadlessBackend`). Default None.
+        coalesce_motion (bool, optional): Merge mouse moves and collapse axis events
+            per frame (see `coalesce_motion_events`). Default False.
+        input_poll_rate (float, optional): Sample the controllers in a background thread
+            with this rate (samples per second) -> timestamped events, no changes lost
+            between frames. Experimental, only supported by the GLFW backend
+            (see `GlfwBackend`). Default None.
 
     Raises:
         Exception: If the requested backend is not loaded.
@@ -792,11 +1691,23 @@ class Window(object):
                 gl_version=None, 
                 post_process=[],
                 background_lib=WindowLib.PYGAME,
-                print_missed_events=False):
+                print_missed_events=False,
+                event_source=None,
+                coalesce_motion=False,
+                input_poll_rate=None):
         self.background_lib = background_lib
+        self.coalesce_motion = coalesce_motion
+        # windforge.recording.InputRecorder -> records the backend events
+        self.recorder = None
+        # windforge.profiler.Profiler -> records the buffer swap as zone "display"
+        self.profiler = None
+        # windforge.time.LatencyTracker -> input latency from event timestamp to buffer swap
+        self.latency_tracker = None
+        # windforge.gl.state.RenderState -> frame of its issued/skipped GL call counters ends with the buffer swap
+        self.render_state = None
         
         if background_lib == WindowLib.PYGAME:
-            if not BACKEND_LOADED_PYGAME:
+            if not load_backend(WindowLib.PYGAME):
                 raise Exception("Pygame backend got not loaded but you tried to load it. Make sure you installed pygame.")
             self.backend = PygameBackend(size=size, resizable=resizable,
                                          title=title, 
@@ -805,16 +1716,29 @@ class Window(object):
                                          post_process=post_process, 
                                          print_missed_events=print_missed_events)
         elif background_lib == WindowLib.GLFW:
-            if not BACKEND_LOADED_GLFW:
+            if not load_backend(WindowLib.GLFW):
                 raise Exception("GLFW backend got not loaded but you tried to load it. Make sure you installed GLFW.")
             self.backend = GlfwBackend(size=size, resizable=resizable,
                                        title=title, 
                                        multisample=multisample, samples=samples, 
                                        depth_buffer=depth_buffer, gl_version=gl_version,
                                        post_process=post_process,
-                                       print_missed_events=print_missed_events)
+                                       print_missed_events=print_missed_events,
+                                       input_poll_rate=input_poll_rate)
+        elif background_lib == WindowLib.HEADLESS:
+            self.backend = HeadlessBackend(size=size, resizable=resizable,
+                                           title=title, 
+                                           multisample=multisample, samples=samples, 
+                                           depth_buffer=depth_buffer, gl_version=gl_version,
+                                           post_process=post_process,
+                                           print_missed_events=print_missed_events,
+                                           event_source=event_source)
         else:
             raise ValueError(f"Does not know '{background_lib}' as window backend.")
+
+        if input_poll_rate and background_lib != WindowLib.GLFW:
+            # pygame queues every joystick change itself (SDL event queue) -> nothing gets lost between frames
+            print(f"[WARNING] input_poll_rate is only supported by the GLFW backend, ignored for {background_lib.name}.")
         
         self.input_state = InputState(controller_event_tolerance=0.01,
                                       controllers=self.backend.get_controllers())
@@ -835,15 +1759,35 @@ class Window(object):
         Returns:
             list[Event]: A list of processed events.
         """
-        return self.input_state.update(self.backend.get_events())
+        events = self.backend.get_events()
+        if self.coalesce_motion:
+            events = coalesce_motion_events(events)
+        if self.recorder is not None:
+            self.recorder.record_events(events)
+        if self.latency_tracker is not None:
+            self.latency_tracker.consume(events)
+        return self.input_state.update(events)
 
     def display(self):
         """
         Swap the display buffers.
 
         Call this once per frame to present the rendered image.
+
+        Returns:
+            dict | None: Issued and skipped GL state calls of the frame
+                ("issued", "skipped") if a `render_state` is set, else None.
         """
-        self.backend.swap_buffers()
+        if self.profiler is not None:
+            with self.profiler.zone("display"):
+                self.backend.swap_buffers()
+        else:
+            self.backend.swap_buffers()
+        if self.latency_tracker is not None:
+            self.latency_tracker.presented()
+        if self.render_state is not None:
+            return self.render_state.end_frame()
+        return None
 
     def quit(self):
         """
@@ -967,6 +1911,7 @@ class PygameBackend(WindowBackend):
                          print_missed_events)
 
         # init pygame
+        load_backend(WindowLib.PYGAME)
         pygame.init()
 
         # use OpenGL cores
@@ -1005,103 +1950,172 @@ class PygameBackend(WindowBackend):
             self.controllers[controller_id] = controller
             print(f"[INFO] Initialized joystick {controller_id}: {controller.get_name()}")
 
+        # native event type -> handler
+        self._translation_table = self._build_translation_table()
+
+    def _build_translation_table(self):
+        """
+        Build the translation table of the native pygame events.
+
+        Maps every handled pygame event type to a handler `(event, append)`
+        which appends the translated events. The key/button/axis maps are
+        bound as `.get` lookups (one lookup per event, unknown codes give
+        None) and the trigger axes are marked in the axis lookup, so the
+        handlers do no further type or membership checks.
+
+        Returns:
+            dict[int, callable]: Native event type -> handler.
+        """
+        key_get = PYGAME_KEY_MAP.get
+        mouse_button_get = PYGAME_MOUSE_BUTTON_MAP.get
+        controller_button_get = PYGAME_CONTROLLER_BUTTON_MAP.get
+        dpad_get = PYGAME_CONTROLLER_DPAD_MAP.get
+        # native axis -> (axis, is trigger)
+        trigger_axes = (pygame.CONTROLLER_AXIS_TRIGGERLEFT, pygame.CONTROLLER_AXIS_TRIGGERRIGHT)
+        axis_get = {native_axis: (axis, native_axis in trigger_axes)
+                    for native_axis, axis in PYGAME_CONTROLLER_AXIS_MAP.items()}.get
+
+        # Window
+        def quit_event(event, append):
+            append(QuitEvent(EventType.QUIT))
+
+        def window_moved(event, append):
+            append(WindowEvent(EventType.WINDOW_MOVE, window_position=(event.x, event.y)))
+
+        def window_resized(event, append):
+            append(WindowEvent(EventType.WINDOW_RESIZE, window_size=(event.w, event.h)))
+
+        def window_accessed(event, append):
+            append(WindowEvent(EventType.WINDOW_ACCESS, is_accessed=event.gain))
+
+        def window_focus_gained(event, append):
+            append(WindowEvent(EventType.WINDOW_ACTIVATION, is_active=True))
+
+        def window_focus_lost(event, append):
+            append(WindowEvent(EventType.WINDOW_ACTIVATION, is_active=False))
+
+        # Keyboard
+        def key_down(event, append):
+            key = key_get(event.key)
+            if key is not None:
+                append(KeyEvent(EventType.KEY_DOWN, key=key))
+
+        def key_up(event, append):
+            key = key_get(event.key)
+            if key is not None:
+                append(KeyEvent(EventType.KEY_UP, key=key))
+
+        # Mouse
+        def mouse_button_down(event, append):
+            button = mouse_button_get(event.button)
+            if button is not None:
+                append(MouseEvent(EventType.MOUSE_DOWN, mouse_button=button, mouse_pos=event.pos))
+
+        def mouse_button_up(event, append):
+            button = mouse_button_get(event.button)
+            if button is not None:
+                append(MouseEvent(EventType.MOUSE_UP, mouse_button=button, mouse_pos=event.pos))
+
+        def mouse_motion(event, append):
+            append(MouseEvent(EventType.MOUSE_MOVE, mouse_pos=event.pos, mouse_rel=event.rel))
+
+        def mouse_wheel(event, append):
+            append(MouseWheelEvent(EventType.MOUSE_WHEEL, mouse_scroll=(event.x, event.y),
+                                   mouse_scroll_precise=(event.precise_x, event.precise_y)))
+
+        # Controller
+        def controller_added(event, append):
+            controller = pygame.joystick.Joystick(event.device_index)
+            controller.init()
+            self.controllers[event.device_index] = controller
+            print(f"[INFO] Joystick added: {controller.get_name()} (id={event.device_index})")
+            append(ControllerEvent(EventType.CONTROLLER_ADDED, controller_id=event.device_index))
+
+        def controller_removed(event, append):
+            print(f"Joystick removed: id={event.instance_id}")
+            del self.controllers[event.instance_id]
+
+        def controller_button_down(event, append):
+            button = controller_button_get(event.button)
+            if button is not None:
+                append(ControllerButtonEvent(EventType.CONTROLLER_BUTTON_DOWN,
+                                             controller_id=event.instance_id,
+                                             controller_button=button))
+
+        def controller_button_up(event, append):
+            button = controller_button_get(event.button)
+            if button is not None:
+                append(ControllerButtonEvent(EventType.CONTROLLER_BUTTON_UP,
+                                             controller_id=event.instance_id,
+                                             controller_button=button))
+
+        def controller_hat(event, append):
+            dpad_state = dpad_get(event.value)
+            if dpad_state is None:
+                return
+            event_type = EventType.CONTROLLER_BUTTON_UP if dpad_state == DpadState.NEUTRAL else EventType.CONTROLLER_BUTTON_DOWN
+            append(ControllerButtonEvent(event_type, controller_button=ControllerButton.DPAD,
+                                         controller_dpad=dpad_state, controller_id=event.instance_id))
+
+        def controller_axis(event, append):
+            mapped = axis_get(event.axis)
+            if mapped is None:
+                return
+            axis, is_trigger = mapped
+            value = event.value
+            # change value range from [-1.0, 1.0] to [0.0, 1.0]
+            if is_trigger:
+                value = max(0.0, (value + 1.0) / 2.0)
+            append(ControllerAxisEvent(EventType.CONTROLLER_AXIS_MOVE,
+                                       controller_id=event.instance_id,
+                                       axis=axis, axis_value=value))
+
+        return {
+            pygame.QUIT: quit_event,
+            pygame.WINDOWMOVED: window_moved,
+            pygame.VIDEORESIZE: window_resized,
+            pygame.ACTIVEEVENT: window_accessed,  # pygame.WINDOWENTER/WINDOWLEAVE
+            pygame.WINDOWFOCUSGAINED: window_focus_gained,
+            pygame.WINDOWFOCUSLOST: window_focus_lost,
+            pygame.KEYDOWN: key_down,
+            pygame.KEYUP: key_up,
+            pygame.MOUSEBUTTONDOWN: mouse_button_down,
+            pygame.MOUSEBUTTONUP: mouse_button_up,
+            pygame.MOUSEMOTION: mouse_motion,
+            pygame.MOUSEWHEEL: mouse_wheel,
+            pygame.JOYDEVICEADDED: controller_added,
+            pygame.JOYDEVICEREMOVED: controller_removed,
+            pygame.JOYBUTTONDOWN: controller_button_down,  # pygame.CONTROLLERBUTTONDOWN
+            pygame.JOYBUTTONUP: controller_button_up,  # pygame.CONTROLLERBUTTONUP
+            pygame.JOYHATMOTION: controller_hat,
+            pygame.JOYAXISMOTION: controller_axis,  # pygame.CONTROLLERAXISMOTION
+        }
+
     def get_events(self):
         """
         Poll and translate pygame events into the unified Event API.
 
+        Every event is translated by one lookup in the translation
+        table (see `_build_translation_table`) and gets the poll time
+        as `timestamp`.
+
         Returns:
             list[Event]: A list of normalized Event objects generated
             from pygame's event system.
         """
         events = []
-        for event in pygame.event.get():
-            # print(f"Event detected: {event}")
-            # Window
-            if event.type == pygame.QUIT:
-                events += [Event(event_type=EventType.QUIT)]
-            elif event.type == pygame.WINDOWMOVED:
-                events += [Event(event_type=EventType.WINDOW_MOVE,
-                                 window_position=(event.x, event.y))]
-            elif event.type == pygame.VIDEORESIZE:
-                events += [Event(event_type=EventType.WINDOW_RESIZE,
-                                 window_size=(event.w, event.h))]
-            elif event.type == pygame.ACTIVEEVENT:  # pygame.WINDOWENTER:
-                events += [Event(event_type=EventType.WINDOW_ACCESS,
-                                 is_accessed=event.gain)]
-            # elif event.type == pygame.WINDOWLEAVE:
-            #     events += [Event(event_type=EventType.WINDOW_ACCESS,
-            #                      is_accessed=False)]
-            elif event.type == pygame.WINDOWFOCUSGAINED:
-                events += [Event(event_type=EventType.WINDOW_ACTIVATION,
-                                 is_active=True)]
-            elif event.type == pygame.WINDOWFOCUSLOST:
-                events += [Event(event_type=EventType.WINDOW_ACTIVATION,
-                                 is_active=False)]
-                
-            # Keyboard
-            elif event.type == pygame.KEYDOWN:
-                if event.key in PYGAME_KEY_MAP:
-                    events += [Event(EventType.KEY_DOWN, key=PYGAME_KEY_MAP[event.key])]
-            elif event.type == pygame.KEYUP:
-                if event.key in PYGAME_KEY_MAP:
-                    events += [Event(EventType.KEY_UP, key=PYGAME_KEY_MAP[event.key])]
-
-            # Mouse
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button in PYGAME_MOUSE_BUTTON_MAP:
-                    events += [Event(EventType.MOUSE_DOWN, mouse_button=PYGAME_MOUSE_BUTTON_MAP[event.button], mouse_pos=event.pos)]
-            elif event.type == pygame.MOUSEBUTTONUP:
-                if event.button in PYGAME_MOUSE_BUTTON_MAP:
-                    events += [Event(EventType.MOUSE_UP, mouse_button=PYGAME_MOUSE_BUTTON_MAP[event.button], mouse_pos=event.pos)]
-            elif event.type == pygame.MOUSEMOTION:
-                events += [Event(EventType.MOUSE_MOVE, mouse_pos=event.pos)]
-            elif event.type == pygame.MOUSEWHEEL:
-                events += [Event(EventType.MOUSE_WHEEL, mouse_scroll=(event.x, event.y), mouse_scroll_precise=(event.precise_x, event.precise_y))]
-
-            # Controller
-            elif event.type == pygame.JOYDEVICEADDED:
-                controller = pygame.joystick.Joystick(event.device_index)
-                controller.init()
-                self.controllers[event.device_index] = controller
-                print(f"[INFO] Joystick added: {controller.get_name()} (id={event.device_index})")
-                events += [Event(EventType.CONTROLLER_ADDED, controller_id=event.device_index)]
-            elif event.type == pygame.JOYDEVICEREMOVED:
-                print(f"Joystick removed: id={event.instance_id}")
-                del self.controllers[event.instance_id]
-            elif event.type == pygame.JOYBUTTONDOWN:  #pygame.CONTROLLERBUTTONDOWN:
-                if event.button in PYGAME_CONTROLLER_BUTTON_MAP:
-                    events += [Event(EventType.CONTROLLER_BUTTON_DOWN,
-                                     controller_id=event.instance_id,
-                                     controller_button=PYGAME_CONTROLLER_BUTTON_MAP[event.button])]
-            elif event.type == pygame.JOYBUTTONUP: #  pygame.CONTROLLERBUTTONUP:
-                if event.button in PYGAME_CONTROLLER_BUTTON_MAP:
-                    events += [Event(EventType.CONTROLLER_BUTTON_UP,
-                                     controller_id=event.instance_id,
-                                     controller_button=PYGAME_CONTROLLER_BUTTON_MAP[event.button])]
-            elif event.type == pygame.JOYHATMOTION:
-                dpad_state = PYGAME_CONTROLLER_DPAD_MAP[event.value]
-                if dpad_state == DpadState.NEUTRAL:
-                    events += [Event(EventType.CONTROLLER_BUTTON_UP, controller_button=ControllerButton.DPAD,
-                                    controller_dpad=dpad_state, controller_id=event.instance_id)]
-                else:
-                    events += [Event(EventType.CONTROLLER_BUTTON_DOWN, controller_button=ControllerButton.DPAD,
-                                    controller_dpad=dpad_state, controller_id=event.instance_id)]
-            elif event.type == pygame.JOYAXISMOTION: # pygame.CONTROLLERAXISMOTION:
-                if event.axis in PYGAME_CONTROLLER_AXIS_MAP:
-                    value = event.value
-                    # change value range from [-1.0, 1.0] to [0.0, 1.0]
-                    if event.axis in [pygame.CONTROLLER_AXIS_TRIGGERLEFT,
-                                      pygame.CONTROLLER_AXIS_TRIGGERRIGHT]:
-                        value = max(0.0, (value + 1.0) / 2.0)
-                    events += [Event(EventType.CONTROLLER_AXIS_MOVE,
-                                     controller_id=event.instance_id,
-                                     axis=PYGAME_CONTROLLER_AXIS_MAP[event.axis],
-                                     axis_value=value)]
-                    
-            # other
-            else:
-                if self.print_missed_events:
-                    print(f"[INFO] Event skipped: {event}")
+        append = events.append
+        handler_get = self._translation_table.get
+        native_events = pygame.event.get()
+        timestamp = perf_counter_ns()
+        for event in native_events:
+            handler = handler_get(event.type)
+            if handler is not None:
+                handler(event, append)
+            elif self.print_missed_events:
+                print(f"[INFO] Event skipped: {event}")
+        for event in events:
+            event.timestamp = timestamp
         return events
     
     def get_controllers(self):
@@ -1153,6 +2167,12 @@ class GlfwBackend(WindowBackend):
         gl_version (str or None): OpenGL version string (e.g., "3.3").
         post_process (list): Post-processing pipeline (optional).
         print_missed_events (bool): Whether to print unhandled events for debugging.
+        input_poll_rate (float, optional): Poll the joysticks in an `InputPollingThread`
+            with this rate (samples per second) instead of once per frame. The controller
+            events then carry `timestamp`. Default None (poll in `get_events`).
+            Experimental: GLFW documents its joystick functions as main thread only.
+            The backend serializes the thread's reads and `glfw.poll_events` with
+            `_glfw_lock`, which GLFW itself does not guarantee to be enough.
 
     Raises:
         RuntimeError: If GLFW initialization fails.
@@ -1165,10 +2185,11 @@ class GlfwBackend(WindowBackend):
         quit(): Destroy the window and terminate GLFW.
     """
     def __init__(self, size, resizable, title, multisample, samples, depth_buffer, gl_version, post_process,
-                 print_missed_events):
+                 print_missed_events, input_poll_rate=None):
         super().__init__(size, resizable, title, multisample, samples, depth_buffer, gl_version, post_process,
                          print_missed_events)
 
+        load_backend(WindowLib.GLFW)
         if not glfw.init():
             raise RuntimeError("Failed to init GLFW")
 
@@ -1192,223 +2213,295 @@ class GlfwBackend(WindowBackend):
             raise Exception("GLFW window creation failed")
         glfw.make_context_current(self.screen)
 
-        # event queue for callbacks
-        self._raw_event_queue = []
-        # store previous joystick state: { cid: {"axes": tuple, "buttons": tuple, "hats": tuple } }
+        # event queue for callbacks -> raw records (kind, *GLFW values)
+        self._raw_event_queue = deque()
+        # last cursor position -> relative mouse movement
+        self._cursor_pos = None
+        # store previous joystick state: { cid: {"axes": np.ndarray, "buttons": np.ndarray, "hats": np.ndarray } }
         self._joystick_prev = {}
+        # connected joystick ids -> only changed by the reader of the joysticks (`_poll_joysticks`)
+        self._joysticks_present = set()
+        # (joystick id, connected) of the joystick callback (main thread) -> applied by `_poll_joysticks`,
+        # which may run in the input polling thread (`deque` append/popleft are atomic)
+        self._joystick_changes = deque()
+        # held around glfw.poll_events and the joystick reads -> the polling thread
+        # never reads a joystick while poll_events handles a (dis)connect
+        self._glfw_lock = threading.Lock()
+
+        # set callbacks to capture GLFW events
+        glfw.set_key_callback(self.screen, self._key_cb)
+        glfw.set_mouse_button_callback(self.screen, self._mouse_button_cb)
+        glfw.set_cursor_pos_callback(self.screen, self._cursor_pos_cb)
+        glfw.set_scroll_callback(self.screen, self._scroll_cb)
+        glfw.set_window_size_callback(self.screen, self._window_size_cb)
+        glfw.set_window_pos_callback(self.screen, self._window_pos_cb)
+        glfw.set_window_focus_callback(self.screen, self._window_focus_cb)
+
+        def _joystick_cb(joystick_id, event):
+            # called during glfw.poll_events()
+            if event == glfw.CONNECTED:
+                self._joystick_changes.append((joystick_id, True))
+            elif event == glfw.DISCONNECTED:
+                self._joystick_changes.append((joystick_id, False))
+
+        glfw.set_joystick_callback(_joystick_cb)
 
-        # register callbacks to capture GLFW events
-        def _key_cb(window, key, scancode, action, mods):
-            # action: glfw.PRESS, glfw.RELEASE, glfw.REPEAT
-            self._raw_event_queue += [("key", {"key": key, "action": action, "mods": mods})]
-
-        def _mouse_button_cb(window, button, action, mods):
-            # button: glfw.MOUSE_BUTTON_LEFT etc.
-            # action: glfw.PRESS / glfw.RELEASE
-            x, y = glfw.get_cursor_pos(self.screen)
-            self._raw_event_queue += [("mouse_button", {"button": button, "action": action, 
-                                                        "pos": (int(x), int(y)), "mods": mods})]
-
-        def _cursor_pos_cb(window, xpos, ypos):
-            self._raw_event_queue += [("cursor_pos", {"pos": (int(xpos), int(ypos))})]
-
-        def _scroll_cb(window, xoffset, yoffset):
-            # store precise offsets too
-            self._raw_event_queue += [("scroll", {"x": xoffset, "y": yoffset})]
+        # initialize joystick prev states for currently connected devices
+        # -> afterwards only the callback updates the present joysticks
+        for cid in range(glfw.JOYSTICK_1, glfw.JOYSTICK_LAST + 1):
+            if glfw.joystick_present(cid):
+                self._joysticks_present.add(cid)
+                self._joystick_prev[cid] = self._read_joystick(cid)
+
+        # optional joystick sampling between frames -> afterwards only the thread reads the joysticks
+        self.input_thread = None
+        if input_poll_rate:
+            self.input_thread = InputPollingThread(poll=self._poll_joysticks, rate=input_poll_rate)
+            self.input_thread.start()
+
+    # callbacks -> store the raw GLFW values, translation happens in get_events
+    def _key_cb(self, window, key, scancode, action, mods):
+        # action: glfw.PRESS, glfw.RELEASE, glfw.REPEAT
+        self._raw_event_queue.append((RAW_KEY, key, action))
+
+    def _mouse_button_cb(self, window, button, action, mods):
+        # button: glfw.MOUSE_BUTTON_LEFT etc.
+        # action: glfw.PRESS / glfw.RELEASE
+        x, y = glfw.get_cursor_pos(self.screen)
+        self._raw_event_queue.append((RAW_MOUSE_BUTTON, button, action, x, y))
+
+    def _cursor_pos_cb(self, window, xpos, ypos):
+        self._raw_event_queue.append((RAW_CURSOR_POS, xpos, ypos))
+
+    def _scroll_cb(self, window, xoffset, yoffset):
+        self._raw_event_queue.append((RAW_SCROLL, xoffset, yoffset))
+
+    def _window_size_cb(self, window, width, height):
+        self._raw_event_queue.append((RAW_WINDOW_SIZE, width, height))
+
+    def _window_pos_cb(self, window, xpos, ypos):
+        self._raw_event_queue.append((RAW_WINDOW_POS, xpos, ypos))
+
+    def _window_focus_cb(self, window, focused):
+        # focused == 1/True => gained, 0/False => lost
+        self._raw_event_queue.append((RAW_WINDOW_FOCUS, focused))
+
+    @staticmethod
+    def _read_joystick_array(getter, cid, dtype):
+        # GLFW returns (pointer, count) -> copy into an own array
+        pointer, count = getter(cid)
+        if not count or not pointer:
+            return np.zeros(0, dtype=dtype)
+        return np.ctypeslib.as_array(pointer, shape=(count,)).astype(dtype)
+
+    def _read_joystick(self, cid):
+        """
+        Read the current state of a joystick.
 
-        def _window_size_cb(window, width, height):
-            self._raw_event_queue += [("window_resize", {"size": (width, height)})]
+        Args:
+            cid (int): GLFW joystick id.
 
-        def _window_pos_cb(window, xpos, ypos):
-            self._raw_event_queue += [("window_move", {"pos": (xpos, ypos)})]
+        Returns:
+            dict[str, np.ndarray]: "axes" (float32), "buttons" (uint8) and "hats" (uint8).
+        """
+        return {
+            "axes": self._read_joystick_array(glfw.get_joystick_axes, cid, np.float32),
+            "buttons": self._read_joystick_array(glfw.get_joystick_buttons, cid, np.uint8),
+            "hats": self._read_joystick_array(glfw.get_joystick_hats, cid, np.uint8)
+        }
 
-        def _window_focus_cb(window, focused):
-            # focused == 1/True => gained, 0/False => lost
-            self._raw_event_queue += [("window_focus", {"focused": bool(focused)})]
+    @staticmethod
+    def _changed_indices(prev, cur):
+        """
+        Get the indices where two state arrays differ.
 
-        # set callbacks
-        glfw.set_key_callback(self.screen, _key_cb)
-        glfw.set_mouse_button_callback(self.screen, _mouse_button_cb)
-        glfw.set_cursor_pos_callback(self.screen, _cursor_pos_cb)
-        glfw.set_scroll_callback(self.screen, _scroll_cb)
-        glfw.set_window_size_callback(self.screen, _window_size_cb)
-        glfw.set_window_pos_callback(self.screen, _window_pos_cb)
-        glfw.set_window_focus_callback(self.screen, _window_focus_cb)
+        Arrays of different length are compared as if the shorter one
+        was padded with zeros.
 
-        # initialize joystick prev states for currently connected devices
-        for cid in range(glfw.JOYSTICK_1, glfw.JOYSTICK_LAST + 1):
-            if glfw.joystick_present(cid):
-                axes = glfw.get_joystick_axes(cid) or ()
-                buttons = glfw.get_joystick_buttons(cid) or ()
-                hats = glfw.get_joystick_hats(cid) or ()
-                self._joystick_prev[cid] = {
-                    "axes": tuple(axes),
-                    "buttons": tuple(buttons),
-                    "hats": tuple(hats)
-                }
+        Returns:
+            tuple[np.ndarray, list[int]]: Padded current array and the changed indices.
+        """
+        if prev.shape != cur.shape:
+            size = max(len(prev), len(cur))
+            prev = np.pad(prev, (0, size - len(prev)))
+            cur = np.pad(cur, (0, size - len(cur)))
+        return cur, np.nonzero(prev != cur)[0].tolist()
 
     def get_events(self):
         """
         Poll GLFW events and process queued callbacks.
 
+        The events get the poll time as `timestamp` (the callbacks are
+        called during `glfw.poll_events`).
+
         Returns:
             list[Event]: A list of normalized Event objects generated
             from GLFW input and window events.
         """
         events = []
 
-        glfw.poll_events()
+        with self._glfw_lock:
+            glfw.poll_events()
+        timestamp = perf_counter_ns()
 
         if self.screen and glfw.window_should_close(self.screen):
-            events += [Event(EventType.QUIT)]
+            events += [QuitEvent(EventType.QUIT)]
 
         # convert raw queued callbacks first
-        while self._raw_event_queue:
-            ev_type, ev = self._raw_event_queue.pop(0)
-            # Keyboard -> map GLFW key to your Key enum via GLFW_KEY_MAP
-            if ev_type == "key":
-                k = ev["key"]
-                action = ev["action"]
-                if action == glfw.PRESS:
-                    if k in GLFW_KEY_MAP:
-                        events.append(Event(EventType.KEY_DOWN, key=GLFW_KEY_MAP[k]))
-                elif action == glfw.RELEASE:
-                    if k in GLFW_KEY_MAP:
-                        events.append(Event(EventType.KEY_UP, key=GLFW_KEY_MAP[k]))
-                # ignore REPEAT for now (or treat as KEY_DOWN depending on your needs)
-
-            # Mouse button
-            elif ev_type == "mouse_button":
-                btn = ev["button"]
-                action = ev["action"]
-                pos = ev["pos"]
-                if action == glfw.PRESS:
-                    if btn in GLFW_MOUSE_BUTTON_MAP:
-                        events.append(Event(EventType.MOUSE_DOWN, mouse_button=GLFW_MOUSE_BUTTON_MAP[btn], mouse_pos=pos))
-                elif action == glfw.RELEASE:
-                    if btn in GLFW_MOUSE_BUTTON_MAP:
-                        events.append(Event(EventType.MOUSE_UP, mouse_button=GLFW_MOUSE_BUTTON_MAP[btn], mouse_pos=pos))
-
-            # Cursor movement
-            elif ev_type == "cursor_pos":
-                events.append(Event(EventType.MOUSE_MOVE, mouse_pos=ev["pos"]))
-
-            # Scroll / wheel
-            elif ev_type == "scroll":
-                # you might want to provide both integer and precise values: GLFW gives float offsets
-                events.append(Event(EventType.MOUSE_WHEEL,
-                                    mouse_scroll=(int(ev["x"]), int(ev["y"])),
-                                    mouse_scroll_precise=(ev["x"], ev["y"])))
+        self._drain_raw_events(events)
 
-            # Window events
-            elif ev_type == "window_resize":
-                events.append(Event(EventType.WINDOW_RESIZE, window_size=ev["size"]))
-            elif ev_type == "window_move":
-                events.append(Event(EventType.WINDOW_MOVE, window_position=ev["pos"]))
-            elif ev_type == "window_focus":
-                events.append(Event(EventType.WINDOW_ACTIVATION, is_active=ev["focused"]))
-
-        # Joystick / Gamepad polling
-        # iterate all possible controller ids and compare with previous snapshot
-        for cid in range(glfw.JOYSTICK_1, glfw.JOYSTICK_LAST + 1):
-            present = glfw.joystick_present(cid)
-            prev = self._joystick_prev.get(cid)
+        # Joystick / Gamepad
+        if self.input_thread is None:
+            self._poll_joysticks(events)
 
-            if present and prev is None:
-                # newly added
-                self._joystick_prev[cid] = {
-                    "axes": tuple(glfw.get_joystick_axes(cid) or ()),
-                    "buttons": tuple(glfw.get_joystick_buttons(cid) or ()),
-                    "hats": tuple(glfw.get_joystick_hats(cid) or ())
-                }
-                events.append(Event(EventType.CONTROLLER_ADDED, controller_id=cid))
-
-            elif not present and prev is not None:
-                # removed
-                del self._joystick_prev[cid]
-                events.append(Event(EventType.CONTROLLER_REMOVED, controller_id=cid))
-
-            elif present and prev is not None:
-                # still present -> compare axes/buttons/hats for changes
-                axes = tuple(glfw.get_joystick_axes(cid) or ())
-                buttons = tuple(glfw.get_joystick_buttons(cid) or ())
-                hats = tuple(glfw.get_joystick_hats(cid) or ())
-
-                # Buttons (digital)
-                # compare length carefully
-                max_buttons = max(len(prev["buttons"]), len(buttons))
-                for i in range(max_buttons):
-                    prev_b = prev["buttons"][i] if i < len(prev["buttons"]) else 0
-                    cur_b = buttons[i] if i < len(buttons) else 0
-                    if prev_b != cur_b:
-                        # map raw button index i to ControllerButton via GLFW_CONTROLLER_BUTTON_MAP if available
-                        if i in GLFW_CONTROLLER_BUTTON_MAP:
-                            mapped = GLFW_CONTROLLER_BUTTON_MAP[i]
-                            if cur_b:  # pressed
-                                events.append(Event(EventType.CONTROLLER_BUTTON_DOWN,
-                                                    controller_id=cid,
-                                                    controller_button=mapped))
-                            else:      # released
-                                events.append(Event(EventType.CONTROLLER_BUTTON_UP,
-                                                    controller_id=cid,
-                                                    controller_button=mapped))
-                        else:
-                            # unmapped: you might want to emit a raw event or ignore
-                            if self.print_missed_events:
-                                print(f"[INFO] Controller {cid} button {i} changed to {cur_b} (no mapping)")
-
-                # Axes (analog)
-                max_axes = max(len(prev["axes"]), len(axes))
-                for i in range(max_axes):
-                    prev_a = prev["axes"][i] if i < len(prev["axes"]) else 0.0
-                    cur_a = axes[i] if i < len(axes) else 0.0
-                    if type(cur_a) not in [int, float]:
-                        cur_a = cur_a[0]
-                    if prev_a != cur_a:
-                        # normalize triggers if axis index maps to triggers
-                        if i in GLFW_CONTROLLER_AXIS_MAP:
-                            mapped_axis = GLFW_CONTROLLER_AXIS_MAP[i]
-                            # handle triggers mapping (convert [-1,1] -> [0,1] for triggers)
-                            if mapped_axis in (ControllerAxis.LEFT_TRIGGER, ControllerAxis.RIGHT_TRIGGER):
-                                normalized = (cur_a + 1.0) / 2.0
-                            else:
-                                normalized = cur_a
-                            events.append(Event(EventType.CONTROLLER_AXIS_MOVE,
-                                                controller_id=cid,
-                                                axis=mapped_axis,
-                                                axis_value=normalized))
-                        else:
-                            if self.print_missed_events:
-                                print(f"[INFO] Joystick {cid} axis {i} changed to {cur_a} (no mapping)")
-
-                # DPAD (Hats)
-                max_hats = max(len(prev["hats"]), len(hats))
-                for i in range(max_hats):
-                    prev_h = prev["hats"][i] if i < len(prev["hats"]) else (0, 0)
-                    cur_h = hats[i] if i < len(hats) else (0, 0)
-                    dpad_state = GLFW_CONTROLLER_DPAD_MAP.get(cur_h[0] if type(cur_h) != int else cur_h, 
-                                                              DpadState.NEUTRAL)
-                    if prev_h != cur_h:
-                        if dpad_state == DpadState.NEUTRAL:
-                            events.append(Event(EventType.CONTROLLER_BUTTON_UP,
-                                                controller_id=cid,
-                                                controller_button=ControllerButton.DPAD,
-                                                controller_dpad=dpad_state))
-                        else:
-                            events.append(Event(EventType.CONTROLLER_BUTTON_DOWN,
-                                                controller_id=cid,
-                                                controller_button=ControllerButton.DPAD,
-                                                controller_dpad=dpad_state))
-
-                # update prev snapshot
-                self._joystick_prev[cid] = {"axes": tuple(axes), "buttons": tuple(buttons), "hats": tuple(hats)}
+        for event in events:
+            event.timestamp = timestamp
 
+        # sampled by the thread -> already stamped with their sampling time
+        if self.input_thread is not None:
+            self.input_thread.drain(events)
 
         # else:
         #     if self.print_missed_events:
         #         print(f"[Info] Event skipped: {event}")
         return events
+
+    def _poll_joysticks(self, events):
+        """
+        Read the present joysticks and create events for their changes.
+
+        Called by `get_events` or, with `input_poll_rate`, by the input polling thread.
+        Connects and disconnects arrive from the joystick callback over
+        `_joystick_changes`, so only this method touches the present
+        joysticks and their previous states.
+        Every joystick read holds `_glfw_lock` (also held by `get_events`
+        around `glfw.poll_events`).
+
+        Args:
+            events (list[Event]): List to append the events to.
+        """
+        # apply the connects/disconnects of the callback -> the present set and the
+        # previous states are only touched here (one thread)
+        changes = self._joystick_changes
+        while changes:
+            cid, connected = changes.popleft()
+            if connected:
+                self._joysticks_present.add(cid)
+            else:
+                self._joysticks_present.discard(cid)
+
+        # only present joysticks get read, events only for changed indices
+        for cid in list(self._joystick_prev.keys()):
+            if cid not in self._joysticks_present:
+                # removed
+                del self._joystick_prev[cid]
+                events.append(ControllerEvent(EventType.CONTROLLER_REMOVED, controller_id=cid))
+
+        for cid in self._joysticks_present:
+            prev = self._joystick_prev.get(cid)
+            with self._glfw_lock:
+                cur = self._read_joystick(cid)
+            self._joystick_prev[cid] = cur
+
+            if prev is None:
+                # newly added
+                events.append(ControllerEvent(EventType.CONTROLLER_ADDED, controller_id=cid))
+                continue
+
+            # Buttons (digital)
+            buttons, changed = self._changed_indices(prev["buttons"], cur["buttons"])
+            for i in changed:
+                # map raw button index i to ControllerButton via GLFW_CONTROLLER_BUTTON_MAP if available
+                mapped = GLFW_CONTROLLER_BUTTON_MAP.get(i)
+                if mapped is not None:
+                    events.append(ControllerButtonEvent(EventType.CONTROLLER_BUTTON_DOWN if buttons[i] else EventType.CONTROLLER_BUTTON_UP,
+                                                        controller_id=cid,
+                                                        controller_button=mapped))
+                elif self.print_missed_events:
+                    print(f"[INFO] Controller {cid} button {i} changed to {buttons[i]} (no mapping)")
+
+            # Axes (analog)
+            axes, changed = self._changed_indices(prev["axes"], cur["axes"])
+            for i in changed:
+                mapped_axis = GLFW_CONTROLLER_AXIS_MAP.get(i)
+                if mapped_axis is not None:
+                    value = float(axes[i])
+                    # handle triggers mapping (convert [-1,1] -> [0,1] for triggers)
+                    if mapped_axis in (ControllerAxis.LEFT_TRIGGER, ControllerAxis.RIGHT_TRIGGER):
+                        value = (value + 1.0) / 2.0
+                    events.append(ControllerAxisEvent(EventType.CONTROLLER_AXIS_MOVE,
+                                                      controller_id=cid,
+                                                      axis=mapped_axis,
+                                                      axis_value=value))
+                elif self.print_missed_events:
+                    print(f"[INFO] Joystick {cid} axis {i} changed to {axes[i]} (no mapping)")
+
+            # DPAD (Hats)
+            hats, changed = self._changed_indices(prev["hats"], cur["hats"])
+            for i in changed:
+                dpad_state = GLFW_CONTROLLER_DPAD_MAP.get(int(hats[i]), DpadState.NEUTRAL)
+                events.append(ControllerButtonEvent(EventType.CONTROLLER_BUTTON_UP if dpad_state == DpadState.NEUTRAL else EventType.CONTROLLER_BUTTON_DOWN,
+                                                    controller_id=cid,
+                                                    controller_button=ControllerButton.DPAD,
+                                                    controller_dpad=dpad_state))
     
+    def _drain_raw_events(self, events):
+        """
+        Translate all queued raw callback records into events.
+
+        Args:
+            events (list[Event]): List to append the translated events to.
+        """
+        queue = self._raw_event_queue
+        popleft = queue.popleft
+        append = events.append
+        while queue:
+            record = popleft()
+            kind = record[0]
+            # Cursor movement (most frequent)
+            if kind == RAW_CURSOR_POS:
+                pos = (int(record[1]), int(record[2]))
+                last_pos = self._cursor_pos or pos
+                self._cursor_pos = pos
+                append(MouseEvent(EventType.MOUSE_MOVE, mouse_pos=pos, mouse_rel=(pos[0] - last_pos[0], pos[1] - last_pos[1])))
+
+            # Keyboard -> map GLFW key to your Key enum via GLFW_KEY_MAP
+            elif kind == RAW_KEY:
+                _, k, action = record
+                key = GLFW_KEY_MAP.get(k)
+                if key is not None:
+                    if action == glfw.PRESS:
+                        append(KeyEvent(EventType.KEY_DOWN, key=key))
+                    elif action == glfw.RELEASE:
+                        append(KeyEvent(EventType.KEY_UP, key=key))
+                    # ignore REPEAT for now (or treat as KEY_DOWN depending on your needs)
+
+            # Mouse button
+            elif kind == RAW_MOUSE_BUTTON:
+                _, btn, action, x, y = record
+                button = GLFW_MOUSE_BUTTON_MAP.get(btn)
+                if button is not None:
+                    if action == glfw.PRESS:
+                        append(MouseEvent(EventType.MOUSE_DOWN, mouse_button=button, mouse_pos=(int(x), int(y))))
+                    elif action == glfw.RELEASE:
+                        append(MouseEvent(EventType.MOUSE_UP, mouse_button=button, mouse_pos=(int(x), int(y))))
+
+            # Scroll / wheel
+            elif kind == RAW_SCROLL:
+                # GLFW gives float offsets -> provide integer and precise values
+                _, x, y = record
+                append(MouseWheelEvent(EventType.MOUSE_WHEEL,
+                                       mouse_scroll=(int(x), int(y)),
+                                       mouse_scroll_precise=(x, y)))
+
+            # Window events
+            elif kind == RAW_WINDOW_SIZE:
+                append(WindowEvent(EventType.WINDOW_RESIZE, window_size=(record[1], record[2])))
+            elif kind == RAW_WINDOW_POS:
+                append(WindowEvent(EventType.WINDOW_MOVE, window_position=(record[1], record[2])))
+            elif kind == RAW_WINDOW_FOCUS:
+                append(WindowEvent(EventType.WINDOW_ACTIVATION, is_active=bool(record[1])))
+
     def get_controllers(self):
         """
         Retrieve currently connected controllers.
@@ -1439,6 +2532,107 @@ class GlfwBackend(WindowBackend):
         This should be called before program termination to ensure
         GLFW cleans up properly.
         """
+        if self.input_thread is not None:
+            self.input_thread.stop()
+
+
+
+class HeadlessBackend(WindowBackend):
+    """
+    Window-less implementation of the WindowBackend interface.
+
+    Creates no window and no OpenGL context. Events come from a
+    scripted or recorded event source, `swap_buffers` does nothing.
+    This allows running the main loop, `InputState`, `Clock` and `Timer`
+    without display, for example in CI, benchmarks or simulation servers
+    (use `goal_fps=None` to run at full speed).
+
+    Args:
+        size (tuple[int, int]): Window size as (width, height).
+        resizable (bool): Whether the window can be resized (ignored).
+        title (str): Title of the window (ignored).
+        multisample (bool): Enable multisample anti-aliasing (ignored).
+        samples (int): Number of samples for multisampling (ignored).
+        depth_buffer (int): Depth buffer size in bits (ignored).
+        gl_version (str or None): OpenGL version string (ignored).
+        post_process (list): Post-processing pipeline (ignored).
+        print_missed_events (bool): Whether to print unhandled events for debugging.
+        event_source (iterable | callable, optional): Source of the events:
+            - None: no events at all.
+            - iterable: yields one list of events per frame.
+            - callable: called with the frame index, returns the list of events of that frame.
+            Events without `timestamp` get the delivery time, set timestamps are kept
+            (to simulate when the input arrived).
+        quit_when_exhausted (bool, optional): Emit a QUIT event when an iterable
+            source has no frames left. Default True.
+
+    Methods:
+        get_events(): Return the events of the next frame from the event source.
+        get_controllers(): Return an empty dictionary (controllers get added by events).
+        swap_buffers(): Count the presented frames.
+        quit(): Do nothing.
+    """
+    def __init__(self, size, resizable, title, multisample, samples, depth_buffer, gl_version, post_process,
+                 print_missed_events, event_source=None, quit_when_exhausted=True):
+        super().__init__(size, resizable, title, multisample, samples, depth_buffer, gl_version, post_process,
+                         print_missed_events)
+        self.quit_when_exhausted = quit_when_exhausted
+        self.frame = 0
+        self.swapped_frames = 0
+        self.screen = None
+
+        if event_source is None:
+            self._source = None
+        elif callable(event_source):
+            self._source = (event_source(frame) for frame in itertools.count())
+        else:
+            self._source = iter(event_source)
+
+    def get_events(self):
+        """
+        Return the events of the next frame from the event source.
+
+        Returns:
+            list[Event]: Events of this frame (a QUIT event once an
+            exhausted source is reached and `quit_when_exhausted` is True).
+        """
+        self.frame += 1
+        if self._source is None:
+            return []
+        try:
+            events = list(next(self._source))
+        except StopIteration:
+            self._source = None
+            if self.quit_when_exhausted:
+                return [QuitEvent(EventType.QUIT)]
+            return []
+        # delivered now -> input latency from here (scripted sources may set an own arrival time)
+        timestamp = perf_counter_ns()
+        for event in events:
+            if event.timestamp is None:
+                event.timestamp = timestamp
+        return events
+
+    def get_controllers(self):
+        """
+        Retrieve the currently connected controllers.
+
+        Returns:
+            dict[int, Controller]: Always empty, controllers get added
+            by CONTROLLER_ADDED events of the event source.
+        """
+        return {}
+
+    def swap_buffers(self):
+        """
+        Count the presented frame (there is nothing to display).
+        """
+        self.swapped_frames += 1
+
+    def quit(self):
+        """
+        Nothing to release.
+        """
         pass
 
 